@@ -0,0 +1,97 @@
+"""Нагрузочный тест пула соединений клиента: своя сессия на ApiClient против общей."""
+
+import argparse
+import asyncio
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import aiohttp
+from aiohttp.test_utils import TestServer
+
+# Добавляем пути к генератору и серверу для импорта codegen и app.*
+# (server/ первым: в client/ тоже есть пакет app)
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "client"))
+sys.path.insert(0, str(project_root / "server"))
+
+from app import main as server_main  # noqa: E402
+from codegen import generate  # noqa: E402
+
+
+def connection_counter():
+    """TraceConfig, считающий новые и повторно использованные соединения."""
+    counts = {"created": 0, "reused": 0}
+
+    async def on_create(session, context, params):
+        counts["created"] += 1
+
+    async def on_reuse(session, context, params):
+        counts["reused"] += 1
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_connection_create_end.append(on_create)
+    trace_config.on_connection_reuseconn.append(on_reuse)
+    return trace_config, counts
+
+
+async def run(client, base_url: str, share: bool, clients: int, requests: int, concurrency: int):
+    """Прогоняет clients клиентов по requests запросов в concurrency воркерах."""
+    trace_config, counts = connection_counter()
+    configuration = client.Configuration(
+        host=base_url, share_session=share, trace_configs=[trace_config]
+    )
+    remaining = iter(range(clients))
+
+    async def worker():
+        for _ in remaining:
+            async with client.ApiClient(configuration) as api_client:
+                health_api = client.HealthApi(api_client)
+                for _ in range(requests):
+                    await health_api.health_get()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    await client.close_shared_sessions()
+    return clients * requests / elapsed, counts
+
+
+async def main(clients: int, requests: int, concurrency: int) -> None:
+    """Поднимает приложение без БД и сравнивает режимы сессий клиента."""
+    output_dir = Path(tempfile.mkdtemp(prefix="openapi_client_"))
+    try:
+        generate(project_root / "openapi" / "openapi.yaml", output_dir)
+        sys.path.insert(0, str(output_dir))
+        import openapi_client
+
+        app = server_main.create_app()
+        app.on_startup.remove(server_main.init_db)
+        app.on_cleanup.remove(server_main.close_db)
+
+        async with TestServer(app) as server:
+            base_url = str(server.make_url("")).rstrip("/")
+            print(
+                f"{clients} клиентов по {requests} запросов, {concurrency} параллельно "
+                f"({clients * requests} запросов)"
+            )
+            print("-" * 62)
+            print(f"{'режим':<26} {'запросов/с':>12} {'новых соед.':>11} {'повторно':>10}")
+            for name, share in [("сессия на клиент", False), ("share_session=True", True)]:
+                rps, counts = await run(
+                    openapi_client, base_url, share, clients, requests, concurrency
+                )
+                print(f"{name:<26} {rps:>12.0f} {counts['created']:>11} {counts['reused']:>10}")
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.clients, args.requests, args.concurrency))
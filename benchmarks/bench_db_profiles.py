@@ -0,0 +1,45 @@
+"""Бенчмарк скорости записи SQLite для каждого профиля надежности."""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Добавляем путь к серверу для импорта app.*
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "server"))
+
+from app.database import DURABILITY_PROFILES, Database  # noqa: E402
+
+
+async def bench_profile(profile: str, writes: int) -> float:
+    """Выполняет writes последовательных create_task и возвращает число записей в секунду."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = Database(db_path=str(Path(tmp_dir) / "bench.db"), profile=profile)
+        await db.connect()
+        try:
+            start = time.perf_counter()
+            for i in range(writes):
+                await db.create_task(f"Задача {i}", "Описание", "pending")
+            elapsed = time.perf_counter() - start
+        finally:
+            await db.close()
+    return writes / elapsed
+
+
+async def main(writes: int) -> None:
+    """Запускает бенчмарк для всех профилей."""
+    print(f"Последовательные create_task, {writes} записей на профиль")
+    print("-" * 40)
+    for profile in DURABILITY_PROFILES:
+        rate = await bench_profile(profile, writes)
+        print(f"{profile:<10} {rate:>12.0f} записей/с")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--writes", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(main(args.writes))
@@ -0,0 +1,61 @@
+"""Бенчмарк group commit: параллельные create_task с пакетной фиксацией и без нее."""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Tuple
+
+# Добавляем путь к серверу для импорта app.*
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "server"))
+
+from app.database import BatchStats, Database  # noqa: E402
+
+
+async def bench(
+    profile: str, batch_window: float, writes: int, concurrency: int
+) -> Tuple[float, BatchStats]:
+    """Выполняет writes вызовов create_task из concurrency корутин; возвращает время и статистику."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = Database(
+            db_path=str(Path(tmp_dir) / "bench.db"), profile=profile, batch_window=batch_window
+        )
+        await db.connect()
+        queue = iter(range(writes))
+
+        async def worker():
+            for i in queue:
+                await db.create_task(f"Задача {i}", "Описание", "pending")
+
+        try:
+            start = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+            elapsed = time.perf_counter() - start
+        finally:
+            await db.close()
+    return elapsed, db.batch_stats
+
+
+async def main(writes: int, concurrency: int) -> None:
+    """Сравнивает скорость записи с group commit и без него."""
+    print(f"{writes} create_task из {concurrency} корутин")
+    print("-" * 64)
+    print(f"{'профиль':<10} {'окно, мс':>9} {'записей/с':>12} {'пакетов':>9} {'ср. пакет':>10}")
+    for profile in ("safe", "balanced"):
+        for window_ms in (0, 2):
+            elapsed, stats = await bench(profile, window_ms / 1000, writes, concurrency)
+            print(
+                f"{profile:<10} {window_ms:>9} {writes / elapsed:>12.0f} "
+                f"{stats.batches:>9} {stats.avg_size:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--writes", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.writes, args.concurrency))
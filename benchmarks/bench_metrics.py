@@ -0,0 +1,129 @@
+"""Накладные расходы метрик Prometheus на запрос."""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from aiohttp import ClientSession, web
+from aiohttp.test_utils import TestServer, make_mocked_request
+
+# Добавляем путь к серверу для импорта app.*
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "server"))
+
+from app import handlers  # noqa: E402
+from app import main as server_main  # noqa: E402
+from app.database import Database  # noqa: E402
+from app.metrics import METRICS_KEY, Metrics, metrics_middleware, timed  # noqa: E402
+
+
+async def run(session: ClientSession, url: str, requests: int, concurrency: int) -> float:
+    """Выполняет requests запросов в concurrency потоков; возвращает запросов в секунду."""
+    remaining = iter(range(requests))
+
+    async def worker():
+        for _ in remaining:
+            async with session.get(url) as response:
+                await response.read()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return requests / (time.perf_counter() - start)
+
+
+def make_app(db: Database, metrics: bool) -> web.Application:
+    """Приложение на общей БД без метрик или с отдельным реестром метрик."""
+    app = server_main.create_app()
+    app.on_startup.remove(server_main.init_db)
+    app.on_cleanup.remove(server_main.close_db)
+    if metrics_middleware in app.middlewares:
+        app.middlewares.remove(metrics_middleware)
+    db.metrics = None
+    if metrics:
+        db.metrics = app[METRICS_KEY] = Metrics()
+        app.middlewares.insert(0, metrics_middleware)
+    return app
+
+
+async def measure_http(db: Database, task_id: int, requests: int, concurrency: int) -> None:
+    """Запросов в секунду по HTTP с метриками и без них."""
+    print(f"Запросов в секунду ({requests} запросов, {concurrency} параллельно)")
+    print("-" * 48)
+    print(f"{'запрос':<18} {'без метрик':>14} {'с метриками':>14}")
+    for name, path in (("GET /health", "/health"), ("GET /tasks/{id}", f"/tasks/{task_id}")):
+        results = []
+        for metrics in (False, True):
+            app = make_app(db, metrics)
+            async with TestServer(app) as server, ClientSession() as session:
+                url = server.make_url(path)
+                await run(session, url, min(requests, 200), concurrency)  # прогрев
+                results.append(await run(session, url, requests, concurrency))
+        print(f"{name:<18} {results[0]:>14.0f} {results[1]:>14.0f}")
+
+
+async def measure_cpu(iterations: int) -> None:
+    """CPU на учет одного запроса в middleware и одного вызова метода БД."""
+
+    async def handler(request: web.Request) -> web.Response:
+        return web.Response(body=b"{}")
+
+    app = web.Application()
+    app[METRICS_KEY] = Metrics()
+    app.router.add_get("/tasks/{id}", handler)
+    request = make_mocked_request("GET", "/tasks/1", app=app)
+    match_info = await app.router.resolve(request)
+    match_info.add_app(app)
+    request._match_info = match_info
+
+    class Stub:
+        """Объект с реестром метрик, как у Database."""
+
+        def __init__(self, metrics):
+            self.metrics = metrics
+
+        async def plain(self):
+            return None
+
+        timed_call = timed(plain)
+
+    plain_stub, timed_stub = Stub(None), Stub(Metrics())
+
+    cases = [
+        ("обработчик", lambda: handler(request)),
+        ("middleware + обработчик", lambda: metrics_middleware(request, handler)),
+        ("метод БД", plain_stub.plain),
+        ("timed(метод БД)", timed_stub.timed_call),
+    ]
+    print(f"\nCPU на вызов, мкс ({iterations} итераций)")
+    print("-" * 40)
+    for name, call in cases:
+        start = time.process_time()
+        for _ in range(iterations):
+            await call()
+        print(f"{name:<26} {(time.process_time() - start) / iterations * 1e6:>10.2f}")
+
+
+async def main(requests: int, concurrency: int, iterations: int) -> None:
+    """Создает БД с одной задачей и выполняет замеры."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(str(Path(tmp) / "bench.db"))
+        await db.connect()
+        handlers.db = db
+        try:
+            task = await db.create_task(title="Задача", description="Описание задачи")
+            await measure_http(db, task.id, requests, concurrency)
+        finally:
+            await db.close()
+    await measure_cpu(iterations)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--iterations", type=int, default=100000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.iterations))
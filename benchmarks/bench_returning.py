@@ -0,0 +1,74 @@
+"""Бенчмарк путей записи: INSERT/UPDATE + повторный SELECT против ... RETURNING *."""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Добавляем путь к серверу для импорта app.*
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "server"))
+
+from app.database import Database  # noqa: E402
+from app.models import Task  # noqa: E402
+
+
+async def legacy_create(db: Database, title: str) -> Task:
+    """Прежний путь create_task: INSERT, commit и отдельный SELECT."""
+    connection = db._connection
+    cursor = await connection.execute(
+        "INSERT INTO tasks (title, description, status, created_at) VALUES (?, ?, ?, ?)",
+        (title, "Описание", "pending", datetime.utcnow().isoformat()),
+    )
+    await connection.commit()
+    return await db.get_task(cursor.lastrowid)
+
+
+async def legacy_update(db: Database, task_id: int, status: str) -> Task:
+    """Прежний путь update_task: UPDATE из f-строки, commit и отдельный SELECT."""
+    updates = ["status = ?"]
+    query = f'UPDATE tasks SET {", ".join(updates)} WHERE id = ?'
+    await db._connection.execute(query, [status, task_id])
+    await db._connection.commit()
+    return await db.get_task(task_id)
+
+
+async def run(writes: int, legacy: bool) -> float:
+    """Выполняет writes пар create + update и возвращает операций в секунду."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = Database(db_path=str(Path(tmp_dir) / "bench.db"), profile="fast")
+        await db.connect()
+        try:
+            start = time.perf_counter()
+            for i in range(writes):
+                if legacy:
+                    task = await legacy_create(db, f"Задача {i}")
+                    await legacy_update(db, task.id, "completed")
+                else:
+                    task = await db.create_task(f"Задача {i}", "Описание", "pending")
+                    await db.update_task(task.id, status="completed")
+            elapsed = time.perf_counter() - start
+        finally:
+            await db.close()
+    return 2 * writes / elapsed
+
+
+async def main(writes: int) -> None:
+    """Сравнивает прежний и новый путь записи."""
+    print(f"{writes} пар create_task + update_task, профиль fast")
+    print("-" * 40)
+    legacy = await run(writes, legacy=True)
+    returning = await run(writes, legacy=False)
+    print(f"{'SELECT после записи':<22} {legacy:>10.0f} операций/с")
+    print(f"{'RETURNING *':<22} {returning:>10.0f} операций/с")
+    print(f"{'ускорение':<22} {returning / legacy:>10.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--writes", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(main(args.writes))
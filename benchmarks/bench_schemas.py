@@ -0,0 +1,55 @@
+"""Пропускная способность dump/load: marshmallow против скомпилированных схем."""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Добавляем путь к серверу для импорта app.*
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "server"))
+
+from app.compiled_schemas import compile_schema  # noqa: E402
+from app.schemas import TaskCreateSchema, TaskSchema, TaskUpdateSchema  # noqa: E402
+
+TASK_ROW = {
+    "id": 1,
+    "title": "Задача",
+    "description": "Описание задачи",
+    "status": "in_progress",
+    "created_at": "2026-01-01T00:00:00",
+    "version": 1,
+}
+CREATE_BODY = {"title": "Задача", "description": "Описание задачи", "status": "in_progress"}
+UPDATE_BODY = {"status": "completed"}
+
+
+def throughput(func, arg, objects: int) -> float:
+    """Возвращает число обработанных объектов в секунду."""
+    start = time.perf_counter()
+    for _ in range(objects):
+        func(arg)
+    return objects / (time.perf_counter() - start)
+
+
+def main(objects: int) -> None:
+    """Сравнивает dump TaskSchema и load схем создания/обновления."""
+    cases = [
+        ("TaskSchema.dump", TaskSchema(), "dump", TASK_ROW),
+        ("TaskCreateSchema.load", TaskCreateSchema(), "load", CREATE_BODY),
+        ("TaskUpdateSchema.load", TaskUpdateSchema(), "load", UPDATE_BODY),
+    ]
+    print(f"Объектов в секунду ({objects} итераций)")
+    print("-" * 66)
+    print(f"{'операция':<24} {'marshmallow':>12} {'compiled':>12} {'ускорение':>12}")
+    for name, schema, method, arg in cases:
+        baseline = throughput(getattr(schema, method), arg, objects)
+        compiled = throughput(getattr(compile_schema(schema), method), arg, objects)
+        print(f"{name:<24} {baseline:>12,.0f} {compiled:>12,.0f} {compiled / baseline:>11.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--objects", type=int, default=100000)
+    args = parser.parse_args()
+    main(args.objects)
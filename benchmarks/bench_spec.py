@@ -0,0 +1,75 @@
+"""Запросов в секунду для endpoints OpenAPI спецификации."""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+from aiohttp import ClientSession, web
+from aiohttp.test_utils import TestServer
+
+# Добавляем путь к серверу для импорта app.*
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "server"))
+
+from app import main as server_main  # noqa: E402
+from app.openapi import render_yaml  # noqa: E402
+
+
+async def legacy_yaml_handler(request: web.Request) -> web.Response:
+    """Прежний обработчик: спецификация кодируется заново на каждый запрос."""
+    return web.Response(
+        body=render_yaml(request.app["swagger_dict"]), content_type="application/x-yaml"
+    )
+
+
+async def run(session: ClientSession, url: str, headers: dict, requests: int, concurrency: int):
+    """Выполняет requests запросов в concurrency потоков; возвращает запросов в секунду."""
+    remaining = iter(range(requests))
+
+    async def worker():
+        for _ in remaining:
+            async with session.get(url, headers=headers) as response:
+                await response.read()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return requests / (time.perf_counter() - start)
+
+
+async def main(requests: int, concurrency: int) -> None:
+    """Поднимает приложение без БД и замеряет каждый вариант запроса."""
+    app = server_main.create_app()
+    app.on_startup.remove(server_main.init_db)
+    app.on_cleanup.remove(server_main.close_db)
+    app.router.add_get("/legacy.yaml", legacy_yaml_handler)
+
+    async with TestServer(app) as server, ClientSession(auto_decompress=False) as session:
+        async with session.get(server.make_url("/swagger.yaml")) as response:
+            etag = response.headers["ETag"]
+
+        cases = [
+            ("/legacy.yaml (каждый раз)", "/legacy.yaml", {"Accept-Encoding": "identity"}),
+            ("/swagger.yaml", "/swagger.yaml", {"Accept-Encoding": "identity"}),
+            ("/swagger.yaml gzip", "/swagger.yaml", {"Accept-Encoding": "gzip"}),
+            ("/swagger.json", "/swagger.json", {"Accept-Encoding": "identity"}),
+            (
+                "/swagger.yaml 304",
+                "/swagger.yaml",
+                {"Accept-Encoding": "identity", "If-None-Match": etag},
+            ),
+        ]
+        print(f"Запросов в секунду ({requests} запросов, {concurrency} параллельно)")
+        print("-" * 44)
+        for name, path, headers in cases:
+            rps = await run(session, server.make_url(path), headers, requests, concurrency)
+            print(f"{name:<30} {rps:>12.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
@@ -0,0 +1,77 @@
+"""Память и время на чтение строк задач: dict(row) против слотовой записи Task."""
+
+import argparse
+import sqlite3
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Добавляем путь к серверу для импорта app.*
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "server"))
+
+from app.database import MIGRATIONS  # noqa: E402
+from app.models import TASK_COLUMNS, task_row_factory  # noqa: E402
+
+QUERY = f"SELECT {TASK_COLUMNS} FROM tasks ORDER BY id"
+
+
+def create_db(rows: int) -> sqlite3.Connection:
+    """Создает БД в памяти с rows задачами."""
+    connection = sqlite3.connect(":memory:")
+    for migration in MIGRATIONS:
+        for statement in migration:
+            connection.execute(statement)
+    connection.executemany(
+        "INSERT INTO tasks (title, description, status, created_at) VALUES (?, ?, ?, ?)",
+        [(f"Задача {i}", "Описание задачи", "pending", "2026-01-01T00:00:00") for i in range(rows)],
+    )
+    return connection
+
+
+def fetch_dicts(connection: sqlite3.Connection) -> list:
+    """Прежний путь: sqlite3.Row и dict на каждую строку."""
+    cursor = connection.cursor()
+    cursor.row_factory = sqlite3.Row
+    return [dict(row) for row in cursor.execute(QUERY)]
+
+
+def fetch_tasks(connection: sqlite3.Connection) -> list:
+    """Текущий путь: Task из кортежа строки."""
+    cursor = connection.cursor()
+    cursor.row_factory = task_row_factory
+    return cursor.execute(QUERY).fetchall()
+
+
+def measure(fetch, connection: sqlite3.Connection) -> tuple:
+    """Возвращает (время в мс, память результата в МБ)."""
+    start = time.perf_counter()
+    fetch(connection)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    tracemalloc.start()
+    result = fetch(connection)
+    memory = tracemalloc.get_traced_memory()[0] / 1024 / 1024
+    tracemalloc.stop()
+    del result
+    return elapsed, memory
+
+
+def main(rows: int) -> None:
+    """Запускает сравнение на rows строках."""
+    connection = create_db(rows)
+    print(f"Чтение {rows} задач")
+    print("-" * 44)
+    print(f"{'путь':<14} {'время, мс':>12} {'память, МБ':>14}")
+    for name, fetch in [("dict(row)", fetch_dicts), ("Task", fetch_tasks)]:
+        elapsed, memory = measure(fetch, connection)
+        print(f"{name:<14} {elapsed:>12.1f} {memory:>14.1f}")
+    connection.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args()
+    main(args.rows)
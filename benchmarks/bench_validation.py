@@ -0,0 +1,71 @@
+"""Микробенчмарк CPU на разбор, валидацию и сериализацию одного запроса."""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Добавляем путь к серверу для импорта app.*
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "server"))
+
+from app import handlers  # noqa: E402
+from app.schemas import TaskCreateSchema, TaskSchema, TaskUpdateSchema  # noqa: E402
+
+CREATE_BODY = json.dumps(
+    {"title": "Задача", "description": "Описание задачи", "status": "in_progress"}
+).encode()
+UPDATE_BODY = json.dumps({"status": "completed"}).encode()
+TASK_ROW = {
+    "id": 1,
+    "title": "Задача",
+    "description": "Описание задачи",
+    "status": "in_progress",
+    "created_at": "2026-01-01T00:00:00",
+    "version": 1,
+}
+
+
+def legacy_request(body: bytes, schema_class) -> bytes:
+    """Прежний путь: схемы создаются заново на каждый запрос."""
+    data = json.loads(body)
+    schema_class().load(data)
+    return json.dumps(TaskSchema().dump(TASK_ROW)).encode()
+
+
+def current_request(body: bytes, handler) -> bytes:
+    """Текущий путь: схема из use_kwargs и схема ответа уровня модуля."""
+    data = json.loads(body)
+    handler.__schemas__[0]["schema"].load(data)
+    return json.dumps(handlers.task_schema.dump(TASK_ROW)).encode()
+
+
+def measure(func, *args, requests: int) -> float:
+    """Возвращает CPU-время одного вызова в микросекундах."""
+    start = time.process_time()
+    for _ in range(requests):
+        func(*args)
+    return (time.process_time() - start) / requests * 1e6
+
+
+def main(requests: int) -> None:
+    """Запускает сравнение для POST /tasks и PUT /tasks/{id}."""
+    cases = [
+        ("POST /tasks", CREATE_BODY, TaskCreateSchema, handlers.create_task_handler),
+        ("PUT /tasks/{id}", UPDATE_BODY, TaskUpdateSchema, handlers.update_task_handler),
+    ]
+    print(f"CPU на запрос, мкс ({requests} итераций)")
+    print("-" * 52)
+    print(f"{'запрос':<18} {'прежний путь':>14} {'текущий путь':>14}")
+    for name, body, schema_class, handler in cases:
+        legacy = measure(legacy_request, body, schema_class, requests=requests)
+        current = measure(current_request, body, handler, requests=requests)
+        print(f"{name:<18} {legacy:>14.1f} {current:>14.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+    main(args.requests)
@@ -10,7 +10,14 @@ generated_path = project_root / "client" / "generated"
 sys.path.insert(0, str(generated_path))
 
 try:
-    from openapi_client import ApiClient, Configuration
+    from openapi_client import (
+        ApiClient,
+        CircuitBreaker,
+        Configuration,
+        ResponseCache,
+        RetryPolicy,
+        close_shared_sessions,
+    )
     from openapi_client.api.tasks_api import TasksApi
     from openapi_client.models.task_create import TaskCreate
     from openapi_client.models.task_update import TaskUpdate
@@ -22,6 +29,7 @@ except ImportError as e:
     print("1. Запустите сервер: cd server && python -m app.main")
     print("2. Экспортируйте спецификацию: python export_openapi.py")
     print("3. Сгенерируйте клиент: python generate_client.py")
+    print("   (пример использует возможности встроенного бэкенда python, по умолчанию)")
     sys.exit(1)
 
 
@@ -34,7 +42,17 @@ async def main():
     print("ДЕМОНСТРАЦИЯ РАБОТЫ С API ЧЕРЕЗ СГЕНЕРИРОВАННЫЙ КЛИЕНТ")
     print("=" * 60)
 
-    configuration = Configuration(host=BASE_URL)
+    # Общий пул соединений, повторы идемпотентных запросов, circuit breaker и кэш GET-ответов
+    response_cache = ResponseCache(max_entries=1024)
+    configuration = Configuration(
+        host=BASE_URL,
+        connection_pool_maxsize=20,
+        keepalive_timeout=30.0,
+        share_session=True,
+        retry_policy=RetryPolicy(max_attempts=3, backoff_base=0.1, backoff_max=2.0),
+        circuit_breaker=CircuitBreaker(failure_threshold=5, recovery_timeout=10.0),
+        response_cache=response_cache,
+    )
     async with ApiClient(configuration) as api_client:
         tasks_api = TasksApi(api_client)
 
@@ -84,12 +102,22 @@ async def main():
             print(f"    Description: {updated_task_full.description}")
             print(f"    Status: {updated_task_full.status}")
 
-            print("\n5. УДАЛЕНИЕ ЗАДАЧИ")
+            print("\n5. ПАКЕТНОЕ ПОЛУЧЕНИЕ ЗАДАЧ (get_many)")
+            print("-" * 60)
+            results = await tasks_api.get_many([task_id, task_id, "0"], concurrency=2)
+            for result in results:
+                if result.ok:
+                    print(f"[OK] {result.key}: {result.data.title}")
+                else:
+                    print(f"[OK] {result.key}: ожидаемая ошибка HTTP {result.error.status}")
+            print(f"    Кэш ответов: {response_cache.stats()}")
+
+            print("\n6. УДАЛЕНИЕ ЗАДАЧИ")
             print("-" * 60)
             await tasks_api.tasks_id_delete(task_id)
             print(f"[OK] Задача {task_id} удалена")
 
-            print("\n6. ПОПЫТКА ПОЛУЧИТЬ УДАЛЕННУЮ ЗАДАЧУ")
+            print("\n7. ПОПЫТКА ПОЛУЧИТЬ УДАЛЕННУЮ ЗАДАЧУ")
             print("-" * 60)
             try:
                 await tasks_api.tasks_id_get(task_id)
@@ -109,6 +137,8 @@ async def main():
 
             traceback.print_exc()
 
+    await close_shared_sessions()
+
     print("\n" + "=" * 60)
     print("ДЕМОНСТРАЦИЯ ЗАВЕРШЕНА")
     print("=" * 60)
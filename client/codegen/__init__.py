@@ -0,0 +1,17 @@
+"""Генератор asyncio-клиента без JVM (бэкенд python для generate_client.py)."""
+
+import hashlib
+
+from .generator import RUNTIME_DIR, generate
+
+__all__ = ["fingerprint", "generate"]
+
+
+def fingerprint() -> str:
+    """Хэш исходников генератора и runtime; меняется вместе с генерируемым кодом."""
+    digest = hashlib.sha256()
+    sources = [RUNTIME_DIR.parent / "generator.py", *sorted(RUNTIME_DIR.glob("*.py"))]
+    for path in sources:
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
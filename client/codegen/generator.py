@@ -0,0 +1,460 @@
+"""Генерация asyncio-клиента на aiohttp из спецификации Swagger 2.0."""
+
+import json
+import keyword
+import re
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+RUNTIME_DIR = Path(__file__).parent / "runtime"
+RUNTIME_MODULES = (
+    "api_client.py",
+    "api_response.py",
+    "batch.py",
+    "cache.py",
+    "configuration.py",
+    "exceptions.py",
+    "model.py",
+    "retry.py",
+)
+
+# HEAD-операции повторяют GET и в клиент не попадают
+HTTP_METHODS = ("get", "put", "post", "delete", "patch")
+
+PRIMITIVE_TYPES = {"string": "str", "integer": "int", "number": "float", "boolean": "bool"}
+
+HEADER = '"""{doc}\n\nСгенерировано client/codegen из {source}; не редактировать вручную.\n"""\n'
+
+
+def literal(value: Any) -> str:
+    """Литерал Python в стиле black: строки в двойных кавычках."""
+    if isinstance(value, str):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, tuple):
+        return (
+            "("
+            + ", ".join(literal(item) for item in value)
+            + ("," if len(value) == 1 else "")
+            + ")"
+        )
+    if isinstance(value, dict):
+        items = ", ".join(f"{literal(key)}: {literal(item)}" for key, item in value.items())
+        return "{" + items + "}"
+    return repr(value)
+
+
+def snake_case(name: str) -> str:
+    """TaskBulkItemResult -> task_bulk_item_result, If-None-Match -> if_none_match."""
+    name = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", name)
+    name = re.sub(r"[^0-9a-zA-Z]+", "_", name).strip("_").lower()
+    return name + "_" if keyword.iskeyword(name) else name
+
+
+def ref_name(ref: str) -> str:
+    """#/definitions/Task -> Task."""
+    return ref.rsplit("/", 1)[-1]
+
+
+def operation_id(path: str, method: str) -> str:
+    """Имя метода как у openapi-generator: /tasks/{id} + get -> tasks_id_get."""
+    return snake_case(path.replace("{", "").replace("}", "")) + "_" + method
+
+
+def _schema_ref(schema: Dict[str, Any]) -> Optional[str]:
+    if "$ref" in schema:
+        return ref_name(schema["$ref"])
+    for part in schema.get("allOf", ()):
+        if "$ref" in part:
+            return ref_name(part["$ref"])
+    return None
+
+
+def python_type(schema: Dict[str, Any]) -> str:
+    """Аннотация Python для схемы свойства или параметра."""
+    ref = _schema_ref(schema)
+    if ref:
+        return ref
+    schema_type = schema.get("type")
+    if schema_type == "array":
+        return f"List[{python_type(schema.get('items', {}))}]"
+    if schema_type == "object":
+        return "Dict[str, Any]"
+    if schema_type == "string" and schema.get("format") == "date-time":
+        return "Union[datetime, str]"
+    return PRIMITIVE_TYPES.get(schema_type, "Any")
+
+
+def _models_used(schema: Dict[str, Any]) -> List[str]:
+    ref = _schema_ref(schema)
+    if ref:
+        return [ref]
+    if schema.get("type") == "array":
+        return _models_used(schema.get("items", {}))
+    return []
+
+
+def _to_dict_expr(schema: Dict[str, Any], value: str) -> str:
+    if _schema_ref(schema):
+        return f"{value}.to_dict()"
+    items = schema.get("items", {})
+    if schema.get("type") == "array" and _schema_ref(items):
+        return f"[item.to_dict() for item in {value}]"
+    return value
+
+
+def _from_dict_expr(schema: Dict[str, Any], value: str) -> str:
+    ref = _schema_ref(schema)
+    if ref:
+        return f"{ref}.from_dict({value})"
+    items = schema.get("items", {})
+    if schema.get("type") == "array" and _schema_ref(items):
+        return f"[{_schema_ref(items)}.from_dict(item) for item in {value}]"
+    return value
+
+
+def render_model(name: str, schema: Dict[str, Any], source: str) -> str:
+    """Модуль с dataclass-моделью для определения из definitions."""
+    properties = schema.get("properties", {})
+    required = set(schema.get("required", ()))
+    nested = sorted({model for prop in properties.values() for model in _models_used(prop)})
+
+    lines = [
+        HEADER.format(doc=f"Модель {name}.", source=source),
+        "from __future__ import annotations",
+        "",
+        "from dataclasses import dataclass",
+        "from typing import Any, Dict, List, Optional",
+        "",
+        "from ..model import Model",
+    ]
+    lines += [f"from .{snake_case(model)} import {model}" for model in nested if model != name]
+    lines += ["", "", "@dataclass(slots=True, kw_only=True)", f"class {name}(Model):"]
+    description = schema.get("description")
+    lines.append(f'    """{description or name}"""')
+    lines.append("")
+
+    enums = {}
+    for prop_name, prop in properties.items():
+        attr = snake_case(prop_name)
+        annotation = python_type(prop)
+        if prop_name in required:
+            lines.append(f"    {attr}: {annotation}")
+        else:
+            lines.append(f"    {attr}: Optional[{annotation}] = {literal(prop.get('default'))}")
+        if "enum" in prop:
+            enums[attr] = tuple(prop["enum"])
+    if not properties:
+        lines.append("    pass")
+    if enums:
+        lines += ["", f"    _enums = {literal(enums)}"]
+
+    lines += ["", "    def to_dict(self) -> Dict[str, Any]:"]
+    lines.append('        """Словарь для JSON; незаданные (None) поля опускаются."""')
+    lines.append("        result: Dict[str, Any] = {}")
+    for prop_name, prop in properties.items():
+        attr = snake_case(prop_name)
+        lines.append(f"        if self.{attr} is not None:")
+        lines.append(
+            f"            result[{literal(prop_name)}] = {_to_dict_expr(prop, 'self.' + attr)}"
+        )
+    lines.append("        return result")
+
+    lines += ["", "    @classmethod", f'    def from_dict(cls, obj: Dict[str, Any]) -> "{name}":']
+    lines.append('        """Создает модель из словаря; неизвестные ключи игнорируются."""')
+    lines.append("        return cls(")
+    for prop_name, prop in properties.items():
+        attr = snake_case(prop_name)
+        key = literal(prop_name)
+        value = f"obj.get({key})"
+        expr = _from_dict_expr(prop, value)
+        if expr != value:
+            expr = f"{_from_dict_expr(prop, f'obj[{key}]')} if {value} is not None else None"
+        elif prop.get("default") is not None:
+            expr = f"obj.get({key}, {literal(prop['default'])})"
+        lines.append(f"            {attr}={expr},")
+    lines.append("        )")
+    return "\n".join(lines) + "\n"
+
+
+class Operation:
+    """Описание операции, достаточное для генерации метода."""
+
+    def __init__(self, path: str, method: str, spec: Dict[str, Any]) -> None:
+        self.path = path
+        self.method = method.upper()
+        self.name = operation_id(path, method)
+        self.summary = spec.get("summary", "")
+        self.description = spec.get("description", "")
+        self.path_params: List[Tuple[str, str, str]] = []
+        self.query_params: List[Tuple[str, str, str]] = []
+        self.header_params: List[Tuple[str, str, str]] = []
+        self.body: Optional[Tuple[str, str]] = None
+        self.models: List[str] = []
+
+        for param in spec.get("parameters", ()):
+            if param["in"] == "body":
+                schema = param.get("schema", {})
+                self.models += _models_used(schema)
+                body_name = snake_case(_models_used(schema)[0]) if _models_used(schema) else "body"
+                self.body = (body_name, python_type(schema))
+                continue
+            entry = (snake_case(param["name"]), param["name"], python_type(param))
+            if param["in"] == "path":
+                self.path_params.append(entry)
+            elif param["in"] == "query":
+                self.query_params.append(entry)
+            elif param["in"] == "header":
+                self.header_params.append(entry)
+
+        self.response_type: Optional[str] = None
+        self.response_format = "json"
+        for code, response in sorted(spec.get("responses", {}).items()):
+            if str(code).startswith("2") and "schema" in response:
+                models = _models_used(response["schema"])
+                self.response_type = models[0] if models else None
+                self.models += models
+                break
+        if "application/x-ndjson" in spec.get("produces", ()):
+            self.response_format = "ndjson"
+
+    @property
+    def return_annotation(self) -> str:
+        if self.response_type is None:
+            return "None"
+        if self.response_format == "ndjson":
+            return f"List[{self.response_type}]"
+        return self.response_type
+
+    @property
+    def is_item_get(self) -> bool:
+        """GET одного объекта по единственному path-параметру (основа get_many)."""
+        return (
+            self.method == "GET"
+            and len(self.path_params) == 1
+            and self.body is None
+            and self.response_type is not None
+            and self.response_format == "json"
+        )
+
+    def signature(self) -> List[str]:
+        """Параметры метода: path и body позиционно, query и header - только по имени."""
+        params = ["self"]
+        params += [f"{attr}: {annotation}" for attr, _, annotation in self.path_params]
+        if self.body:
+            params.append(f"{self.body[0]}: Optional[{self.body[1]}] = None")
+        params.append("*")
+        params += [
+            f"{attr}: Optional[{annotation}] = None"
+            for attr, _, annotation in self.query_params + self.header_params
+        ]
+        params.append("_request_timeout: Optional[float] = None")
+        return params
+
+    def call_arguments(self) -> List[str]:
+        """Аргументы для вызова *_with_http_info из основного метода."""
+        args = [attr for attr, _, _ in self.path_params]
+        if self.body:
+            args.append(self.body[0])
+        args += [f"{attr}={attr}" for attr, _, _ in self.query_params + self.header_params]
+        args.append("_request_timeout=_request_timeout")
+        return args
+
+    def render(self) -> List[str]:
+        doc = self.summary
+        if self.description:
+            doc = f"{doc}\n\n        {self.description}" if doc else self.description
+        params = ",\n        ".join(self.signature())
+        call_args = ",\n            ".join(self.call_arguments())
+
+        lines = [
+            f"    async def {self.name}(\n        {params},\n    ) -> {self.return_annotation}:",
+            f'        """{doc}\n        """',
+            f"        response = await self.{self.name}_with_http_info(\n"
+            f"            {call_args},\n        )",
+            "        return response.data",
+            "",
+            f"    async def {self.name}_with_http_info(\n        {params},\n    ) -> ApiResponse:",
+            f'        """{self.summary or self.name}; возвращает ответ с кодом и заголовками."""',
+            "        return await self.api_client.call_api(",
+            f"            {literal(self.method)},",
+            f"            {literal(self.path)},",
+        ]
+        if self.path_params:
+            items = ", ".join(f"{literal(name)}: {attr}" for attr, name, _ in self.path_params)
+            lines.append(f"            path_params={{{items}}},")
+        if self.query_params:
+            lines.append("            query_params=[")
+            lines += [
+                f"                ({literal(name)}, {attr})," for attr, name, _ in self.query_params
+            ]
+            lines.append("            ],")
+        if self.header_params:
+            items = ", ".join(f"{literal(name)}: {attr}" for attr, name, _ in self.header_params)
+            lines.append(f"            header_params={{{items}}},")
+        if self.body:
+            lines.append(f"            body={self.body[0]},")
+        if self.response_type:
+            lines.append(f"            response_type={self.response_type},")
+        if self.response_format != "json":
+            lines.append(f"            response_format={literal(self.response_format)},")
+        lines += ["            _request_timeout=_request_timeout,", "        )", ""]
+        return lines
+
+
+def render_get_many(operation: Operation) -> List[str]:
+    """Метод get_many: пакетный вызов операции получения объекта по ключу."""
+    attr = operation.path_params[0][0]
+    return [
+        "    async def get_many(",
+        "        self,",
+        f"        {attr}s: Iterable[{operation.path_params[0][2]}],",
+        "        *,",
+        "        concurrency: int = 10,",
+        "        deadline: Optional[float] = None,",
+        "        _request_timeout: Optional[float] = None,",
+        "    ) -> List[BatchResult]:",
+        f'        """Вызывает {operation.name} для каждого {attr}, не более concurrency одновременно.',
+        "",
+        f"        Результаты (BatchResult с data: {operation.response_type} или error: ApiException)",
+        f"        идут в порядке {attr}s; вызовы, не завершившиеся за deadline секунд,",
+        "        получают DeadlineExceededException.",
+        '        """',
+        "        return await run_many(",
+        f"            {attr}s,",
+        f"            lambda key: self.{operation.name}(key, _request_timeout=_request_timeout),",
+        "            concurrency=concurrency,",
+        "            deadline=deadline,",
+        "        )",
+        "",
+    ]
+
+
+def api_class_name(tag: str) -> str:
+    """tasks -> TasksApi."""
+    return "".join(part.capitalize() for part in re.split(r"[^0-9a-zA-Z]+", tag) if part) + "Api"
+
+
+def render_api(class_name: str, operations: List[Operation], source: str) -> str:
+    """Модуль с классом операций одного тега."""
+    models = sorted({model for operation in operations for model in operation.models})
+    item_gets = [operation for operation in operations if operation.is_item_get]
+    lines = [
+        HEADER.format(doc=f"Операции {class_name}.", source=source),
+        "from datetime import datetime  # noqa: F401",
+        "from typing import Any, Dict, Iterable, List, Optional, Union  # noqa: F401",
+        "",
+        "from ..api_client import ApiClient",
+        "from ..api_response import ApiResponse",
+        "from ..batch import BatchResult, run_many  # noqa: F401",
+    ]
+    lines += [f"from ..models.{snake_case(model)} import {model}" for model in models]
+    lines += [
+        "",
+        "",
+        f"class {class_name}:",
+        f'    """Операции {class_name}."""',
+        "",
+        "    def __init__(self, api_client: Optional[ApiClient] = None) -> None:",
+        "        self.api_client = api_client or ApiClient()",
+        "",
+    ]
+    for operation in operations:
+        lines += operation.render()
+    # get_many генерируется, только если операция получения объекта однозначна
+    if len(item_gets) == 1:
+        lines += render_get_many(item_gets[0])
+    return "\n".join(lines).rstrip() + "\n"
+
+
+def load_spec(spec_path: Path) -> Dict[str, Any]:
+    """Читает спецификацию YAML (через C-загрузчик, если он есть)."""
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(spec_path, encoding="utf-8") as f:
+        return yaml.load(f, Loader=loader)
+
+
+def collect_operations(spec: Dict[str, Any]) -> Dict[str, List[Operation]]:
+    """Группирует операции спецификации по классам *Api."""
+    apis: Dict[str, List[Operation]] = {}
+    for path, methods in spec.get("paths", {}).items():
+        for method in HTTP_METHODS:
+            if method not in methods:
+                continue
+            tags = methods[method].get("tags") or ["default"]
+            apis.setdefault(api_class_name(tags[0]), []).append(
+                Operation(path, method, methods[method])
+            )
+    return apis
+
+
+def generate(spec_path: Path, output_dir: Path, package_name: str = "openapi_client") -> List[Path]:
+    """Генерирует пакет package_name в output_dir; возвращает список созданных файлов."""
+    spec_path = Path(spec_path)
+    spec = load_spec(spec_path)
+    source = spec_path.as_posix()
+    package_dir = Path(output_dir) / package_name
+    if package_dir.exists():
+        shutil.rmtree(package_dir)
+    (package_dir / "api").mkdir(parents=True)
+    (package_dir / "models").mkdir()
+
+    files: Dict[Path, str] = {}
+    for module in RUNTIME_MODULES:
+        files[package_dir / module] = (RUNTIME_DIR / module).read_text(encoding="utf-8")
+    # Совместимость с openapi-generator: ApiException импортируется из openapi_client.rest
+    files[package_dir / "rest.py"] = (RUNTIME_DIR / "rest.py").read_text(encoding="utf-8")
+
+    definitions = spec.get("definitions", {})
+    model_exports = []
+    for name, schema in definitions.items():
+        module = snake_case(name)
+        files[package_dir / "models" / f"{module}.py"] = render_model(name, schema, source)
+        model_exports.append(f"from .{module} import {name}")
+    files[package_dir / "models" / "__init__.py"] = (
+        HEADER.format(doc="Модели API.", source=source) + "\n".join(model_exports) + "\n"
+    )
+
+    api_exports = []
+    for class_name, operations in collect_operations(spec).items():
+        module = snake_case(class_name)
+        files[package_dir / "api" / f"{module}.py"] = render_api(class_name, operations, source)
+        api_exports.append(f"from .{module} import {class_name}")
+    files[package_dir / "api" / "__init__.py"] = (
+        HEADER.format(doc="Классы операций API.", source=source) + "\n".join(api_exports) + "\n"
+    )
+
+    title = spec.get("info", {}).get("title", "API")
+    version = spec.get("info", {}).get("version", "0.0.0")
+    package_init = [
+        HEADER.format(doc=f"Клиент {title}.", source=source),
+        f'__version__ = "{version}"',
+        "",
+        "from .api import *  # noqa: F401,F403",
+        "from .api_client import ApiClient  # noqa: F401",
+        "from .api_response import ApiResponse  # noqa: F401",
+        "from .batch import BatchResult, run_many  # noqa: F401",
+        "from .cache import ResponseCache  # noqa: F401",
+        "from .configuration import Configuration  # noqa: F401",
+        "from .exceptions import (  # noqa: F401",
+        "    ApiException,",
+        "    ApiValueError,",
+        "    CircuitOpenException,",
+        "    DeadlineExceededException,",
+        "    NotFoundException,",
+        "    OpenApiException,",
+        "    PreconditionFailedException,",
+        "    ServiceException,",
+        "    TransportException,",
+        ")",
+        "from .models import *  # noqa: F401,F403",
+        "from .rest import close_shared_sessions  # noqa: F401",
+        "from .retry import CircuitBreaker, RetryBudget, RetryPolicy  # noqa: F401",
+    ]
+    files[package_dir / "__init__.py"] = "\n".join(package_init) + "\n"
+
+    for path, content in files.items():
+        path.write_text(content, encoding="utf-8")
+    return sorted(files)
@@ -0,0 +1,254 @@
+"""Общая часть вызова операций API: сборка запроса, сериализация, разбор ответа."""
+
+import asyncio
+import datetime
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+from urllib.parse import quote, urlencode, urlsplit
+
+import aiohttp
+
+from . import rest
+from .api_response import ApiResponse
+from .cache import ResponseCache
+from .configuration import Configuration
+from .exceptions import ApiException
+from .model import Model, json_dumps, json_loads
+
+
+class ApiClient:
+    """Клиент API: хранит настройки и HTTP-транспорт, выполняет запросы операций."""
+
+    def __init__(
+        self,
+        configuration: Optional[Configuration] = None,
+        header_name: Optional[str] = None,
+        header_value: Optional[str] = None,
+    ) -> None:
+        self.configuration = configuration or Configuration.get_default()
+        self.rest_client = rest.RESTClientObject(self.configuration)
+        self.default_headers: Dict[str, str] = {}
+        if header_name is not None:
+            self.default_headers[header_name] = header_value
+        self.user_agent = "OpenAPI-Generator/1.0.0/python"
+
+    async def __aenter__(self) -> "ApiClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Закрывает HTTP-сессию клиента."""
+        await self.rest_client.close()
+
+    @property
+    def user_agent(self) -> str:
+        """Значение заголовка User-Agent."""
+        return self.default_headers["User-Agent"]
+
+    @user_agent.setter
+    def user_agent(self, value: str) -> None:
+        self.default_headers["User-Agent"] = value
+
+    def set_default_header(self, header_name: str, header_value: str) -> None:
+        """Добавляет заголовок ко всем запросам клиента."""
+        self.default_headers[header_name] = header_value
+
+    def sanitize_for_serialization(self, obj: Any) -> Any:
+        """Приводит модели, списки и даты к JSON-совместимым значениям."""
+        if obj is None or isinstance(obj, (str, int, float, bool)):
+            return obj
+        if isinstance(obj, Model):
+            return obj.to_dict()
+        if isinstance(obj, (list, tuple)):
+            return [self.sanitize_for_serialization(item) for item in obj]
+        if isinstance(obj, (datetime.datetime, datetime.date)):
+            return obj.isoformat()
+        if isinstance(obj, dict):
+            return {key: self.sanitize_for_serialization(value) for key, value in obj.items()}
+        raise TypeError(f"Cannot serialize {type(obj).__name__}")
+
+    def _param_value(self, value: Any) -> str:
+        if isinstance(value, (datetime.datetime, datetime.date)):
+            return value.isoformat()
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        return str(value)
+
+    def build_url(
+        self,
+        path: str,
+        path_params: Optional[Mapping[str, Any]] = None,
+        query_params: Optional[Sequence[Tuple[str, Any]]] = None,
+    ) -> str:
+        """Собирает URL операции: подставляет path-параметры и добавляет query."""
+        if path_params:
+            for name, value in path_params.items():
+                path = path.replace("{" + name + "}", quote(self._param_value(value), safe=""))
+        url = self.configuration.host + path
+        if query_params:
+            query = [
+                (name, self._param_value(value))
+                for name, value in query_params
+                if value is not None
+            ]
+            if query:
+                url += "?" + urlencode(query)
+        return url
+
+    def deserialize(self, data: bytes, response_type: Any, response_format: str) -> Any:
+        """Разбирает тело ответа в модель, список моделей (NDJSON) или JSON-значение."""
+        if response_type is None or not data:
+            return None
+        if response_format == "ndjson":
+            items = [json_loads(line) for line in data.splitlines() if line.strip()]
+            return [response_type.from_dict(item) for item in items]
+        obj = json_loads(data)
+        if isinstance(response_type, type) and issubclass(response_type, Model):
+            return response_type.from_dict(obj)
+        return obj
+
+    async def send(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        payload: Optional[bytes],
+        _request_timeout: Optional[float] = None,
+    ) -> rest.RESTResponse:
+        """Отправляет запрос с учетом retry_policy и circuit_breaker из настроек."""
+        policy = self.configuration.retry_policy
+        breaker = self.configuration.circuit_breaker
+        host = urlsplit(url).netloc
+        if policy is not None:
+            policy.budget.deposit()
+
+        attempt = 0
+        while True:
+            if breaker is not None:
+                breaker.before_request(host)
+            try:
+                response = await self.rest_client.request(
+                    method, url, headers=headers, body=payload, _request_timeout=_request_timeout
+                )
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if breaker is not None:
+                    breaker.record_failure(host)
+                if policy is None or not policy.should_retry(method, attempt):
+                    raise
+                await asyncio.sleep(policy.backoff(attempt))
+                attempt += 1
+                continue
+            except asyncio.CancelledError:
+                if breaker is not None:
+                    breaker.record_cancelled(host)
+                raise
+
+            if breaker is not None:
+                if response.status >= 500:
+                    breaker.record_failure(host)
+                else:
+                    breaker.record_success(host)
+            if policy is None or not policy.should_retry(method, attempt, response.status):
+                return response
+            await asyncio.sleep(policy.backoff(attempt, response.getheader("Retry-After")))
+            attempt += 1
+
+    async def call_api(
+        self,
+        method: str,
+        path: str,
+        *,
+        path_params: Optional[Mapping[str, Any]] = None,
+        query_params: Optional[Sequence[Tuple[str, Any]]] = None,
+        header_params: Optional[Mapping[str, Any]] = None,
+        body: Any = None,
+        response_type: Any = None,
+        response_format: str = "json",
+        _request_timeout: Optional[float] = None,
+    ) -> ApiResponse:
+        """Выполняет операцию и возвращает разобранный ответ; 4xx/5xx - ApiException."""
+        url = self.build_url(path, path_params, query_params)
+        cache = self.configuration.response_cache
+
+        headers = dict(self.default_headers)
+        if header_params:
+            headers.update(
+                (name, self._param_value(value))
+                for name, value in header_params.items()
+                if value is not None
+            )
+
+        payload = None
+        if body is not None:
+            payload = json_dumps(self.sanitize_for_serialization(body))
+            headers["Content-Type"] = "application/json"
+
+        # Явный If-None-Match вызывающего означает, что ему нужен сам ответ сервера (в т.ч. 304)
+        if (
+            cache is not None
+            and method == "GET"
+            and response_format == "json"
+            and "If-None-Match" not in headers
+        ):
+            return await self._call_cached(cache, url, headers, response_type, _request_timeout)
+
+        try:
+            response = await self.send(method, url, headers, payload, _request_timeout)
+        finally:
+            if cache is not None and method != "GET":
+                cache.invalidate(url)
+
+        if response.status >= 400:
+            raise ApiException.from_response(http_resp=response)
+
+        return ApiResponse(
+            status_code=response.status,
+            headers=response.headers,
+            data=self.deserialize(response.data, response_type, response_format),
+            raw_data=response.data,
+        )
+
+    async def _call_cached(
+        self,
+        cache: ResponseCache,
+        url: str,
+        headers: Dict[str, str],
+        response_type: Any,
+        _request_timeout: Optional[float],
+    ) -> ApiResponse:
+        """GET через кэш: свежая запись без запроса, устаревшая - с If-None-Match."""
+        entry = cache.get(url)
+        if entry is not None and entry.fresh:
+            cache.hits += 1
+            return ApiResponse(
+                status_code=200, headers=entry.headers, data=entry.data, raw_data=b""
+            )
+        if entry is not None and entry.etag:
+            headers["If-None-Match"] = entry.etag
+
+        # Запись, инвалидированная во время запроса, не перезаписывается старым ответом
+        epoch = cache.epoch
+        response = await self.send("GET", url, headers, None, _request_timeout)
+
+        if response.status == 304 and entry is not None:
+            cache.revalidated += 1
+            if epoch == cache.epoch:
+                cache.refresh(url, entry, response.headers)
+            return ApiResponse(
+                status_code=200, headers=entry.headers, data=entry.data, raw_data=b""
+            )
+        cache.misses += 1
+        if response.status >= 400:
+            cache.invalidate(url)
+            raise ApiException.from_response(http_resp=response)
+
+        data = self.deserialize(response.data, response_type, "json")
+        if epoch == cache.epoch:
+            cache.store(url, data, response.headers)
+        return ApiResponse(
+            status_code=response.status,
+            headers=response.headers,
+            data=data,
+            raw_data=response.data,
+        )
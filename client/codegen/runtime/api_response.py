@@ -0,0 +1,14 @@
+"""Ответ API вместе с HTTP-метаданными."""
+
+from dataclasses import dataclass
+from typing import Any, Mapping
+
+
+@dataclass(slots=True)
+class ApiResponse:
+    """Результат методов *_with_http_info."""
+
+    status_code: int
+    headers: Mapping[str, str]
+    data: Any
+    raw_data: bytes
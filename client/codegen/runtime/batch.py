@@ -0,0 +1,81 @@
+"""Параллельное выполнение однотипных вызовов API с ограничением параллелизма."""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterable, List, Optional
+
+import aiohttp
+
+from .exceptions import ApiException, DeadlineExceededException, TransportException
+
+
+@dataclass(slots=True)
+class BatchResult:
+    """Результат одного элемента пакета: данные или ошибка в виде ApiException."""
+
+    key: Any
+    data: Any = None
+    error: Optional[ApiException] = None
+
+    @property
+    def ok(self) -> bool:
+        """Вызов завершился успешно."""
+        return self.error is None
+
+    def get(self) -> Any:
+        """Возвращает данные или поднимает ошибку элемента."""
+        if self.error is not None:
+            raise self.error
+        return self.data
+
+
+async def run_many(
+    keys: Iterable[Any],
+    call: Callable[[Any], Awaitable[Any]],
+    *,
+    concurrency: int = 10,
+    deadline: Optional[float] = None,
+) -> List[BatchResult]:
+    """Вызывает call(key) для каждого ключа, не более concurrency одновременно."""
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+
+    results = [BatchResult(key) for key in keys]
+    finished = [False] * len(results)
+    pending = iter(range(len(results)))
+
+    async def worker() -> None:
+        # Фиксированное число воркеров вместо задачи на каждый ключ:
+        # память не растет с размером пакета
+        for index in pending:
+            result = results[index]
+            try:
+                result.data = await call(result.key)
+            except ApiException as e:
+                result.error = e
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = TransportException(reason=str(e) or type(e).__name__)
+                error.__cause__ = e
+                result.error = error
+            finished[index] = True
+
+    workers = [asyncio.create_task(worker()) for _ in range(min(concurrency, len(results)))]
+    if not workers:
+        return results
+
+    try:
+        done, _ = await asyncio.wait(workers, timeout=deadline)
+    finally:
+        # И по deadline, и при отмене вызывающего (например, get_many) воркеры не должны
+        # продолжать отправлять запросы
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+    # Ошибки, не относящиеся к вызову API (ошибка в call), не глотаем
+    for task in done:
+        task.result()
+
+    for index, result in enumerate(results):
+        if not finished[index]:
+            result.error = DeadlineExceededException()
+    return results
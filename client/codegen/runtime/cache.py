@@ -0,0 +1,112 @@
+"""Кэш ответов GET на стороне клиента."""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    """Закэшированный ответ: модель, ее ETag и момент устаревания (time.monotonic)."""
+
+    data: Any
+    etag: Optional[str]
+    headers: Mapping[str, str]
+    expires: float
+
+    @property
+    def fresh(self) -> bool:
+        """Запись можно отдать без обращения к серверу."""
+        return time.monotonic() < self.expires
+
+
+def _max_age(headers: Mapping[str, str], default_ttl: float) -> Optional[float]:
+    """Срок свежести по Cache-Control; None - ответ нельзя сохранять."""
+    ttl = default_ttl
+    for directive in headers.get("Cache-Control", "").lower().split(","):
+        name, _, value = directive.strip().partition("=")
+        if name == "no-store":
+            return None
+        if name == "no-cache":
+            ttl = 0.0
+        elif name == "max-age" and value.strip('"').isdigit():
+            ttl = float(value.strip('"'))
+    return ttl
+
+
+class ResponseCache:
+    """LRU-кэш ответов на max_entries записей со счетчиками попаданий."""
+
+    def __init__(self, max_entries: int = 1024, default_ttl: float = 0.0) -> None:
+        self.max_entries = max_entries
+        # Сколько секунд ответ без Cache-Control считается свежим; 0 - всегда перепроверять
+        self.default_ttl = default_ttl
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        # Число инвалидаций; ответ, полученный после смены epoch, не сохраняется
+        self.epoch = 0
+        # Свежие попадания, перепроверки с ответом 304 и промахи
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """Доля запросов, ответ на которые взят из кэша (свежим или после 304)."""
+        total = self.hits + self.revalidated + self.misses
+        return (self.hits + self.revalidated) / total if total else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Счетчики кэша для метрик и логов."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Возвращает запись (свежую или устаревшую) и отмечает ее как недавно использованную."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def store(self, key: str, data: Any, headers: Mapping[str, str]) -> None:
+        """Сохраняет разобранный ответ, если Cache-Control это разрешает."""
+        ttl = _max_age(headers, self.default_ttl)
+        etag = headers.get("ETag")
+        # Без срока свежести и без ETag запись никогда не пригодится
+        if ttl is None or (ttl <= 0 and etag is None):
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = CacheEntry(data, etag, headers, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def refresh(self, key: str, entry: CacheEntry, headers: Mapping[str, str]) -> None:
+        """Продлевает запись после ответа 304."""
+        ttl = _max_age(headers, self.default_ttl)
+        if ttl is None:
+            self._entries.pop(key, None)
+            return
+        entry.expires = time.monotonic() + ttl
+        entry.etag = headers.get("ETag", entry.etag)
+
+    def invalidate(self, key: str) -> None:
+        """Удаляет запись по URL и отменяет сохранение незавершенных GET."""
+        self.epoch += 1
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Удаляет все записи (например, после пакетных изменений)."""
+        self.epoch += 1
+        self._entries.clear()
@@ -0,0 +1,82 @@
+"""Настройки клиента."""
+
+import copy
+from typing import Optional, Sequence
+
+import aiohttp
+
+from .cache import ResponseCache
+from .retry import CircuitBreaker, RetryPolicy
+
+# Адрес API, если в Configuration не указан host
+DEFAULT_HOST = "http://localhost"
+
+# Таймаут запроса по умолчанию в секундах (как у aiohttp и клиента openapi-generator)
+DEFAULT_REQUEST_TIMEOUT = 5 * 60
+
+
+class Configuration:
+    """Настройки подключения к API."""
+
+    _default: Optional["Configuration"] = None
+
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        ssl_ca_cert: Optional[str] = None,
+        verify_ssl: bool = True,
+        proxy: Optional[str] = None,
+        connection_pool_maxsize: int = 100,
+        request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+        connection_pool_per_host: int = 0,
+        keepalive_timeout: float = 15.0,
+        dns_cache_ttl: Optional[int] = 10,
+        share_session: bool = False,
+        trace_configs: Sequence[aiohttp.TraceConfig] = (),
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        response_cache: Optional[ResponseCache] = None,
+    ) -> None:
+        # Базовый URL API без завершающего слэша
+        self.host = (host or DEFAULT_HOST).rstrip("/")
+        # Проверка TLS-сертификата сервера и файл доверенных CA
+        self.verify_ssl = verify_ssl
+        self.ssl_ca_cert = ssl_ca_cert
+        # HTTP-прокси для всех запросов
+        self.proxy = proxy
+        # Максимальное число одновременных соединений клиента
+        self.connection_pool_maxsize = connection_pool_maxsize
+        # Максимум соединений к одному хосту; 0 - без отдельного ограничения
+        self.connection_pool_per_host = connection_pool_per_host
+        # Сколько секунд простаивающее соединение остается в пуле для повторного использования
+        self.keepalive_timeout = keepalive_timeout
+        # Время жизни кэша DNS-ответов в секундах; None - без срока, 0 - не кэшировать
+        self.dns_cache_ttl = dns_cache_ttl
+        # Общая сессия (и пул соединений) для всех ApiClient с такими же параметрами пула
+        # в пределах event loop; ApiClient.close() ее не закрывает, см. rest.close_shared_sessions
+        self.share_session = share_session
+        # aiohttp.TraceConfig для наблюдения за соединениями и запросами
+        self.trace_configs = list(trace_configs)
+        # Повторы идемпотентных запросов; None - без повторов
+        self.retry_policy = retry_policy
+        # Circuit breaker по хостам; None - выключен
+        self.circuit_breaker = circuit_breaker
+        # Кэш GET-ответов с перепроверкой по ETag; None - выключен.
+        # Модели из кэша общие для всех вызовов: их не следует изменять
+        self.response_cache = response_cache
+        # Таймаут запроса по умолчанию в секундах; None - DEFAULT_REQUEST_TIMEOUT.
+        # Без таймаута зависший сервер блокировал бы вызов навсегда, а retry_policy
+        # не получила бы ошибку, которую можно повторить
+        self.request_timeout = request_timeout
+
+    @classmethod
+    def set_default(cls, default: Optional["Configuration"]) -> None:
+        """Задает настройки, используемые ApiClient без явной конфигурации."""
+        cls._default = default
+
+    @classmethod
+    def get_default(cls) -> "Configuration":
+        """Возвращает копию настроек по умолчанию."""
+        if cls._default is None:
+            return cls()
+        return copy.copy(cls._default)
@@ -0,0 +1,115 @@
+"""Исключения клиента."""
+
+from typing import Any, Optional
+
+
+class OpenApiException(Exception):
+    """Базовое исключение клиента."""
+
+
+class ApiValueError(OpenApiException, ValueError):
+    """Некорректные аргументы вызова API."""
+
+
+class ApiException(OpenApiException):
+    """Сервер ответил кодом вне диапазона 2xx."""
+
+    def __init__(
+        self,
+        status: Optional[int] = None,
+        reason: Optional[str] = None,
+        http_resp: Any = None,
+        *,
+        body: Optional[str] = None,
+        data: Any = None,
+    ) -> None:
+        self.status = status
+        self.reason = reason
+        self.body = body
+        self.data = data
+        self.headers = None
+
+        if http_resp is not None:
+            self.status = http_resp.status
+            self.reason = http_resp.reason
+            self.headers = http_resp.headers
+            if self.body is None:
+                self.body = http_resp.data.decode("utf-8", errors="replace")
+
+    @classmethod
+    def from_response(cls, *, http_resp: Any, body: Optional[str] = None, data: Any = None):
+        """Создает исключение подходящего подкласса по коду ответа."""
+        exception_class = STATUS_EXCEPTIONS.get(http_resp.status)
+        if exception_class is None:
+            exception_class = ServiceException if http_resp.status >= 500 else ApiException
+        return exception_class(http_resp=http_resp, body=body, data=data)
+
+    def __str__(self) -> str:
+        message = f"({self.status})\nReason: {self.reason}\n"
+        if self.headers:
+            message += f"HTTP response headers: {dict(self.headers)}\n"
+        if self.body:
+            message += f"HTTP response body: {self.body}\n"
+        return message
+
+
+class BadRequestException(ApiException):
+    """400 Bad Request."""
+
+
+class UnauthorizedException(ApiException):
+    """401 Unauthorized."""
+
+
+class ForbiddenException(ApiException):
+    """403 Forbidden."""
+
+
+class NotFoundException(ApiException):
+    """404 Not Found."""
+
+
+class ConflictException(ApiException):
+    """409 Conflict."""
+
+
+class PreconditionFailedException(ApiException):
+    """412 Precondition Failed (If-Match не совпал)."""
+
+
+class UnprocessableEntityException(ApiException):
+    """422 Unprocessable Entity."""
+
+
+class ServiceException(ApiException):
+    """5xx - ошибка на стороне сервера."""
+
+
+class DeadlineExceededException(ApiException):
+    """Запрос не завершился до дедлайна пакетного вызова."""
+
+    def __init__(self, reason: str = "Deadline exceeded") -> None:
+        super().__init__(reason=reason)
+
+
+class TransportException(ApiException):
+    """Запрос не дошел до сервера или ответ не получен (ошибка соединения)."""
+
+
+class CircuitOpenException(ApiException):
+    """Circuit breaker хоста открыт: запрос отклонен без обращения к серверу."""
+
+    def __init__(self, host: str) -> None:
+        super().__init__(reason=f"Circuit breaker is open for {host}")
+        self.host = host
+
+
+STATUS_EXCEPTIONS = {
+    400: BadRequestException,
+    401: UnauthorizedException,
+    403: ForbiddenException,
+    404: NotFoundException,
+    409: ConflictException,
+    412: PreconditionFailedException,
+    422: UnprocessableEntityException,
+}
@@ -0,0 +1,58 @@
+"""Базовый класс моделей клиента."""
+
+from abc import ABC, abstractmethod
+from typing import Any, ClassVar, Dict, Tuple
+
+try:
+    import orjson
+
+    def json_dumps(obj: Any) -> bytes:
+        """Сериализует объект в JSON (UTF-8)."""
+        return orjson.dumps(obj)
+
+    json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson необязателен
+    import json
+
+    def json_dumps(obj: Any) -> bytes:
+        """Сериализует объект в JSON (UTF-8)."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    json_loads = json.loads
+
+
+class Model(ABC):
+    """Общая часть моделей: JSON-представление и проверка enum-полей."""
+
+    __slots__ = ()
+
+    # Допустимые значения enum-полей: {имя поля: (значения...)}
+    _enums: ClassVar[Dict[str, Tuple[Any, ...]]] = {}
+
+    def __post_init__(self) -> None:
+        for name, allowed in self._enums.items():
+            value = getattr(self, name)
+            if value is not None and value not in allowed:
+                raise ValueError(f"{name} must be one of {allowed}, got {value!r}")
+
+    @abstractmethod
+    def to_dict(self) -> Dict[str, Any]:
+        """Словарь для JSON: имена полей из спецификации, вложенные модели - словари."""
+
+    @classmethod
+    @abstractmethod
+    def from_dict(cls, obj: Dict[str, Any]):
+        """Создает модель из словаря, разобранного из JSON."""
+
+    def to_json(self) -> str:
+        """Сериализует модель в JSON-строку."""
+        return json_dumps(self.to_dict()).decode("utf-8")
+
+    @classmethod
+    def from_json(cls, json_str: str):
+        """Создает модель из JSON-строки."""
+        return cls.from_dict(json_loads(json_str))
+
+    def to_str(self) -> str:
+        """Строковое представление модели."""
+        return repr(self)
@@ -0,0 +1,131 @@
+"""HTTP-транспорт клиента на aiohttp."""
+
+import asyncio
+import ssl
+from typing import Any, Dict, Hashable, Mapping, Optional, Tuple
+
+import aiohttp
+
+from .configuration import DEFAULT_REQUEST_TIMEOUT, Configuration
+from .exceptions import ApiException, ApiValueError  # noqa: F401 - публичный импорт
+
+# Общие сессии для Configuration(share_session=True): {(event loop, параметры пула): сессия}
+_shared_sessions: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], aiohttp.ClientSession] = {}
+
+
+def _pool_key(configuration: Configuration) -> Hashable:
+    """Параметры, от которых зависит пул соединений; клиенты с равным ключом делят сессию."""
+    return (
+        configuration.connection_pool_maxsize,
+        configuration.connection_pool_per_host,
+        configuration.keepalive_timeout,
+        configuration.dns_cache_ttl,
+        tuple(id(trace_config) for trace_config in configuration.trace_configs),
+    )
+
+
+def create_session(configuration: Configuration) -> aiohttp.ClientSession:
+    """Создает сессию с пулом соединений по настройкам клиента."""
+    connector = aiohttp.TCPConnector(
+        limit=configuration.connection_pool_maxsize,
+        limit_per_host=configuration.connection_pool_per_host,
+        keepalive_timeout=configuration.keepalive_timeout,
+        ttl_dns_cache=configuration.dns_cache_ttl,
+        use_dns_cache=configuration.dns_cache_ttl != 0,
+    )
+    return aiohttp.ClientSession(
+        connector=connector, trust_env=True, trace_configs=configuration.trace_configs or None
+    )
+
+
+def shared_session(configuration: Configuration) -> aiohttp.ClientSession:
+    """Возвращает общую сессию текущего event loop для параметров пула клиента."""
+    loop = asyncio.get_running_loop()
+    # Сессии закрытых loop больше не пригодны; убираем их при каждом обращении
+    for key in [key for key in _shared_sessions if key[0].is_closed()]:
+        del _shared_sessions[key]
+
+    key = (loop, _pool_key(configuration))
+    session = _shared_sessions.get(key)
+    if session is None or session.closed:
+        session = _shared_sessions[key] = create_session(configuration)
+    return session
+
+
+async def close_shared_sessions() -> None:
+    """Закрывает общие сессии текущего event loop (например, при остановке сервиса)."""
+    loop = asyncio.get_running_loop()
+    for key in [key for key in _shared_sessions if key[0] is loop]:
+        await _shared_sessions.pop(key).close()
+
+
+class RESTResponse:
+    """Ответ сервера с уже прочитанным телом."""
+
+    __slots__ = ("response", "status", "reason", "headers", "data")
+
+    def __init__(self, response: aiohttp.ClientResponse, data: bytes) -> None:
+        self.response = response
+        self.status = response.status
+        self.reason = response.reason
+        self.headers = response.headers
+        self.data = data
+
+    def getheaders(self) -> Mapping[str, str]:
+        """Возвращает заголовки ответа."""
+        return self.headers
+
+    def getheader(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Возвращает заголовок ответа."""
+        return self.headers.get(name, default)
+
+
+class RESTClientObject:
+    """Выполняет HTTP-запросы через aiohttp.ClientSession."""
+
+    def __init__(self, configuration: Configuration) -> None:
+        self.configuration = configuration
+        self.pool_manager: Optional[aiohttp.ClientSession] = None
+
+        if configuration.ssl_ca_cert:
+            self._ssl: Any = ssl.create_default_context(cafile=configuration.ssl_ca_cert)
+        elif not configuration.verify_ssl:
+            self._ssl = False
+        else:
+            self._ssl = True
+
+    def _session(self) -> aiohttp.ClientSession:
+        if self.pool_manager is None or self.pool_manager.closed:
+            if self.configuration.share_session:
+                self.pool_manager = shared_session(self.configuration)
+            else:
+                self.pool_manager = create_session(self.configuration)
+        return self.pool_manager
+
+    async def close(self) -> None:
+        """Закрывает собственную сессию и ее соединения; общую сессию только отпускает."""
+        if self.pool_manager is not None and not self.configuration.share_session:
+            await self.pool_manager.close()
+        self.pool_manager = None
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+        body: Optional[bytes] = None,
+        _request_timeout: Optional[float] = None,
+    ) -> RESTResponse:
+        """Выполняет запрос и читает тело ответа."""
+        timeout = _request_timeout or self.configuration.request_timeout or DEFAULT_REQUEST_TIMEOUT
+        async with self._session().request(
+            method,
+            url,
+            headers=headers,
+            data=body,
+            proxy=self.configuration.proxy,
+            ssl=self._ssl,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as response:
+            data = await response.read()
+        return RESTResponse(response, data)
@@ -0,0 +1,140 @@
+"""Политика повторов и circuit breaker для запросов клиента."""
+
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Optional
+
+from .exceptions import CircuitOpenException
+
+
+class RetryBudget:
+    """Бюджет повторов (token bucket): запросы пополняют его, повторы расходуют."""
+
+    def __init__(self, ratio: float = 0.2, capacity: float = 10.0) -> None:
+        self.ratio = ratio
+        self.capacity = capacity
+        self.tokens = capacity
+
+    def deposit(self) -> None:
+        """Учитывает новый (не повторный) запрос."""
+        self.tokens = min(self.capacity, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Забирает токен на повтор; False, если бюджет исчерпан."""
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+@dataclass
+class RetryPolicy:
+    """Когда и через сколько повторять запрос."""
+
+    # Всего попыток, включая первую
+    max_attempts: int = 3
+    # Задержка перед n-м повтором - случайная в [0, min(backoff_max, backoff_base * 2**n)]
+    backoff_base: float = 0.1
+    backoff_max: float = 2.0
+    # Коды ответа, после которых запрос повторяется
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    # Повторяются только идемпотентные методы: POST и PATCH могут создать дубликаты
+    retry_methods: FrozenSet[str] = frozenset({"GET", "PUT", "DELETE"})
+    # Доля повторов от числа запросов и запас повторов для редких ошибок
+    budget_ratio: float = 0.2
+    budget_capacity: float = 10.0
+    budget: RetryBudget = field(init=False, repr=False)
+    # Выполнено повторов и повторов, отклоненных бюджетом
+    retries: int = field(default=0, init=False)
+    budget_exhausted: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        self.budget = RetryBudget(self.budget_ratio, self.budget_capacity)
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Задержка перед повтором номер attempt (с 0); учитывает Retry-After в секундах."""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, min(float(retry_after), self.backoff_max))
+        return delay
+
+    def should_retry(self, method: str, attempt: int, status: Optional[int] = None) -> bool:
+        """Решает, повторять ли попытку attempt (с 0); status None - ошибка соединения."""
+        if method not in self.retry_methods or attempt + 1 >= self.max_attempts:
+            return False
+        if status is not None and status not in self.retry_statuses:
+            return False
+        if not self.budget.withdraw():
+            self.budget_exhausted += 1
+            return False
+        self.retries += 1
+        return True
+
+
+class _HostCircuit:
+    """Состояние circuit breaker одного хоста."""
+
+    __slots__ = ("failures", "opened_at", "probing")
+
+    def __init__(self) -> None:
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.probing = False
+
+
+class CircuitBreaker:
+    """Circuit breaker по хостам."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 10.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._hosts: Dict[str, _HostCircuit] = {}
+
+    def _circuit(self, host: str) -> _HostCircuit:
+        circuit = self._hosts.get(host)
+        if circuit is None:
+            circuit = self._hosts[host] = _HostCircuit()
+        return circuit
+
+    def state(self, host: str) -> str:
+        """Текущее состояние цепи хоста."""
+        circuit = self._circuit(host)
+        if circuit.opened_at is None:
+            return self.CLOSED
+        if circuit.probing or time.monotonic() - circuit.opened_at >= self.recovery_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def before_request(self, host: str) -> None:
+        """Пропускает запрос или поднимает CircuitOpenException."""
+        circuit = self._circuit(host)
+        if circuit.opened_at is None:
+            return
+        if not circuit.probing and time.monotonic() - circuit.opened_at >= self.recovery_timeout:
+            circuit.probing = True
+            return
+        raise CircuitOpenException(host)
+
+    def record_success(self, host: str) -> None:
+        """Успешный ответ: сбрасывает счетчик ошибок и закрывает цепь."""
+        circuit = self._circuit(host)
+        circuit.failures = 0
+        circuit.opened_at = None
+        circuit.probing = False
+
+    def record_failure(self, host: str) -> None:
+        """Ошибка соединения или 5xx: при превышении порога открывает цепь."""
+        circuit = self._circuit(host)
+        circuit.failures += 1
+        if circuit.probing or circuit.failures >= self.failure_threshold:
+            circuit.opened_at = time.monotonic()
+        circuit.probing = False
+
+    def record_cancelled(self, host: str) -> None:
+        """Запрос отменен без ответа: пробный запрос можно выполнить снова."""
+        self._circuit(host).probing = False
@@ -1,25 +1,94 @@
 """Конфигурация pytest и фикстуры для тестов клиента."""
 
 import asyncio
+import atexit
+import functools
+import importlib
+import shutil
+import subprocess
 import sys
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 from aiohttp.test_utils import TestServer
 
 # Добавляем пути для импортов (нужно сделать до импорта app.*)
 project_root = Path(__file__).parent.parent.parent
-generated_path = project_root / "client" / "generated"
 server_path = project_root / "server"
+spec_path = project_root / "openapi" / "openapi.yaml"
 
-sys.path.insert(0, str(generated_path))
+sys.path.insert(0, str(project_root / "client"))
 sys.path.insert(0, str(server_path))
+# Скрипты generate_client.py и export_openapi.py; в конце, чтобы не перекрывать пакеты выше
+sys.path.append(str(project_root))
+
+from codegen import generate  # noqa: E402
+
+# Клиент генерируется встроенным генератором во временную директорию,
+# поэтому тесты не зависят от Java и от содержимого client/generated.
+# Клиент openapi-generator (бэкенд java) генерируется рядом под именем
+# JAVA_PACKAGE только для тестов фикстуры api и только при наличии Java
+JAVA_PACKAGE = "openapi_client_java"
+generated_path = Path(tempfile.mkdtemp(prefix="openapi_client_"))
+generate(spec_path, generated_path)
+atexit.register(shutil.rmtree, generated_path, ignore_errors=True)
+sys.path.insert(0, str(generated_path))
 
 from app.database import Database  # noqa: E402
 from app.main import create_app  # noqa: E402
 
 
+@functools.lru_cache(maxsize=None)
+def generate_java_client() -> str:
+    """Генерирует клиент openapi-generator во временную директорию; возвращает ошибку или ''."""
+    generator = shutil.which("openapi-generator-cli") or shutil.which("openapi-generator")
+    if shutil.which("java") is None or generator is None:
+        return "Java или openapi-generator не установлены"
+
+    output = generated_path / "java"
+    cmd = [
+        generator,
+        "generate",
+        "-i",
+        str(spec_path),
+        "-o",
+        str(output),
+        "-g",
+        "python",
+        f"--additional-properties=library=asyncio,packageName={JAVA_PACKAGE}",
+        "--skip-validate-spec",
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+    if result.returncode != 0:
+        return f"openapi-generator завершился с ошибкой: {result.stderr or result.stdout}"
+    sys.path.insert(0, str(output))
+    return ""
+
+
+@pytest.fixture(scope="session", params=["python", "java"])
+def api(request):
+    """Базовый API сгенерированного клиента для каждого бэкенда генерации."""
+    package = "openapi_client"
+    if request.param == "java":
+        error = generate_java_client()
+        if error:
+            pytest.skip(error)
+        package = JAVA_PACKAGE
+    try:
+        return SimpleNamespace(
+            ApiClient=importlib.import_module(package).ApiClient,
+            Configuration=importlib.import_module(package).Configuration,
+            TasksApi=importlib.import_module(f"{package}.api.tasks_api").TasksApi,
+            TaskCreate=importlib.import_module(f"{package}.models.task_create").TaskCreate,
+            TaskUpdate=importlib.import_module(f"{package}.models.task_update").TaskUpdate,
+            ApiException=importlib.import_module(f"{package}.rest").ApiException,
+        )
+    except ImportError as e:
+        pytest.skip(f"Клиент бэкенда {request.param} не импортируется: {e}")
+
+
 @pytest.fixture
 def event_loop():
     """Создает event loop для тестов."""
@@ -0,0 +1,126 @@
+"""Тесты пакетных вызовов клиента (TasksApi.get_many, run_many)."""
+
+import asyncio
+
+import aiohttp
+import pytest
+from openapi_client import (
+    ApiClient,
+    Configuration,
+    DeadlineExceededException,
+    NotFoundException,
+    TasksApi,
+    TransportException,
+    run_many,
+)
+from openapi_client.models.task_create import TaskCreate
+
+
+@pytest.mark.asyncio
+class TestGetMany:
+    """Тесты TasksApi.get_many против тестового сервера."""
+
+    async def test_order_and_per_item_errors(self, base_url):
+        """Тест: результаты идут в порядке ids, отсутствующая задача - ошибка элемента."""
+        async with ApiClient(Configuration(host=base_url)) as api_client:
+            tasks_api = TasksApi(api_client)
+            created = [
+                await tasks_api.tasks_post(TaskCreate(title=f"Задача {i}")) for i in range(5)
+            ]
+            ids = [str(task.id) for task in reversed(created)] + ["99999"]
+
+            results = await tasks_api.get_many(ids, concurrency=2)
+
+        assert [result.key for result in results] == ids
+        assert [result.data.title for result in results[:5]] == [
+            f"Задача {i}" for i in reversed(range(5))
+        ]
+        assert all(result.ok for result in results[:5])
+        assert isinstance(results[5].error, NotFoundException)
+        assert results[5].error.status == 404
+        with pytest.raises(NotFoundException):
+            results[5].get()
+
+    async def test_empty(self, base_url):
+        """Тест: пустой список ids не выполняет запросов."""
+        async with ApiClient(Configuration(host=base_url)) as api_client:
+            assert await TasksApi(api_client).get_many([]) == []
+
+
+@pytest.mark.asyncio
+class TestRunMany:
+    """Тесты run_many на заглушках вызовов."""
+
+    async def test_concurrency_is_bounded(self):
+        """Тест: одновременно выполняется не больше concurrency вызовов."""
+        in_flight = 0
+        peak = 0
+
+        async def call(key):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return key * 2
+
+        results = await run_many(range(20), call, concurrency=3)
+
+        assert peak == 3
+        assert [result.data for result in results] == [key * 2 for key in range(20)]
+
+    async def test_deadline(self):
+        """Тест: вызовы, не успевшие до дедлайна, отменяются и получают ошибку."""
+
+        async def call(key):
+            await asyncio.sleep(0 if key < 2 else 10)
+            return key
+
+        results = await run_many(range(4), call, concurrency=4, deadline=0.05)
+
+        assert [result.data for result in results[:2]] == [0, 1]
+        assert all(isinstance(result.error, DeadlineExceededException) for result in results[2:])
+
+    async def test_cancel_stops_workers(self):
+        """Тест: отмена вызывающего отменяет воркеры, новые вызовы не начинаются."""
+        started = []
+
+        async def call(key):
+            started.append(key)
+            await asyncio.sleep(0.01)
+            return key
+
+        batch = asyncio.ensure_future(run_many(range(20), call, concurrency=2))
+        await asyncio.sleep(0.015)
+        batch.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await batch
+        calls = len(started)
+        await asyncio.sleep(0.05)
+
+        assert len(started) == calls < 20
+
+    async def test_transport_error(self):
+        """Тест: ошибка соединения становится TransportException элемента."""
+
+        async def call(key):
+            raise aiohttp.ClientConnectionError("connection refused")
+
+        results = await run_many([1], call)
+
+        assert isinstance(results[0].error, TransportException)
+        assert isinstance(results[0].error.__cause__, aiohttp.ClientConnectionError)
+
+    async def test_unexpected_error_propagates(self):
+        """Тест: ошибка, не связанная с вызовом API, не превращается в результат."""
+
+        async def call(key):
+            raise TypeError("bug")
+
+        with pytest.raises(TypeError):
+            await run_many([1, 2], call)
+
+    async def test_invalid_concurrency(self):
+        """Тест: concurrency меньше 1 отклоняется."""
+        with pytest.raises(ValueError):
+            await run_many([1], asyncio.sleep, concurrency=0)
@@ -2,27 +2,18 @@
 
 import pytest
 
-try:
-    from openapi_client import ApiClient, Configuration
-    from openapi_client.api.tasks_api import TasksApi
-    from openapi_client.models.task_create import TaskCreate
-    from openapi_client.models.task_update import TaskUpdate
-    from openapi_client.rest import ApiException
-except ImportError:
-    pytest.skip("Сгенерированный клиент не найден", allow_module_level=True)
-
 
 @pytest.mark.asyncio
 class TestClientIntegration:
     """Интеграционные тесты для сгенерированного клиента."""
 
-    async def test_create_task(self, base_url):
+    async def test_create_task(self, api, base_url):
         """Тест создания задачи через клиент."""
-        config = Configuration(host=base_url)
-        async with ApiClient(config) as api_client:
-            tasks_api = TasksApi(api_client)
+        config = api.Configuration(host=base_url)
+        async with api.ApiClient(config) as api_client:
+            tasks_api = api.TasksApi(api_client)
 
-            task_create = TaskCreate(
+            task_create = api.TaskCreate(
                 title="Тестовая задача",
                 description="Описание тестовой задачи",
                 status="pending",
@@ -36,14 +27,14 @@ class TestClientIntegration:
             assert created_task.status == task_create.status
             assert created_task.created_at is not None
 
-    async def test_get_task(self, base_url):
+    async def test_get_task(self, api, base_url):
         """Тест получения задачи через клиент."""
-        config = Configuration(host=base_url)
-        async with ApiClient(config) as api_client:
-            tasks_api = TasksApi(api_client)
+        config = api.Configuration(host=base_url)
+        async with api.ApiClient(config) as api_client:
+            tasks_api = api.TasksApi(api_client)
 
             # Создаем задачу
-            task_create = TaskCreate(title="Задача для получения")
+            task_create = api.TaskCreate(title="Задача для получения")
             created_task = await tasks_api.tasks_post(task_create)
 
             # Получаем задачу
@@ -53,47 +44,47 @@ class TestClientIntegration:
             assert task.title == created_task.title
             assert task.status == created_task.status
 
-    async def test_get_task_not_found(self, base_url):
+    async def test_get_task_not_found(self, api, base_url):
         """Тест получения несуществующей задачи через клиент."""
-        config = Configuration(host=base_url)
-        async with ApiClient(config) as api_client:
-            tasks_api = TasksApi(api_client)
+        config = api.Configuration(host=base_url)
+        async with api.ApiClient(config) as api_client:
+            tasks_api = api.TasksApi(api_client)
 
-            with pytest.raises(ApiException) as exc_info:
+            with pytest.raises(api.ApiException) as exc_info:
                 await tasks_api.tasks_id_get("99999")
 
             assert exc_info.value.status == 404
 
-    async def test_update_task_partial(self, base_url):
+    async def test_update_task_partial(self, api, base_url):
         """Тест частичного обновления задачи через клиент."""
-        config = Configuration(host=base_url)
-        async with ApiClient(config) as api_client:
-            tasks_api = TasksApi(api_client)
+        config = api.Configuration(host=base_url)
+        async with api.ApiClient(config) as api_client:
+            tasks_api = api.TasksApi(api_client)
 
             # Создаем задачу
-            task_create = TaskCreate(title="Задача для обновления", status="pending")
+            task_create = api.TaskCreate(title="Задача для обновления", status="pending")
             created_task = await tasks_api.tasks_post(task_create)
 
             # Обновляем только status
-            task_update = TaskUpdate(status="in_progress")
+            task_update = api.TaskUpdate(status="in_progress")
             updated_task = await tasks_api.tasks_id_put(str(created_task.id), task_update)
 
             assert updated_task.id == created_task.id
             assert updated_task.status == "in_progress"
             assert updated_task.title == created_task.title
 
-    async def test_update_task_full(self, base_url):
+    async def test_update_task_full(self, api, base_url):
         """Тест полного обновления задачи через клиент."""
-        config = Configuration(host=base_url)
-        async with ApiClient(config) as api_client:
-            tasks_api = TasksApi(api_client)
+        config = api.Configuration(host=base_url)
+        async with api.ApiClient(config) as api_client:
+            tasks_api = api.TasksApi(api_client)
 
             # Создаем задачу
-            task_create = TaskCreate(title="Исходная задача", status="pending")
+            task_create = api.TaskCreate(title="Исходная задача", status="pending")
             created_task = await tasks_api.tasks_post(task_create)
 
             # Обновляем все поля
-            task_update = TaskUpdate(
+            task_update = api.TaskUpdate(
                 title="Обновленная задача",
                 description="Новое описание",
                 status="completed",
@@ -104,57 +95,57 @@ class TestClientIntegration:
             assert updated_task.description == task_update.description
             assert updated_task.status == task_update.status
 
-    async def test_update_task_not_found(self, base_url):
+    async def test_update_task_not_found(self, api, base_url):
         """Тест обновления несуществующей задачи через клиент."""
-        config = Configuration(host=base_url)
-        async with ApiClient(config) as api_client:
-            tasks_api = TasksApi(api_client)
+        config = api.Configuration(host=base_url)
+        async with api.ApiClient(config) as api_client:
+            tasks_api = api.TasksApi(api_client)
 
-            task_update = TaskUpdate(status="completed")
+            task_update = api.TaskUpdate(status="completed")
 
-            with pytest.raises(ApiException) as exc_info:
+            with pytest.raises(api.ApiException) as exc_info:
                 await tasks_api.tasks_id_put("99999", task_update)
 
             assert exc_info.value.status == 404
 
-    async def test_delete_task(self, base_url):
+    async def test_delete_task(self, api, base_url):
         """Тест удаления задачи через клиент."""
-        config = Configuration(host=base_url)
-        async with ApiClient(config) as api_client:
-            tasks_api = TasksApi(api_client)
+        config = api.Configuration(host=base_url)
+        async with api.ApiClient(config) as api_client:
+            tasks_api = api.TasksApi(api_client)
 
             # Создаем задачу
-            task_create = TaskCreate(title="Задача для удаления")
+            task_create = api.TaskCreate(title="Задача для удаления")
             created_task = await tasks_api.tasks_post(task_create)
 
             # Удаляем задачу
             await tasks_api.tasks_id_delete(str(created_task.id))
 
             # Проверяем, что задача удалена
-            with pytest.raises(ApiException) as exc_info:
+            with pytest.raises(api.ApiException) as exc_info:
                 await tasks_api.tasks_id_get(str(created_task.id))
 
             assert exc_info.value.status == 404
 
-    async def test_delete_task_not_found(self, base_url):
+    async def test_delete_task_not_found(self, api, base_url):
         """Тест удаления несуществующей задачи через клиент."""
-        config = Configuration(host=base_url)
-        async with ApiClient(config) as api_client:
-            tasks_api = TasksApi(api_client)
+        config = api.Configuration(host=base_url)
+        async with api.ApiClient(config) as api_client:
+            tasks_api = api.TasksApi(api_client)
 
-            with pytest.raises(ApiException) as exc_info:
+            with pytest.raises(api.ApiException) as exc_info:
                 await tasks_api.tasks_id_delete("99999")
 
             assert exc_info.value.status == 404
 
-    async def test_full_workflow(self, base_url):
+    async def test_full_workflow(self, api, base_url):
         """Тест полного workflow: создание -> получение -> обновление -> удаление."""
-        config = Configuration(host=base_url)
-        async with ApiClient(config) as api_client:
-            tasks_api = TasksApi(api_client)
+        config = api.Configuration(host=base_url)
+        async with api.ApiClient(config) as api_client:
+            tasks_api = api.TasksApi(api_client)
 
             # 1. Создаем задачу
-            task_create = TaskCreate(
+            task_create = api.TaskCreate(
                 title="Workflow задача",
                 description="Тест полного цикла",
                 status="pending",
@@ -167,12 +158,12 @@ class TestClientIntegration:
             assert task.title == "Workflow задача"
 
             # 3. Обновляем задачу
-            task_update = TaskUpdate(status="in_progress")
+            task_update = api.TaskUpdate(status="in_progress")
             updated_task = await tasks_api.tasks_id_put(str(created_task.id), task_update)
             assert updated_task.status == "in_progress"
 
             # 4. Обновляем еще раз
-            task_update2 = TaskUpdate(status="completed")
+            task_update2 = api.TaskUpdate(status="completed")
             completed_task = await tasks_api.tasks_id_put(str(created_task.id), task_update2)
             assert completed_task.status == "completed"
 
@@ -180,6 +171,6 @@ class TestClientIntegration:
             await tasks_api.tasks_id_delete(str(created_task.id))
 
             # 6. Проверяем, что задача удалена
-            with pytest.raises(ApiException) as exc_info:
+            with pytest.raises(api.ApiException) as exc_info:
                 await tasks_api.tasks_id_get(str(created_task.id))
             assert exc_info.value.status == 404
@@ -0,0 +1,122 @@
+"""Тесты встроенного генератора клиента (client/codegen)."""
+
+import compileall
+import time
+
+import pytest
+from codegen import fingerprint, generate
+from openapi_client import ApiClient, ApiResponse, Configuration, TasksApi
+from openapi_client.model import Model
+from openapi_client.models.task_bulk_item_result import TaskBulkItemResult
+from openapi_client.models.task_create import TaskCreate
+from openapi_client.models.task_update import TaskUpdate
+
+from .conftest import spec_path
+
+
+class TestGenerator:
+    """Тесты генерации пакета."""
+
+    def test_generate_fast_and_compiles(self, tmp_path):
+        """Тест: генерация укладывается в секунду, а результат компилируется."""
+        started = time.perf_counter()
+        files = generate(spec_path, tmp_path)
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 1.0
+        assert tmp_path / "openapi_client" / "api" / "tasks_api.py" in files
+        assert tmp_path / "openapi_client" / "models" / "task_create.py" in files
+        assert compileall.compile_dir(str(tmp_path), quiet=1)
+
+    def test_generate_removes_stale_modules(self, tmp_path):
+        """Тест: повторная генерация удаляет модули, которых больше нет в спецификации."""
+        generate(spec_path, tmp_path)
+        stale = tmp_path / "openapi_client" / "models" / "removed_model.py"
+        stale.write_text("", encoding="utf-8")
+
+        generate(spec_path, tmp_path)
+
+        assert not stale.exists()
+
+    def test_fingerprint_is_stable(self):
+        """Тест: отпечаток генератора не меняется между вызовами."""
+        assert fingerprint() == fingerprint()
+
+
+class TestModels:
+    """Тесты сгенерированных моделей."""
+
+    def test_slots_and_defaults(self):
+        """Тест: модели slotted, значения по умолчанию берутся из спецификации."""
+        task = TaskCreate(title="Задача")
+
+        assert task.status == "pending"
+        assert not hasattr(task, "__dict__")
+
+    def test_to_dict_skips_unset_fields(self):
+        """Тест: to_dict не включает незаданные поля."""
+        assert TaskUpdate(status="completed").to_dict() == {"status": "completed"}
+
+    def test_enum_is_validated(self):
+        """Тест: недопустимое значение enum отклоняется."""
+        with pytest.raises(ValueError):
+            TaskCreate(title="Задача", status="unknown")
+
+    def test_model_requires_dict_methods(self):
+        """Тест: модель без to_dict/from_dict нельзя создать, сгенерированные их определяют."""
+
+        class Incomplete(Model):
+            __slots__ = ()
+
+        with pytest.raises(TypeError):
+            Incomplete()
+        assert not TaskCreate.__abstractmethods__
+
+    def test_nested_roundtrip(self):
+        """Тест: вложенная модель переживает to_json/from_json."""
+        item = TaskBulkItemResult.from_dict(
+            {
+                "id": 1,
+                "code": 200,
+                "task": {
+                    "id": 1,
+                    "title": "Задача",
+                    "status": "pending",
+                    "created_at": "2024-01-01T00:00:00",
+                },
+                "unknown": "игнорируется",
+            }
+        )
+
+        assert item.task.title == "Задача"
+        assert TaskBulkItemResult.from_json(item.to_json()) == item
+
+
+@pytest.mark.asyncio
+class TestOperations:
+    """Тесты операций, которых нет в клиенте openapi-generator по умолчанию."""
+
+    async def test_list_and_export(self, base_url):
+        """Тест: список с фильтром по query и NDJSON-выгрузка разбираются в модели."""
+        async with ApiClient(Configuration(host=base_url)) as api_client:
+            tasks_api = TasksApi(api_client)
+            await tasks_api.tasks_post(TaskCreate(title="Первая"))
+            await tasks_api.tasks_post(TaskCreate(title="Вторая", status="completed"))
+
+            page = await tasks_api.tasks_get(status="completed", limit=10)
+            exported = await tasks_api.tasks_export_get()
+
+        assert [task.title for task in page.items] == ["Вторая"]
+        assert [task.title for task in exported] == ["Первая", "Вторая"]
+
+    async def test_with_http_info(self, base_url):
+        """Тест: *_with_http_info возвращает код и заголовки ответа."""
+        async with ApiClient(Configuration(host=base_url)) as api_client:
+            response = await TasksApi(api_client).tasks_post_with_http_info(
+                TaskCreate(title="Задача")
+            )
+
+        assert isinstance(response, ApiResponse)
+        assert response.status_code == 201
+        assert response.headers["ETag"]
+        assert response.data.title == "Задача"
@@ -0,0 +1,176 @@
+"""Тесты кэшей generate_client.py: ключа генерации и найденной команды генератора."""
+
+import shutil
+import sys
+
+import pytest
+
+import generate_client
+
+from .conftest import spec_path
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Временная рабочая директория со спецификацией и сброшенным состоянием скрипта."""
+    (tmp_path / "openapi").mkdir()
+    shutil.copy(spec_path, tmp_path / "openapi" / "openapi.yaml")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(generate_client, "OPENAPI_GENERATOR_CMD", None)
+    monkeypatch.setattr(generate_client, "OPENAPI_GENERATOR_VERSION", None)
+    monkeypatch.delenv("OPENAPI_GENERATOR_VERSION", raising=False)
+    return tmp_path
+
+
+@pytest.fixture
+def generator(workdir):
+    """Поддельная npm-обертка openapi-generator-cli со скачанным jar версии 7.1.0."""
+    tool = workdir / "tool"
+    (tool / "versions").mkdir(parents=True)
+    (tool / "versions" / "7.1.0.jar").write_bytes(b"jar 7.1.0")
+    script = tool / "openapi-generator-cli"
+    script.write_text("#!/bin/sh\necho 7.1.0\n", encoding="utf-8")
+    script.chmod(0o755)
+    return script
+
+
+def run_main(monkeypatch, *args):
+    """Запускает generate_client.main с аргументами args; возвращает вызванные генераторы."""
+    calls = []
+
+    def generate(backend):
+        calls.append(backend)
+        generate_client.OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        (generate_client.OUTPUT_DIR / "module.py").write_text("", encoding="utf-8")
+        return True
+
+    def generate_native(codegen):
+        return generate("python")
+
+    def generate_java():
+        return generate("java")
+
+    monkeypatch.setattr(generate_client, "generate_client_native", generate_native)
+    monkeypatch.setattr(generate_client, "generate_client", generate_java)
+    monkeypatch.setattr(sys, "argv", ["generate_client.py", *args])
+    generate_client.main()
+    return calls
+
+
+class TestGenerationKey:
+    """Тесты пропуска генерации по ключу."""
+
+    def test_hit_when_nothing_changed(self, workdir, monkeypatch):
+        """Тест: повторный запуск без изменений не вызывает генератор."""
+        assert run_main(monkeypatch) == ["python"]
+        assert run_main(monkeypatch) == []
+
+    def test_miss_when_spec_changed(self, workdir, monkeypatch):
+        """Тест: измененная спецификация генерируется заново."""
+        run_main(monkeypatch)
+        with open(generate_client.OPENAPI_FILE, "a", encoding="utf-8") as spec:
+            spec.write("\n# изменение\n")
+
+        assert run_main(monkeypatch) == ["python"]
+
+    def test_miss_when_output_removed(self, workdir, monkeypatch):
+        """Тест: без сгенерированных модулей ключ не считается актуальным."""
+        run_main(monkeypatch)
+        (generate_client.OUTPUT_DIR / "module.py").unlink()
+
+        assert run_main(monkeypatch) == ["python"]
+
+    def test_force(self, workdir, monkeypatch):
+        """Тест: --force генерирует клиент, даже если ключ совпадает."""
+        run_main(monkeypatch)
+
+        assert run_main(monkeypatch, "--force") == ["python"]
+
+    def test_key_depends_on_options_and_version(self, workdir, monkeypatch):
+        """Тест: ключ меняется вместе с бэкендом, параметрами и версией генератора."""
+        generate_client.OPENAPI_GENERATOR_VERSION = "7.1.0"
+        key = generate_client.generation_key("java")
+
+        assert generate_client.generation_key("java") == key
+        assert generate_client.generation_key("python") != key
+        monkeypatch.setattr(generate_client, "GENERATOR_OPTIONS", ["-g", "python"])
+        assert generate_client.generation_key("java") != key
+        monkeypatch.undo()
+        generate_client.OPENAPI_GENERATOR_VERSION = "7.2.0"
+        assert generate_client.generation_key("java") != key
+
+
+class TestGeneratorCache:
+    """Тесты кэша найденной команды генератора."""
+
+    def save(self, generator):
+        """Сохраняет команду generator в кэш и сбрасывает ее в модуле."""
+        generate_client.OPENAPI_GENERATOR_CMD = [str(generator)]
+        generate_client.OPENAPI_GENERATOR_VERSION = "7.1.0"
+        generate_client.save_generator_cache()
+        generate_client.OPENAPI_GENERATOR_CMD = None
+        generate_client.OPENAPI_GENERATOR_VERSION = None
+
+    def test_hit_when_nothing_changed(self, generator):
+        """Тест: без изменений команда и версия берутся из кэша."""
+        self.save(generator)
+
+        assert generate_client.load_generator_cache()
+        assert generate_client.OPENAPI_GENERATOR_CMD == [str(generator)]
+        assert generate_client.OPENAPI_GENERATOR_VERSION == "7.1.0"
+
+    def test_fingerprint_includes_jars(self, generator):
+        """Тест: jar из versions/ входит в отпечаток."""
+        files = generate_client.generator_files([str(generator)])
+
+        assert generator.parent / "versions" / "7.1.0.jar" in files
+
+    def test_miss_when_jar_downloaded(self, generator):
+        """Тест: npm-обертка скачала jar новой версии - кэш недействителен."""
+        self.save(generator)
+        (generator.parent / "versions" / "7.2.0.jar").write_bytes(b"jar 7.2.0")
+
+        assert not generate_client.load_generator_cache()
+
+    def test_miss_when_command_changed(self, generator):
+        """Тест: обновленная на месте команда генератора сбрасывает кэш."""
+        self.save(generator)
+        generator.write_text("#!/bin/sh\necho 7.2.0 # обновлено\n", encoding="utf-8")
+
+        assert not generate_client.load_generator_cache()
+
+    def test_miss_when_version_pinned(self, generator, workdir, monkeypatch):
+        """Тест: закрепление версии в openapitools.json или окружении сбрасывает кэш."""
+        self.save(generator)
+        (workdir / "openapitools.json").write_text('{"version": "7.2.0"}', encoding="utf-8")
+        assert not generate_client.load_generator_cache()
+
+        self.save(generator)
+        monkeypatch.setenv("OPENAPI_GENERATOR_VERSION", "7.2.0")
+        assert not generate_client.load_generator_cache()
+
+    def test_miss_when_command_removed(self, generator):
+        """Тест: удаленная команда генератора сбрасывает кэш."""
+        self.save(generator)
+        generator.unlink()
+
+        assert not generate_client.load_generator_cache()
+
+    def test_force_skips_cache(self, generator, monkeypatch):
+        """Тест: --force ищет генератор заново, даже если кэш действителен."""
+        self.save(generator)
+        lookups = []
+
+        def check_openapi_generator():
+            lookups.append(True)
+            generate_client.OPENAPI_GENERATOR_CMD = [str(generator)]
+            generate_client.OPENAPI_GENERATOR_VERSION = "7.1.0"
+            return True
+
+        monkeypatch.setattr(generate_client, "check_java", lambda: True)
+        monkeypatch.setattr(generate_client, "check_openapi_generator", check_openapi_generator)
+
+        assert run_main(monkeypatch, "--backend", "java") == ["java"]
+        assert lookups == []
+        assert run_main(monkeypatch, "--backend", "java", "--force") == ["java"]
+        assert lookups == [True]
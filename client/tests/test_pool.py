@@ -0,0 +1,91 @@
+"""Тесты настроек пула соединений сгенерированного клиента."""
+
+import aiohttp
+import pytest
+from openapi_client import ApiClient, Configuration, HealthApi, close_shared_sessions
+
+
+def connection_counter():
+    """TraceConfig, считающий новые и повторно использованные соединения."""
+    counts = {"created": 0, "reused": 0}
+
+    async def on_create(session, context, params):
+        counts["created"] += 1
+
+    async def on_reuse(session, context, params):
+        counts["reused"] += 1
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_connection_create_end.append(on_create)
+    trace_config.on_connection_reuseconn.append(on_reuse)
+    return trace_config, counts
+
+
+async def run_clients(configuration, clients: int, requests: int) -> None:
+    """Последовательно открывает clients клиентов, каждый делает requests запросов."""
+    for _ in range(clients):
+        async with ApiClient(configuration) as api_client:
+            health_api = HealthApi(api_client)
+            for _ in range(requests):
+                await health_api.health_get()
+
+
+@pytest.mark.asyncio
+class TestConnectionPool:
+    """Тесты пула соединений и общей сессии."""
+
+    async def test_connector_settings(self, base_url):
+        """Тест: лимиты пула из Configuration передаются в коннектор."""
+        configuration = Configuration(
+            host=base_url, connection_pool_maxsize=7, connection_pool_per_host=3
+        )
+        async with ApiClient(configuration) as api_client:
+            await HealthApi(api_client).health_get()
+            connector = api_client.rest_client.pool_manager.connector
+
+            assert connector.limit == 7
+            assert connector.limit_per_host == 3
+
+    async def test_own_session_per_client(self, base_url):
+        """Тест: без share_session каждый клиент открывает свое соединение."""
+        trace_config, counts = connection_counter()
+        configuration = Configuration(host=base_url, trace_configs=[trace_config])
+
+        await run_clients(configuration, clients=3, requests=5)
+
+        assert counts["created"] == 3
+
+    async def test_shared_session_reuses_connection(self, base_url):
+        """Тест: с share_session все клиенты используют одно keep-alive соединение."""
+        trace_config, counts = connection_counter()
+        configuration = Configuration(
+            host=base_url, share_session=True, trace_configs=[trace_config]
+        )
+
+        try:
+            await run_clients(configuration, clients=3, requests=5)
+        finally:
+            await close_shared_sessions()
+
+        assert counts["created"] == 1
+        assert counts["reused"] == 14
+
+    async def test_close_keeps_shared_session(self, base_url):
+        """Тест: закрытие клиента не закрывает общую сессию других клиентов."""
+        configuration = Configuration(host=base_url, share_session=True)
+        try:
+            first = ApiClient(configuration)
+            second = ApiClient(configuration)
+            await HealthApi(first).health_get()
+            await HealthApi(second).health_get()
+            session = second.rest_client.pool_manager
+
+            await first.close()
+
+            assert first.rest_client.pool_manager is None
+            assert not session.closed
+            await HealthApi(second).health_get()
+        finally:
+            await close_shared_sessions()
+
+        assert session.closed
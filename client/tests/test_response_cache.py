@@ -0,0 +1,186 @@
+"""Тесты кэша ответов клиента (ResponseCache)."""
+
+import aiohttp
+import pytest
+from openapi_client import ApiClient, Configuration, NotFoundException, ResponseCache, TasksApi
+from openapi_client.models.task_create import TaskCreate
+from openapi_client.models.task_update import TaskUpdate
+
+
+def request_recorder():
+    """TraceConfig, записывающий (метод, код ответа) каждого отправленного запроса."""
+    requests = []
+
+    async def on_request_end(session, context, params):
+        requests.append((params.method, params.response.status))
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_end.append(on_request_end)
+    return trace_config, requests
+
+
+@pytest.fixture
+def cached_config(base_url):
+    """Фабрика Configuration с кэшем и журналом запросов."""
+
+    def make(**cache_kwargs):
+        trace_config, requests = request_recorder()
+        cache = ResponseCache(**cache_kwargs)
+        configuration = Configuration(
+            host=base_url, response_cache=cache, trace_configs=[trace_config]
+        )
+        return configuration, cache, requests
+
+    return make
+
+
+@pytest.mark.asyncio
+class TestResponseCache:
+    """Тесты кэша против тестового сервера."""
+
+    async def test_revalidates_with_etag(self, cached_config):
+        """Тест: устаревшая запись перепроверяется, при 304 возвращается та же модель."""
+        configuration, cache, requests = cached_config()
+        async with ApiClient(configuration) as api_client:
+            tasks_api = TasksApi(api_client)
+            task_id = str((await tasks_api.tasks_post(TaskCreate(title="Задача"))).id)
+
+            first = await tasks_api.tasks_id_get(task_id)
+            second = await tasks_api.tasks_id_get(task_id)
+
+        assert second is first
+        assert requests == [("POST", 201), ("GET", 200), ("GET", 304)]
+        assert (cache.misses, cache.revalidated, cache.hits) == (1, 1, 0)
+        assert cache.hit_rate == 0.5
+
+    async def test_fresh_entry_skips_network(self, cached_config):
+        """Тест: в пределах default_ttl запрос к серверу не выполняется."""
+        configuration, cache, requests = cached_config(default_ttl=60)
+        async with ApiClient(configuration) as api_client:
+            tasks_api = TasksApi(api_client)
+            task_id = str((await tasks_api.tasks_post(TaskCreate(title="Задача"))).id)
+
+            for _ in range(3):
+                task = await tasks_api.tasks_id_get(task_id)
+
+        assert task.title == "Задача"
+        assert requests == [("POST", 201), ("GET", 200)]
+        assert cache.hits == 2
+
+    async def test_put_invalidates(self, cached_config):
+        """Тест: PUT через клиент удаляет запись, следующий GET видит изменения."""
+        configuration, cache, requests = cached_config(default_ttl=60)
+        async with ApiClient(configuration) as api_client:
+            tasks_api = TasksApi(api_client)
+            task_id = str((await tasks_api.tasks_post(TaskCreate(title="Задача"))).id)
+            await tasks_api.tasks_id_get(task_id)
+
+            await tasks_api.tasks_id_put(task_id, TaskUpdate(status="completed"))
+            task = await tasks_api.tasks_id_get(task_id)
+
+        assert task.status == "completed"
+        assert requests[-1] == ("GET", 200)
+
+    async def test_write_during_get_not_overwritten(self, base_url):
+        """Тест: GET, начатый до PUT и завершившийся после него, не сохраняет старый ответ."""
+        writes = []
+
+        async def on_request_end(session, context, params):
+            # Ответ GET уже получен, но еще не сохранен: в этот момент проходит запись
+            if params.method == "GET" and writes:
+                await writes.pop()()
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_end.append(on_request_end)
+        cache = ResponseCache(default_ttl=60)
+        configuration = Configuration(
+            host=base_url, response_cache=cache, trace_configs=[trace_config]
+        )
+        async with ApiClient(configuration) as api_client:
+            tasks_api = TasksApi(api_client)
+            task_id = str((await tasks_api.tasks_post(TaskCreate(title="Задача"))).id)
+            writes.append(lambda: tasks_api.tasks_id_put(task_id, TaskUpdate(status="completed")))
+
+            stale = await tasks_api.tasks_id_get(task_id)
+            task = await tasks_api.tasks_id_get(task_id)
+
+        assert stale.status == "pending"
+        assert task.status == "completed"
+
+    async def test_delete_invalidates(self, cached_config):
+        """Тест: DELETE через клиент удаляет запись."""
+        configuration, cache, _ = cached_config(default_ttl=60)
+        async with ApiClient(configuration) as api_client:
+            tasks_api = TasksApi(api_client)
+            task_id = str((await tasks_api.tasks_post(TaskCreate(title="Задача"))).id)
+            await tasks_api.tasks_id_get(task_id)
+
+            await tasks_api.tasks_id_delete(task_id)
+
+            with pytest.raises(NotFoundException):
+                await tasks_api.tasks_id_get(task_id)
+        assert len(cache) == 0
+
+    async def test_lru_eviction(self, cached_config):
+        """Тест: при превышении max_entries вытесняется давно не использованная запись."""
+        configuration, cache, requests = cached_config(max_entries=2, default_ttl=60)
+        async with ApiClient(configuration) as api_client:
+            tasks_api = TasksApi(api_client)
+            ids = [
+                str((await tasks_api.tasks_post(TaskCreate(title=f"Задача {i}"))).id)
+                for i in range(3)
+            ]
+            await tasks_api.tasks_id_get(ids[0])
+            await tasks_api.tasks_id_get(ids[1])
+            await tasks_api.tasks_id_get(ids[0])
+            await tasks_api.tasks_id_get(ids[2])
+            requests.clear()
+
+            await tasks_api.tasks_id_get(ids[0])
+            await tasks_api.tasks_id_get(ids[1])
+
+        assert cache.evictions == 2
+        assert requests == [("GET", 200)]
+
+    async def test_explicit_if_none_match_bypasses_cache(self, cached_config):
+        """Тест: вызов с явным If-None-Match получает ответ сервера как есть."""
+        configuration, cache, _ = cached_config(default_ttl=60)
+        async with ApiClient(configuration) as api_client:
+            tasks_api = TasksApi(api_client)
+            task_id = str((await tasks_api.tasks_post(TaskCreate(title="Задача"))).id)
+            response = await tasks_api.tasks_id_get_with_http_info(task_id)
+
+            not_modified = await tasks_api.tasks_id_get_with_http_info(
+                task_id, if_none_match=response.headers["ETag"]
+            )
+
+        assert not_modified.status_code == 304
+        assert not_modified.data is None
+
+
+class TestCacheControl:
+    """Тесты разбора Cache-Control."""
+
+    def test_no_store(self):
+        """Тест: ответ с no-store не сохраняется."""
+        cache = ResponseCache(default_ttl=60)
+
+        cache.store("/tasks/1", object(), {"Cache-Control": "no-store", "ETag": '"1"'})
+
+        assert cache.get("/tasks/1") is None
+
+    def test_max_age(self):
+        """Тест: max-age задает свежесть вместо default_ttl."""
+        cache = ResponseCache(default_ttl=0)
+
+        cache.store("/tasks/1", object(), {"Cache-Control": "private, max-age=60"})
+
+        assert cache.get("/tasks/1").fresh
+
+    def test_no_validator_not_stored(self):
+        """Тест: ответ без ETag и без срока свежести не сохраняется."""
+        cache = ResponseCache()
+
+        cache.store("/tasks", object(), {})
+
+        assert len(cache) == 0
@@ -0,0 +1,284 @@
+"""Тесты повторов и circuit breaker клиента против нестабильного тестового сервера."""
+
+import asyncio
+from collections import Counter
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from openapi_client import (
+    ApiClient,
+    ApiException,
+    CircuitBreaker,
+    CircuitOpenException,
+    Configuration,
+    RetryPolicy,
+    ServiceException,
+    TasksApi,
+)
+from openapi_client.models.task_create import TaskCreate
+from openapi_client.models.task_update import TaskUpdate
+
+TASK = {"id": 1, "title": "Задача", "status": "pending", "created_at": "2026-01-01T00:00:00"}
+
+
+def flaky_app(failures: int, status: int = 503, headers=None) -> web.Application:
+    """Приложение, отвечающее status на первые failures запросов каждого метода."""
+    hits = Counter()
+
+    async def handler(request: web.Request) -> web.Response:
+        hits[request.method] += 1
+        if hits[request.method] <= failures:
+            return web.json_response({"error": "unavailable"}, status=status, headers=headers)
+        if request.method == "DELETE":
+            return web.Response(status=204)
+        return web.json_response(TASK, status=201 if request.method == "POST" else 200)
+
+    app = web.Application()
+    app["hits"] = hits
+    app.router.add_route("*", "/tasks", handler)
+    app.router.add_route("*", "/tasks/{id}", handler)
+    return app
+
+
+@pytest.fixture
+async def flaky_server():
+    """Фабрика нестабильных серверов; серверы закрываются после теста."""
+    servers = []
+
+    async def start(failures: int, status: int = 503, headers=None) -> TestServer:
+        server = TestServer(flaky_app(failures, status, headers))
+        await server.start_server()
+        servers.append(server)
+        return server
+
+    yield start
+
+    for server in servers:
+        await server.close()
+
+
+def make_config(server: TestServer, **kwargs) -> Configuration:
+    """Configuration для тестового сервера."""
+    return Configuration(host=str(server.make_url("")).rstrip("/"), **kwargs)
+
+
+def fast_policy(**kwargs) -> RetryPolicy:
+    """Политика с миллисекундными задержками."""
+    return RetryPolicy(backoff_base=0.001, backoff_max=0.005, **kwargs)
+
+
+class TestDefaults:
+    """Тесты настроек по умолчанию."""
+
+    def test_request_timeout_by_default(self):
+        """Тест: без явной настройки запрос ограничен таймаутом, а не ждет бесконечно."""
+        assert Configuration().request_timeout == 300
+
+
+class TestBackoff:
+    """Тесты расчета задержки."""
+
+    def test_backoff_bounds(self):
+        """Тест: задержка с jitter лежит в [0, min(backoff_max, base * 2**n)]."""
+        policy = RetryPolicy(backoff_base=0.1, backoff_max=0.5)
+
+        for attempt, limit in [(0, 0.1), (1, 0.2), (2, 0.4), (5, 0.5)]:
+            delays = [policy.backoff(attempt) for _ in range(100)]
+            assert all(0 <= delay <= limit for delay in delays)
+
+
+@pytest.mark.asyncio
+class TestRetryPolicy:
+    """Тесты повторов запросов."""
+
+    async def test_get_retried_until_success(self, flaky_server):
+        """Тест: GET после двух 503 повторяется и возвращает задачу."""
+        server = await flaky_server(failures=2)
+        policy = fast_policy(max_attempts=3)
+
+        async with ApiClient(make_config(server, retry_policy=policy)) as api_client:
+            task = await TasksApi(api_client).tasks_id_get("1")
+
+        assert task.title == "Задача"
+        assert server.app["hits"]["GET"] == 3
+        assert policy.retries == 2
+
+    async def test_put_and_delete_retried(self, flaky_server):
+        """Тест: PUT и DELETE идемпотентны и тоже повторяются."""
+        server = await flaky_server(failures=1)
+
+        async with ApiClient(make_config(server, retry_policy=fast_policy())) as api_client:
+            tasks_api = TasksApi(api_client)
+            await tasks_api.tasks_id_put("1", TaskUpdate(status="completed"))
+            await tasks_api.tasks_id_delete("1")
+
+        assert server.app["hits"]["PUT"] == 2
+        assert server.app["hits"]["DELETE"] == 2
+
+    async def test_post_not_retried(self, flaky_server):
+        """Тест: POST не идемпотентен и не повторяется."""
+        server = await flaky_server(failures=1)
+
+        async with ApiClient(make_config(server, retry_policy=fast_policy())) as api_client:
+            with pytest.raises(ServiceException):
+                await TasksApi(api_client).tasks_post(TaskCreate(title="Задача"))
+
+        assert server.app["hits"]["POST"] == 1
+
+    async def test_client_error_not_retried(self, flaky_server):
+        """Тест: 4xx не повторяется."""
+        server = await flaky_server(failures=1, status=404)
+
+        async with ApiClient(make_config(server, retry_policy=fast_policy())) as api_client:
+            with pytest.raises(ApiException) as exc_info:
+                await TasksApi(api_client).tasks_id_get("1")
+
+        assert exc_info.value.status == 404
+        assert server.app["hits"]["GET"] == 1
+
+    async def test_attempts_exhausted(self, flaky_server):
+        """Тест: после max_attempts попыток возвращается последняя ошибка."""
+        server = await flaky_server(failures=10)
+
+        policy = fast_policy(max_attempts=3)
+        async with ApiClient(make_config(server, retry_policy=policy)) as api_client:
+            with pytest.raises(ServiceException):
+                await TasksApi(api_client).tasks_id_get("1")
+
+        assert server.app["hits"]["GET"] == 3
+
+    async def test_budget_limits_retries(self, flaky_server):
+        """Тест: исчерпанный бюджет запрещает повторы."""
+        server = await flaky_server(failures=10)
+        policy = fast_policy(max_attempts=5, budget_ratio=0.0, budget_capacity=2.0)
+
+        async with ApiClient(make_config(server, retry_policy=policy)) as api_client:
+            tasks_api = TasksApi(api_client)
+            for _ in range(3):
+                with pytest.raises(ServiceException):
+                    await tasks_api.tasks_id_get("1")
+
+        assert policy.retries == 2
+        assert server.app["hits"]["GET"] == 5
+        assert policy.budget_exhausted == 3
+
+    async def test_connection_error_retried(self, unused_tcp_port):
+        """Тест: ошибка соединения повторяется и затем поднимается как есть."""
+        policy = fast_policy(max_attempts=3)
+        configuration = Configuration(
+            host=f"http://127.0.0.1:{unused_tcp_port}", retry_policy=policy
+        )
+
+        async with ApiClient(configuration) as api_client:
+            with pytest.raises(aiohttp.ClientConnectionError):
+                await TasksApi(api_client).tasks_id_get("1")
+
+        assert policy.retries == 2
+
+    async def test_timeout_retried(self):
+        """Тест: зависший сервер прерывается по таймауту, и запрос повторяется."""
+        hits = []
+
+        async def hang(request: web.Request) -> web.Response:
+            hits.append(request.method)
+            await asyncio.sleep(10)
+            return web.json_response(TASK)
+
+        app = web.Application()
+        app.router.add_get("/tasks/{id}", hang)
+        policy = fast_policy(max_attempts=2)
+        async with TestServer(app) as server:
+            configuration = make_config(server, request_timeout=0.05, retry_policy=policy)
+            async with ApiClient(configuration) as api_client:
+                with pytest.raises(asyncio.TimeoutError):
+                    await TasksApi(api_client).tasks_id_get("1")
+
+        assert hits == ["GET", "GET"]
+        assert policy.retries == 1
+
+    async def test_retry_after_respected(self, flaky_server):
+        """Тест: задержка не меньше Retry-After (в пределах backoff_max)."""
+        server = await flaky_server(failures=1, status=429, headers={"Retry-After": "1"})
+        policy = RetryPolicy(backoff_base=0.001, backoff_max=0.05)
+
+        loop = asyncio.get_running_loop()
+        async with ApiClient(make_config(server, retry_policy=policy)) as api_client:
+            started = loop.time()
+            await TasksApi(api_client).tasks_id_get("1")
+
+        assert loop.time() - started >= 0.05
+
+
+@pytest.mark.asyncio
+class TestCircuitBreaker:
+    """Тесты circuit breaker."""
+
+    async def test_opens_and_fails_fast(self, flaky_server):
+        """Тест: после порога ошибок запросы отклоняются без обращения к серверу."""
+        server = await flaky_server(failures=10)
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+
+        async with ApiClient(make_config(server, circuit_breaker=breaker)) as api_client:
+            tasks_api = TasksApi(api_client)
+            for _ in range(2):
+                with pytest.raises(ServiceException):
+                    await tasks_api.tasks_id_get("1")
+            with pytest.raises(CircuitOpenException):
+                await tasks_api.tasks_id_get("1")
+
+        assert server.app["hits"]["GET"] == 2
+
+    async def test_half_open_probe_closes(self, flaky_server):
+        """Тест: после recovery_timeout успешный пробный запрос закрывает цепь."""
+        server = await flaky_server(failures=2)
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0.05)
+        host = f"{server.host}:{server.port}"
+
+        async with ApiClient(make_config(server, circuit_breaker=breaker)) as api_client:
+            tasks_api = TasksApi(api_client)
+            for _ in range(2):
+                with pytest.raises(ServiceException):
+                    await tasks_api.tasks_id_get("1")
+            assert breaker.state(host) == CircuitBreaker.OPEN
+
+            await asyncio.sleep(0.06)
+            assert breaker.state(host) == CircuitBreaker.HALF_OPEN
+            await tasks_api.tasks_id_get("1")
+
+        assert breaker.state(host) == CircuitBreaker.CLOSED
+
+    async def test_half_open_probe_failure_reopens(self, flaky_server):
+        """Тест: неудачный пробный запрос снова открывает цепь."""
+        server = await flaky_server(failures=10)
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+        host = f"{server.host}:{server.port}"
+
+        async with ApiClient(make_config(server, circuit_breaker=breaker)) as api_client:
+            tasks_api = TasksApi(api_client)
+            with pytest.raises(ServiceException):
+                await tasks_api.tasks_id_get("1")
+            await asyncio.sleep(0.06)
+            with pytest.raises(ServiceException):
+                await tasks_api.tasks_id_get("1")
+
+            assert breaker.state(host) == CircuitBreaker.OPEN
+            with pytest.raises(CircuitOpenException):
+                await tasks_api.tasks_id_get("1")
+
+        assert server.app["hits"]["GET"] == 2
+
+    async def test_breaker_stops_retries(self, flaky_server):
+        """Тест: открытая цепь прерывает повторы."""
+        server = await flaky_server(failures=10)
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+        configuration = make_config(
+            server, retry_policy=fast_policy(max_attempts=5), circuit_breaker=breaker
+        )
+
+        async with ApiClient(configuration) as api_client:
+            with pytest.raises(CircuitOpenException):
+                await TasksApi(api_client).tasks_id_get("1")
+
+        assert server.app["hits"]["GET"] == 2
@@ -1,34 +1,92 @@
 """Скрипт для экспорта OpenAPI спецификации в файл."""
 
+import argparse
+import asyncio
+import hashlib
+import json
 import sys
 from pathlib import Path
 
-import requests
 import yaml
 
 BASE_URL = "http://127.0.0.1:8080"
 OUTPUT_DIR = Path("openapi")
 OUTPUT_FILE = OUTPUT_DIR / "openapi.yaml"
+OUTPUT_JSON_FILE = OUTPUT_DIR / "openapi.json"
+SERVER_DIR = Path(__file__).parent / "server"
 
 
-def export_openapi_spec():
-    """Экспортирует OpenAPI спецификацию в YAML файл."""
+def fetch_spec_online():
+    """Получает спецификацию у запущенного сервера."""
+    # requests нужен только этому режиму: офлайн-экспорт работает и без него
+    import requests
+
     try:
         response = requests.get(f"{BASE_URL}/swagger.json", timeout=5)
-        response.raise_for_status()
+    except requests.exceptions.ConnectionError as e:
+        raise ConnectionError(BASE_URL) from e
+    response.raise_for_status()
+    return response.json()
+
 
-        spec = response.json()
+async def build_spec_offline():
+    """Строит спецификацию в процессе: запускает только хуки старта aiohttp-apispec."""
+    sys.path.insert(0, str(SERVER_DIR))
+    from app import main as server_main
+    from app.jsoncodec import dumps
+
+    app = server_main.create_app()
+    app.on_startup.remove(server_main.init_db)
+    app.on_cleanup.remove(server_main.close_db)
+    app.freeze()
+    await app.startup()
+    try:
+        # Через JSON, чтобы результат совпадал с тем, что отдает /swagger.json
+        return json.loads(dumps(app["swagger_dict"]))
+    finally:
+        await app.cleanup()
 
-        OUTPUT_DIR.mkdir(exist_ok=True)
 
-        with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-            yaml.safe_dump(spec, f, sort_keys=False, allow_unicode=True, default_flow_style=False)
+def content_hash(data: bytes) -> str:
+    """Хэш содержимого файла спецификации."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """Записывает файл, только если хэш содержимого изменился."""
+    if path.exists() and content_hash(path.read_bytes()) == content_hash(data):
+        return False
+    path.write_bytes(data)
+    return True
+
+
+def save_spec(spec) -> bool:
+    """Сохраняет спецификацию в YAML и JSON; возвращает True, если файлы изменились."""
+    yaml_data = yaml.safe_dump(
+        spec, sort_keys=False, allow_unicode=True, default_flow_style=False
+    ).encode("utf-8")
+    json_data = (json.dumps(spec, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+    OUTPUT_DIR.mkdir(exist_ok=True)
+    changed = write_if_changed(OUTPUT_FILE, yaml_data)
+    changed = write_if_changed(OUTPUT_JSON_FILE, json_data) or changed
+    return changed
+
+
+def export_openapi_spec(offline: bool = False):
+    """Экспортирует OpenAPI спецификацию в YAML и JSON файлы."""
+    try:
+        spec = asyncio.run(build_spec_offline()) if offline else fetch_spec_online()
 
-        print(f"✅ OpenAPI спецификация экспортирована в {OUTPUT_FILE}")
+        if save_spec(spec):
+            print(f"✅ OpenAPI спецификация экспортирована в {OUTPUT_FILE} и {OUTPUT_JSON_FILE}")
+        else:
+            print(f"✅ OpenAPI спецификация не изменилась, {OUTPUT_FILE} не перезаписан")
         return True
-    except requests.exceptions.ConnectionError:
+    except ConnectionError:
         print(f"❌ Не удалось подключиться к серверу на {BASE_URL}")
         print("Убедитесь, что сервер запущен: cd server && python -m app.main")
+        print("или экспортируйте без сервера: python export_openapi.py --offline")
         return False
     except Exception as e:
         print(f"❌ Ошибка при экспорте: {e}")
@@ -36,5 +94,12 @@ def export_openapi_spec():
 
 
 if __name__ == "__main__":
-    success = export_openapi_spec()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="построить спецификацию из create_app() без запущенного сервера",
+    )
+    args = parser.parse_args()
+    success = export_openapi_spec(offline=args.offline)
     sys.exit(0 if success else 1)
@@ -1,12 +1,36 @@
 """Скрипт для генерации Python клиента из OpenAPI спецификации."""
 
+import argparse
+import hashlib
+import importlib.util
+import json
+import os
+import re
+import shutil
 import subprocess
 import sys
+import time
 from pathlib import Path
 
 OPENAPI_FILE = Path("openapi/openapi.yaml")
 OUTPUT_DIR = Path("client/generated")
 OPENAPI_GENERATOR_CMD = None
+OPENAPI_GENERATOR_VERSION = None
+
+# Параметры генерации; входят в ключ кэша вместе со спецификацией и версией генератора
+GENERATOR_OPTIONS = [
+    "-g",
+    "python",
+    "--additional-properties=library=asyncio,packageName=openapi_client",
+    "--skip-validate-spec",
+]
+
+CACHE_DIR = Path(".cache/generate_client")
+GENERATOR_CACHE_FILE = CACHE_DIR / "generator.json"
+GENERATION_KEY_FILE = OUTPUT_DIR / ".generation-key"
+CODEGEN_DIR = Path(__file__).parent / "client"
+# Файл npm-обертки openapi-generator-cli с закрепленной версией jar
+OPENAPITOOLS_FILE = Path("openapitools.json")
 
 
 def check_java():
@@ -26,8 +50,6 @@ def check_java():
             # Парсим версию Java
             version_line = result.stderr.split("\n")[0]
             # Ищем паттерн типа "version "1.8.0" или "openjdk version "11.0.2"
-            import re
-
             version_match = re.search(r'version ["\']?(\d+)', version_line)
             if version_match:
                 java_major_version = int(version_match.group(1))
@@ -125,6 +147,7 @@ def check_openapi_generator():
                             ):
                                 print(version_info)
                         print(f"[OK] Генератор работает: {exe_path}")
+                        remember_generator_version(result)
                         return True
                     else:
                         # Проверяем на ошибку версии Java
@@ -145,6 +168,7 @@ def check_openapi_generator():
                             print(f"[OK] Генератор найден (код {result.returncode}): {exe_path}")
                             if result.stderr:
                                 print(f"   Вывод: {result.stderr[:100]}")
+                            remember_generator_version(result)
                             return True
                         else:
                             # Показываем ошибку, если версия не найдена
@@ -182,6 +206,7 @@ def check_openapi_generator():
                 if result.stdout.strip():
                     print(result.stdout.strip())
                 OPENAPI_GENERATOR_CMD = cmd[:-1]  # без аргумента version
+                remember_generator_version(result)
                 return True
             else:
                 error_output = result.stderr + result.stdout
@@ -214,6 +239,110 @@ def check_openapi_generator():
     return False
 
 
+def remember_generator_version(result):
+    """Запоминает версию генератора из вывода команды version."""
+    global OPENAPI_GENERATOR_VERSION
+
+    match = re.search(r"\d+\.\d+\.\d+", result.stdout + result.stderr)
+    OPENAPI_GENERATOR_VERSION = match.group(0) if match else "unknown"
+
+
+def generator_files(cmd):
+    """Файлы, от которых зависит генератор команды cmd; None - файл команды не найден."""
+    paths = [cmd[0] if Path(cmd[0]).exists() else shutil.which(cmd[0])]
+    if len(cmd) > 2 and cmd[1] == "-m":
+        spec = importlib.util.find_spec(cmd[2])
+        paths.append(spec.origin if spec is not None else None)
+    else:
+        spec = importlib.util.find_spec("openapi_generator_cli")
+    if None in paths:
+        return None
+
+    # npm-обертка скачивает jar выбранной версии в versions/ и закрепляет ее в openapitools.json
+    directories = [Path(os.path.realpath(path)).parent for path in paths]
+    if spec is not None and spec.origin is not None:
+        directories.append(Path(spec.origin).parent)
+    jars = {jar for directory in directories for jar in directory.glob("*.jar")}
+    jars |= {jar for directory in directories for jar in directory.glob("versions/*.jar")}
+    files = [Path(path) for path in paths] + sorted(jars)
+    if OPENAPITOOLS_FILE.exists():
+        files.append(OPENAPITOOLS_FILE)
+    return files
+
+
+def generator_fingerprint(cmd):
+    """Отпечаток установленного генератора: путь, mtime и размер его файлов."""
+    files = generator_files(cmd)
+    if files is None:
+        return None
+
+    fingerprint = []
+    for path in files:
+        resolved = os.path.realpath(path)
+        stat = os.stat(resolved)
+        fingerprint.append([resolved, stat.st_mtime_ns, stat.st_size])
+    fingerprint.append(["OPENAPI_GENERATOR_VERSION", os.environ.get("OPENAPI_GENERATOR_VERSION")])
+    return fingerprint
+
+
+def load_generator_cache():
+    """Восстанавливает найденную ранее команду генератора, если ее файлы не изменились."""
+    global OPENAPI_GENERATOR_CMD, OPENAPI_GENERATOR_VERSION
+
+    try:
+        cached = json.loads(GENERATOR_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+
+    cmd = cached.get("command")
+    if not cmd or cached.get("python") != sys.executable:
+        return False
+    fingerprint = generator_fingerprint(cmd)
+    if fingerprint is None or cached.get("fingerprint") != fingerprint:
+        return False
+
+    OPENAPI_GENERATOR_CMD = cmd
+    OPENAPI_GENERATOR_VERSION = cached.get("version", "unknown")
+    print(f"[OK] Генератор из кэша: {' '.join(cmd)} ({OPENAPI_GENERATOR_VERSION})")
+    return True
+
+
+def save_generator_cache():
+    """Сохраняет найденную команду генератора, его версию и отпечаток файлов."""
+    cmd = OPENAPI_GENERATOR_CMD or ["openapi-generator-cli"]
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    GENERATOR_CACHE_FILE.write_text(
+        json.dumps(
+            {
+                "command": cmd,
+                "version": OPENAPI_GENERATOR_VERSION or "unknown",
+                "python": sys.executable,
+                "fingerprint": generator_fingerprint(cmd),
+            },
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+
+
+def generation_key(backend="python"):
+    """Ключ генерации: хэш спецификации, бэкенда, версии генератора и параметров."""
+    digest = hashlib.sha256()
+    digest.update(OPENAPI_FILE.read_bytes())
+    options = [backend, OPENAPI_GENERATOR_VERSION, GENERATOR_OPTIONS if backend == "java" else []]
+    digest.update(json.dumps(options).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def is_up_to_date(key):
+    """Проверяет, что клиент уже сгенерирован с тем же ключом."""
+    try:
+        stored = GENERATION_KEY_FILE.read_text(encoding="utf-8").strip()
+    except OSError:
+        return False
+    return stored == key and any(OUTPUT_DIR.rglob("*.py"))
+
+
 def generate_client():
     """Генерирует Python клиент из OpenAPI спецификации."""
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -233,12 +362,9 @@ def generate_client():
             "generate",
             "-i",
             str(OPENAPI_FILE),
-            "-g",
-            "python",
             "-o",
             str(OUTPUT_DIR),
-            "--additional-properties=library=asyncio,packageName=openapi_client",
-            "--skip-validate-spec",
+            *GENERATOR_OPTIONS,
         ]
 
         print(f"🚀 Запускаю команду: {' '.join(cmd)}")
@@ -302,8 +428,51 @@ def generate_client():
         return False
 
 
+def load_codegen():
+    """Импортирует встроенный генератор client/codegen и запоминает его версию."""
+    global OPENAPI_GENERATOR_VERSION
+
+    sys.path.insert(0, str(CODEGEN_DIR))
+    import codegen
+
+    OPENAPI_GENERATOR_VERSION = f"codegen-{codegen.fingerprint()}"
+    return codegen
+
+
+def generate_client_native(codegen):
+    """Генерирует клиент встроенным генератором, без Java."""
+    print(f"\nГенерация клиента из {OPENAPI_FILE} (бэкенд python)...")
+    print(f"Выходная директория: {OUTPUT_DIR}")
+
+    started = time.perf_counter()
+    try:
+        files = codegen.generate(OPENAPI_FILE, OUTPUT_DIR)
+    except Exception as e:
+        print(f"[ERROR] Ошибка при генерации клиента: {e}")
+        return False
+    elapsed = time.perf_counter() - started
+
+    print(f"[OK] Клиент успешно сгенерирован за {elapsed * 1000:.0f} мс")
+    print(f"Создано Python файлов: {len(files)}")
+    return True
+
+
 def main():
     """Основная функция."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--force", action="store_true", help="перегенерировать клиент без учета кэша"
+    )
+    parser.add_argument(
+        "--backend",
+        choices=("java", "python"),
+        default="python",
+        help="генератор: встроенный client/codegen (python, по умолчанию) или "
+        "openapi-generator-cli (java, требует Java 11+; без общего пула соединений, "
+        "get_many/run_many, повторов, circuit breaker и кэша ответов)",
+    )
+    args = parser.parse_args()
+
     print("=" * 60)
     print("ГЕНЕРАЦИЯ PYTHON КЛИЕНТА ИЗ OPENAPI СПЕЦИФИКАЦИИ")
     print("=" * 60)
@@ -311,15 +480,27 @@ def main():
     if not check_openapi_file():
         sys.exit(1)
 
-    if not check_java():
-        print("\n[WARNING] ВНИМАНИЕ: Без Java генератор не будет работать!")
-        print("Продолжаю проверку генератора, но генерация может не сработать...\n")
-
-    if not check_openapi_generator():
-        sys.exit(1)
-
-    if not generate_client():
+    codegen = None
+    if args.backend == "python":
+        codegen = load_codegen()
+    elif args.force or not load_generator_cache():
+        if not check_java():
+            print("\n[WARNING] ВНИМАНИЕ: Без Java генератор не будет работать!")
+            print("Продолжаю проверку генератора, но генерация может не сработать...\n")
+
+        if not check_openapi_generator():
+            sys.exit(1)
+        save_generator_cache()
+
+    key = generation_key(args.backend)
+    if not args.force and is_up_to_date(key):
+        print(f"\n[OK] Спецификация и генератор не изменились, клиент в {OUTPUT_DIR} актуален")
+        return
+
+    generated = generate_client_native(codegen) if codegen else generate_client()
+    if not generated:
         sys.exit(1)
+    GENERATION_KEY_FILE.write_text(key + "\n", encoding="utf-8")
 
     print("\n" + "=" * 60)
     print("ГЕНЕРАЦИЯ ЗАВЕРШЕНА УСПЕШНО")
@@ -0,0 +1,118 @@
+"""Кэш сериализованных задач и объединение одинаковых загрузок для GET /tasks/{id}."""
+
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TaskCache:
+    """Ограниченный LRU-кэш с TTL для готовых представлений задач (ETag и JSON-тело)."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        """Инициализация кэша: maxsize записей, каждая живет не дольше ttl секунд."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._epoch = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Возвращает значение из кэша или None, учитывая попадание/промах."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    async def get_or_load(
+        self, key: Hashable, loader: Callable[[], Awaitable[Optional[Any]]]
+    ) -> Optional[Any]:
+        """Возвращает значение из кэша, а при промахе загружает его через loader."""
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        # Инвалидация во время загрузки меняет epoch: результат мог быть прочитан до записи
+        epoch = self._epoch
+        value = await loader()
+        if value is not None and epoch == self._epoch:
+            self._put(key, value)
+        return value
+
+    def invalidate(self, *keys: Hashable) -> None:
+        """Удаляет значения из кэша и отменяет сохранение незавершенных загрузок."""
+        self._epoch += 1
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Полностью очищает кэш."""
+        self._epoch += 1
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Возвращает счетчики кэша."""
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _put(self, key: Hashable, value: Any) -> None:
+        """Сохраняет значение, вытесняя самые давно использованные записи."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+class SingleFlight:
+    """Объединяет одновременные загрузки одного ключа в одну (single-flight)."""
+
+    def __init__(self):
+        """Инициализация без активных загрузок."""
+        self.loads = 0
+        self.shared = 0
+        self._flights: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    async def do(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Возвращает результат loader, выполняя не более одной загрузки ключа одновременно."""
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(loader())
+            self._flights[key] = flight
+            flight.add_done_callback(functools.partial(self._finish, key))
+            self.loads += 1
+        else:
+            self.shared += 1
+        # Отмена одного из ожидающих не отменяет общую загрузку
+        return await asyncio.shield(flight)
+
+    def forget(self, *keys: Hashable) -> None:
+        """Следующие вызовы с этими ключами начнут новую загрузку."""
+        for key in keys:
+            self._flights.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Возвращает счетчики: запущенные загрузки, присоединившиеся вызовы, активные загрузки."""
+        return {"loads": self.loads, "shared": self.shared, "in_flight": len(self._flights)}
+
+    def _finish(self, key: Hashable, flight: "asyncio.Future[Any]") -> None:
+        """Убирает завершенную загрузку и помечает ее исключение полученным."""
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        # Если все ожидающие отменены, исключение иначе попало бы в лог как неполученное
+        if not flight.cancelled():
+            flight.exception()
@@ -0,0 +1,227 @@
+"""Предкомпилированные сериализаторы и валидаторы для горячих схем."""
+
+from collections.abc import Mapping
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
+
+from aiohttp.web import Application
+from marshmallow import EXCLUDE, RAISE, Schema, ValidationError, fields, validate
+from marshmallow.utils import is_collection, missing
+
+from .schemas import BulkLimitMixin, check_bulk_size
+
+SUPPORTED_FIELDS = (fields.String, fields.Integer)
+
+# Хуки, поведение которых воспроизводится скомпилированным кодом
+SUPPORTED_HOOKS = {"check_bulk_size"}
+
+
+def _fast_type(field: fields.Field) -> str:
+    """Имя типа, для которого значение поля проверяется инлайн."""
+    return "str" if type(field) is fields.String else "int"
+
+
+def _inline_checks(field: fields.Field, index: int, namespace: Dict[str, Any]) -> Optional[str]:
+    """Строит выражение, истинное при ошибке валидаторов поля; None - проверяет само поле."""
+    checks = []
+    for number, validator in enumerate(field.validators):
+        if type(validator) is validate.Length:
+            if validator.equal is not None:
+                checks.append(f"len(value) != {validator.equal!r}")
+                continue
+            if validator.min is not None:
+                checks.append(f"len(value) < {validator.min!r}")
+            if validator.max is not None:
+                checks.append(f"len(value) > {validator.max!r}")
+        elif type(validator) is validate.OneOf:
+            name = f"_choices{index}_{number}"
+            namespace[name] = frozenset(validator.choices)
+            checks.append(f"value not in {name}")
+        else:
+            return None
+    return " or ".join(checks) or "False"
+
+
+def _load_field_source(
+    field: fields.Field, attr: str, key: str, index: int, namespace: Dict[str, Any]
+) -> List[str]:
+    """Генерирует код загрузки одного поля."""
+    namespace[f"_field{index}"] = field
+    store = f"result[{attr!r}] = "
+    deserialize = f"_field{index}.deserialize(value, {key!r}, data)"
+
+    lines = [f"value = data.get({key!r}, _missing)", "if value is _missing:"]
+    if field.required:
+        lines.append(f"    errors[{key!r}] = [{field.error_messages['required']!r}]")
+    elif field.load_default is missing:
+        lines.append("    pass")
+    elif callable(field.load_default):
+        namespace[f"_default{index}"] = field.load_default
+        lines.append(f"    {store}_default{index}()")
+    else:
+        namespace[f"_default{index}"] = field.load_default
+        lines.append(f"    {store}_default{index}")
+
+    failed = _inline_checks(field, index, namespace)
+    if failed is not None:
+        lines += [
+            f"elif value.__class__ is {_fast_type(field)} and not ({failed}):",
+            f"    {store}value",
+        ]
+    lines += [
+        "else:",
+        "    try:",
+        f"        {store}{deserialize}",
+        "    except ValidationError as error:",
+        f"        errors[{key!r}] = error.messages",
+    ]
+    return lines
+
+
+def _dump_field_source(
+    field: fields.Field, attr: str, key: str, index: int, namespace: Dict[str, Any]
+) -> List[str]:
+    """Генерирует код сериализации одного поля."""
+    if field.dump_default is not missing:
+        namespace[f"_field{index}"] = field
+        return [
+            f"value = _field{index}.serialize({attr!r}, obj)",
+            "if value is not _missing:",
+            f"    result[{key!r}] = value",
+        ]
+    return [
+        f"value = get({attr!r}, _missing)",
+        "if value is not _missing:",
+        f"    result[{key!r}] = None if value is None else {_fast_type(field)}(value)",
+    ]
+
+
+def _build(name: str, header: str, body: List[str], namespace: Dict[str, Any]) -> Callable:
+    """Компилирует сгенерированную функцию."""
+    source = "\n".join([header] + ["    " + line for line in body])
+    exec(compile(source, f"<compiled {name}>", "exec"), namespace)
+    return namespace[name]
+
+
+class CompiledSchema:
+    """Специализированная замена Schema.dump/Schema.load для одной схемы."""
+
+    def __init__(self, schema: Schema):
+        hooks = {name for hook_list in type(schema)._hooks.values() for name, *_ in hook_list}
+        if not hooks <= SUPPORTED_HOOKS:
+            raise TypeError(f"Неподдерживаемые хуки схемы: {sorted(hooks - SUPPORTED_HOOKS)}")
+        if schema.unknown not in (RAISE, EXCLUDE):
+            raise TypeError(f"Неподдерживаемый режим unknown: {schema.unknown}")
+
+        all_fields = {**schema.load_fields, **schema.dump_fields}
+        for field_name, field in all_fields.items():
+            if type(field) not in SUPPORTED_FIELDS:
+                raise TypeError(f"Неподдерживаемое поле {field_name}: {type(field).__name__}")
+
+        self.schema = schema
+        self.many = schema.many
+        self._bulk_limit = isinstance(schema, BulkLimitMixin)
+        self._type_error = schema.error_messages["type"]
+        self._load_one = self._compile_load(schema)
+        self._dump_one = self._compile_dump(schema)
+
+    @staticmethod
+    def _compile_load(schema: Schema) -> Callable[[Any], Dict[str, Any]]:
+        namespace: Dict[str, Any] = {
+            "_missing": missing,
+            "Mapping": Mapping,
+            "ValidationError": ValidationError,
+        }
+        known = set()
+        body = [
+            "if not isinstance(data, Mapping):",
+            f"    raise ValidationError({{'_schema': [{schema.error_messages['type']!r}]}})",
+            "result = {}",
+            "errors = {}",
+        ]
+        for index, (attr_name, field) in enumerate(schema.load_fields.items()):
+            key = field.data_key if field.data_key is not None else attr_name
+            known.add(key)
+            body += _load_field_source(field, field.attribute or attr_name, key, index, namespace)
+
+        if schema.unknown == RAISE:
+            namespace["_known"] = frozenset(known)
+            body += [
+                "for key in data:",
+                "    if key not in _known:",
+                f"        errors[key] = [{schema.error_messages['unknown']!r}]",
+            ]
+        body += [
+            "if errors:",
+            "    raise ValidationError(errors, data=data, valid_data=result)",
+            "return result",
+        ]
+        return _build("load", "def load(data):", body, namespace)
+
+    @staticmethod
+    def _compile_dump(schema: Schema) -> Callable[[Any], Dict[str, Any]]:
+        namespace: Dict[str, Any] = {
+            "_missing": missing,
+            "Mapping": Mapping,
+            "partial": partial,
+        }
+        body = [
+            # Как marshmallow.utils.get_value: словари по ключу, объекты по атрибуту
+            "get = obj.get if isinstance(obj, Mapping) else partial(getattr, obj)",
+            "result = {}",
+        ]
+        for index, (attr_name, field) in enumerate(schema.dump_fields.items()):
+            key = field.data_key if field.data_key is not None else attr_name
+            body += _dump_field_source(field, field.attribute or attr_name, key, index, namespace)
+        body.append("return result")
+        return _build("dump", "def dump(obj):", body, namespace)
+
+    def dump(self, obj: Any, *, many: Optional[bool] = None) -> Any:
+        """Сериализует объект (или список объектов при many=True)."""
+        if self.many if many is None else many:
+            return [self._dump_one(item) for item in obj]
+        return self._dump_one(obj)
+
+    def load(self, data: Any, *, many: Optional[bool] = None) -> Any:
+        """Валидирует и загружает данные; при ошибке бросает ValidationError."""
+        if not (self.many if many is None else many):
+            return self._load_one(data)
+
+        if self._bulk_limit:
+            try:
+                check_bulk_size(data)
+            except ValidationError as e:
+                raise ValidationError(e.normalized_messages(), data=data) from e
+        if not is_collection(data):
+            raise ValidationError({"_schema": [self._type_error]}, data=data, valid_data=[])
+
+        result = []
+        errors = {}
+        for index, item in enumerate(data):
+            try:
+                result.append(self._load_one(item))
+            except ValidationError as e:
+                errors[index] = e.messages
+        if errors:
+            raise ValidationError(errors, data=data)
+        return result
+
+
+def compile_schema(schema: Schema) -> CompiledSchema:
+    """Компилирует схему; TypeError, если схема не поддерживается."""
+    return CompiledSchema(schema)
+
+
+def compile_app_schemas(app: Application) -> Dict[Schema, CompiledSchema]:
+    """Компилирует поддерживаемые схемы запросов (из use_kwargs) всех обработчиков."""
+    compiled = {}
+    for route in app.router.routes():
+        for declared in getattr(route.handler, "__schemas__", None) or []:
+            schema = declared["schema"]
+            if schema in compiled:
+                continue
+            try:
+                compiled[schema] = compile_schema(schema)
+            except TypeError:
+                continue
+    return compiled
@@ -0,0 +1,73 @@
+"""Настройки приложения из переменных окружения."""
+
+import os
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Настройки сервера."""
+
+    db_path: str = "tasks.db"
+    # Число read-only соединений пула; 0 - все запросы идут через одно соединение
+    db_read_pool_size: int = 0
+    # Профиль PRAGMA SQLite: safe, balanced или fast (см. database.DURABILITY_PROFILES)
+    db_profile: str = "safe"
+    # Окно group commit в миллисекундах; 0 - каждая запись фиксируется отдельно
+    db_batch_window_ms: float = 0.0
+    # Максимальное число операций записи в одной транзакции group commit
+    db_batch_max_size: int = 100
+    # Размер кэша GET /tasks/{id} в записях; 0 - кэш выключен
+    cache_size: int = 0
+    # Время жизни записи кэша в секундах
+    cache_ttl: float = 60.0
+    # JSON backend: auto (orjson, ujson или json - что установлено), orjson, ujson, json
+    json_backend: str = "auto"
+    # Предкомпилированные dump/load для схем задач вместо общего механизма marshmallow
+    compiled_schemas: bool = False
+    # Объединение одновременных GET /tasks/{id} одной задачи в один запрос к БД
+    single_flight: bool = True
+    # Метрики Prometheus: middleware, таймеры методов БД и GET /metrics без аутентификации;
+    # включаются явно (TASKS_METRICS=1), чтобы не открывать /metrics в каждом развертывании
+    metrics: bool = False
+    # Порог журнала медленных SQL-запросов в миллисекундах; 0 - журнал выключен
+    slow_query_ms: float = 0.0
+    # Доля запросов, профилируемых по фазам (заголовок Server-Timing); 0 - ни одного
+    profile_sample_rate: float = 0.0
+    # Профилирование отдельного запроса по заголовку X-Profile: 1
+    profile_header: bool = False
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    """Читает логический флаг (1/true/yes/on) из переменной окружения."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def load_settings() -> Settings:
+    """Читает настройки из переменных окружения TASKS_*."""
+    return Settings(
+        db_path=os.getenv("TASKS_DB_PATH", Settings.db_path),
+        db_read_pool_size=int(os.getenv("TASKS_DB_READ_POOL_SIZE", Settings.db_read_pool_size)),
+        db_profile=os.getenv("TASKS_DB_PROFILE", Settings.db_profile),
+        db_batch_window_ms=float(
+            os.getenv("TASKS_DB_BATCH_WINDOW_MS", Settings.db_batch_window_ms)
+        ),
+        db_batch_max_size=int(os.getenv("TASKS_DB_BATCH_MAX_SIZE", Settings.db_batch_max_size)),
+        cache_size=int(os.getenv("TASKS_CACHE_SIZE", Settings.cache_size)),
+        cache_ttl=float(os.getenv("TASKS_CACHE_TTL", Settings.cache_ttl)),
+        json_backend=os.getenv("TASKS_JSON_BACKEND", Settings.json_backend),
+        compiled_schemas=_env_flag("TASKS_COMPILED_SCHEMAS", Settings.compiled_schemas),
+        single_flight=_env_flag("TASKS_SINGLE_FLIGHT", Settings.single_flight),
+        metrics=_env_flag("TASKS_METRICS", Settings.metrics),
+        slow_query_ms=float(os.getenv("TASKS_SLOW_QUERY_MS", Settings.slow_query_ms)),
+        profile_sample_rate=float(
+            os.getenv("TASKS_PROFILE_SAMPLE_RATE", Settings.profile_sample_rate)
+        ),
+        profile_header=_env_flag("TASKS_PROFILE_HEADER", Settings.profile_header),
+    )
+
+
+settings = load_settings()
@@ -1,112 +1,753 @@
 """Работа с базой данных SQLite."""
 
+import asyncio
+import functools
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 import aiosqlite
 
+from .cache import SingleFlight, TaskCache
+from .config import settings
+from .metrics import Metrics, StatSample, metrics_registry, timed
+from .models import TASK_COLUMNS, Task, task_row_factory
+from .profiling import SlowQueryLog, query_timer
+
+# Профили надежности/производительности: PRAGMA, применяемые при открытии соединения.
+# safe - поведение SQLite по умолчанию (rollback journal, fsync на каждый commit);
+# balanced - WAL + synchronous=NORMAL: commit не делает fsync, данные не теряются
+# при падении процесса, но последние транзакции могут пропасть при отключении питания;
+# fast - WAL без fsync вовсе, для тестовых стендов и перестраиваемых данных.
+DURABILITY_PROFILES: Dict[str, Dict[str, Any]] = {
+    "safe": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "cache_size": -2000,
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+        "busy_timeout": 5000,
+    },
+    "balanced": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -64000,
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    "fast": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -64000,
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+}
+
+# PRAGMA, которые меняют файл БД и поэтому применяются только к соединению-писателю
+WRITER_ONLY_PRAGMAS = {"journal_mode"}
+
+# Максимальное число параметров в одном IN (...) при пакетных операциях
+IN_CHUNK_SIZE = 500
+
+INSERT_TASK_SQL = (
+    "INSERT INTO tasks (title, description, status, created_at) VALUES (?, ?, ?, ?) "
+    f"RETURNING {TASK_COLUMNS}"
+)
+
+# Запросы пакетных операций (create_tasks, update_tasks, delete_tasks)
+MAX_ID_SQL = "SELECT COALESCE(MAX(id), 0) FROM tasks"
+INSERT_TASKS_SQL = "INSERT INTO tasks (title, description, status, created_at) VALUES (?, ?, ?, ?)"
+UPDATE_TASKS_SQL = (
+    "UPDATE tasks SET title = COALESCE(?, title), description = COALESCE(?, description), "
+    "status = COALESCE(?, status), version = version + 1 WHERE id = ?"
+)
+DELETE_TASK_SQL = "DELETE FROM tasks WHERE id = ?"
+
+# Миграции схемы по порядку; номер миграции = индекс + 1 и хранится в PRAGMA user_version.
+# Уже примененные миграции не меняются - изменения схемы добавляются новыми элементами.
+MIGRATIONS: List[Tuple[str, ...]] = [
+    # 1: таблица задач
+    (
+        """
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            description TEXT,
+            status TEXT NOT NULL DEFAULT 'pending',
+            created_at TEXT NOT NULL
+        )
+        """,
+    ),
+    # 2: индексы для фильтров списка: status с keyset по id и диапазон created_at
+    (
+        "CREATE INDEX IF NOT EXISTS idx_tasks_status_id ON tasks (status, id)",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks (created_at)",
+    ),
+    # 3: версия строки для ETag и оптимистичной блокировки
+    ("ALTER TABLE tasks ADD COLUMN version INTEGER NOT NULL DEFAULT 1",),
+    # 4: keyset по (created_at, id) для фильтров по дате - страница читается из индекса
+    # без полного просмотра и без сортировки; индекс только по created_at им заменяется
+    (
+        "CREATE INDEX IF NOT EXISTS idx_tasks_created_at_id ON tasks (created_at, id)",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_status_created_at_id "
+        "ON tasks (status, created_at, id)",
+        "DROP INDEX IF EXISTS idx_tasks_created_at",
+    ),
+]
+
+# Условие keyset по (created_at, id) после задачи-курсора. created_at курсора берется
+# по первичному ключу; если задачу удалили, - у ближайшей предыдущей по id
+CREATED_AT_CURSOR_CONDITION = (
+    "(created_at, id) > (COALESCE((SELECT created_at FROM tasks WHERE id <= ? "
+    "ORDER BY id DESC LIMIT 1), ''), ?)"
+)
+
+# Операция записи: выполняется на соединении-писателе внутри открытой транзакции
+WriteOp = Callable[[aiosqlite.Connection], Awaitable[Any]]
+
+
+# Наибольшее число допустимых версий в условии If-Match: число вариантов текста
+# UPDATE в кэше и число параметров запроса остаются ограниченными
+MAX_EXPECTED_VERSIONS = 16
+
+
+@functools.lru_cache(maxsize=128)
+def _update_task_sql(columns: Tuple[str, ...], version_checks: int = 0) -> str:
+    """Возвращает текст UPDATE ... RETURNING для набора колонок и числа допустимых версий."""
+    assignments = ", ".join(f"{column} = ?" for column in columns)
+    return (
+        f"UPDATE tasks SET {assignments}, version = version + 1 "
+        f"WHERE id = ?{_version_condition(version_checks)} RETURNING {TASK_COLUMNS}"
+    )
+
+
+def _version_condition(version_checks: int) -> str:
+    """Возвращает условие на версию строки для version_checks допустимых версий."""
+    if not version_checks:
+        return ""
+    return f" AND version IN ({', '.join('?' * version_checks)})"
+
+
+def _expected_versions(expected_versions: Optional[Sequence[int]]) -> List[int]:
+    """Возвращает допустимые версии без повторов; больше MAX_EXPECTED_VERSIONS - ошибка."""
+    versions = sorted(set(expected_versions or ()))
+    if len(versions) > MAX_EXPECTED_VERSIONS:
+        raise TooManyVersionsError(len(versions))
+    return versions
+
+
+class VersionMismatchError(Exception):
+    """Версия задачи не совпадает с ожидаемой (условная запись, If-Match)."""
+
+
+class TooManyVersionsError(Exception):
+    """Допустимых версий больше MAX_EXPECTED_VERSIONS (слишком длинный If-Match)."""
+
+
+@dataclass
+class BatchStats:
+    """Статистика group commit: сколько операций записи уложилось в одну транзакцию."""
+
+    batches: int = 0
+    operations: int = 0
+    last_size: int = 0
+    max_size: int = 0
+
+    def record(self, size: int) -> None:
+        """Учитывает зафиксированный пакет из size операций."""
+        self.batches += 1
+        self.operations += size
+        self.last_size = size
+        self.max_size = max(self.max_size, size)
+
+    @property
+    def avg_size(self) -> float:
+        """Средний размер пакета."""
+        return self.operations / self.batches if self.batches else 0.0
+
 
 class Database:
     """Менеджер базы данных SQLite."""
 
-    def __init__(self, db_path: str = "tasks.db"):
+    def __init__(
+        self,
+        db_path: str = "tasks.db",
+        read_pool_size: int = 0,
+        profile: str = "safe",
+        batch_window: float = 0.0,
+        batch_max_size: int = 100,
+        cache_size: int = 0,
+        cache_ttl: float = 60.0,
+        single_flight: bool = True,
+        metrics: Optional[Metrics] = None,
+        slow_query_threshold: float = 0.0,
+    ):
         """Инициализация подключения к БД."""
+        if profile not in DURABILITY_PROFILES:
+            raise ValueError(
+                f"Неизвестный профиль БД: {profile}. Допустимые: {', '.join(DURABILITY_PROFILES)}"
+            )
         self.db_path = db_path
+        self.read_pool_size = read_pool_size
+        self.profile = profile
         self._connection: Optional[aiosqlite.Connection] = None
+        self._readers: List[aiosqlite.Connection] = []
+        self._idle_readers: Optional[asyncio.Queue] = None
+        # Сериализует транзакции записи: соединение общее для всех корутин,
+        # и чужой commit() не должен зафиксировать половину нашей транзакции
+        self._write_lock = asyncio.Lock()
+
+        self.batch_window = batch_window
+        self.batch_max_size = batch_max_size
+        self.batch_stats = BatchStats()
+        self._pending: List[Tuple[WriteOp, asyncio.Future]] = []
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+        self._flush_tasks: Set[asyncio.Task] = set()
+
+        # Кэш сериализованных задач для чтения по id; сбрасывается записью через этот экземпляр
+        self.task_cache: Optional[TaskCache] = (
+            TaskCache(maxsize=cache_size, ttl=cache_ttl) if cache_size > 0 else None
+        )
+        # Общие загрузки задач для одновременных чтений одного id
+        self.task_loads: Optional[SingleFlight] = SingleFlight() if single_flight else None
+        # Реестр метрик для таймеров методов; None - без замеров
+        self.metrics = metrics
+        # Журнал медленных SQL-запросов; None - выключен
+        self.slow_queries: Optional[SlowQueryLog] = (
+            SlowQueryLog(slow_query_threshold) if slow_query_threshold > 0 else None
+        )
 
     async def connect(self) -> None:
         """Создает подключение к БД и инициализирует схему."""
         self._connection = await aiosqlite.connect(self.db_path)
         self._connection.row_factory = aiosqlite.Row
-        await self._init_schema()
+        await self._apply_pragmas(self._connection, writer=True)
+        await self._migrate()
+
+        # In-memory БД не разделяется между соединениями - пул для нее невозможен
+        if self.read_pool_size > 0 and self.db_path != ":memory:":
+            uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+            self._idle_readers = asyncio.Queue()
+            for _ in range(self.read_pool_size):
+                reader = await aiosqlite.connect(uri, uri=True)
+                reader.row_factory = aiosqlite.Row
+                await self._apply_pragmas(reader, writer=False)
+                self._readers.append(reader)
+                self._idle_readers.put_nowait(reader)
 
     async def close(self) -> None:
         """Закрывает подключение к БД."""
+        # Дожидаемся фиксации уже принятых в пакет операций
+        self._flush_pending()
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+
+        for reader in self._readers:
+            await reader.close()
+        self._readers = []
+        self._idle_readers = None
         if self._connection:
             await self._connection.close()
 
-    async def _init_schema(self) -> None:
-        """Создает таблицу tasks если она не существует."""
-        await self._connection.execute(
-            """
-            CREATE TABLE IF NOT EXISTS tasks (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                description TEXT,
-                status TEXT NOT NULL DEFAULT 'pending',
-                created_at TEXT NOT NULL
+    async def _apply_pragmas(self, connection: aiosqlite.Connection, writer: bool) -> None:
+        """Применяет PRAGMA выбранного профиля к соединению."""
+        for name, value in DURABILITY_PROFILES[self.profile].items():
+            if not writer and name in WRITER_ONLY_PRAGMAS:
+                continue
+            await connection.execute(f"PRAGMA {name} = {value}")
+
+    @asynccontextmanager
+    async def _reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Выдает соединение для чтения: свободное из пула или соединение-писатель."""
+        if self._idle_readers is None:
+            yield self._connection
+            return
+
+        reader = await self._idle_readers.get()
+        try:
+            yield reader
+        finally:
+            self._idle_readers.put_nowait(reader)
+
+    def _invalidate(self, *task_ids: int) -> None:
+        """Сбрасывает закэшированные представления и незавершенные загрузки измененных задач."""
+        if self.task_cache is not None:
+            self.task_cache.invalidate(*task_ids)
+        if self.task_loads is not None:
+            self.task_loads.forget(*task_ids)
+
+    async def _write(self, op: WriteOp) -> Any:
+        """Выполняет операцию записи: сразу отдельной транзакцией или в составе пакета."""
+        if self.batch_window <= 0:
+            async with self._write_lock:
+                try:
+                    result = await op(self._connection)
+                    with self._query("COMMIT"):
+                        await self._connection.commit()
+                except Exception:
+                    await self._connection.rollback()
+                    raise
+            self.batch_stats.record(1)
+            return result
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((op, future))
+        if len(self._pending) >= self.batch_max_size:
+            self._flush_pending()
+        elif self._flush_timer is None:
+            self._flush_timer = asyncio.get_running_loop().call_later(
+                self.batch_window, self._flush_pending
             )
-        """
-        )
-        await self._connection.commit()
+        return await future
+
+    def _flush_pending(self) -> None:
+        """Забирает накопленные операции и запускает их фиксацию одной транзакцией."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        task = asyncio.ensure_future(self._flush(batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush(self, batch: List[Tuple[WriteOp, asyncio.Future]]) -> None:
+        """Выполняет пакет операций записи и фиксирует его одним commit()."""
+        outcomes: List[Tuple[bool, Any]] = []
+        async with self._write_lock:
+            try:
+                for op, _ in batch:
+                    # Ошибка оператора SQLite откатывает только сам оператор,
+                    # транзакция и остальные операции пакета сохраняются
+                    try:
+                        outcomes.append((True, await op(self._connection)))
+                    except Exception as e:
+                        outcomes.append((False, e))
+                with self._query("COMMIT"):
+                    await self._connection.commit()
+            except Exception as e:
+                await self._connection.rollback()
+                outcomes = [(False, e)] * len(batch)
+
+        self.batch_stats.record(len(batch))
+        for (_, future), (ok, value) in zip(batch, outcomes):
+            if future.done():
+                continue
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+    async def _migrate(self) -> None:
+        """Применяет к БД миграции схемы, которые еще не были применены."""
+        async with self._connection.execute("PRAGMA user_version") as cursor:
+            (current_version,) = await cursor.fetchone()
+
+        # Миграция и user_version фиксируются одной транзакцией: прерванная миграция
+        # не оставляет схему наполовину измененной
+        for version in range(current_version + 1, len(MIGRATIONS) + 1):
+            try:
+                await self._connection.execute("BEGIN")
+                for statement in MIGRATIONS[version - 1]:
+                    await self._connection.execute(statement)
+                await self._connection.execute(f"PRAGMA user_version = {version}")
+                await self._connection.commit()
+            except Exception:
+                await self._connection.rollback()
+                raise
+
+    def stats_samples(self) -> List[StatSample]:
+        """Счетчики group commit, кэша задач и single-flight для /metrics (см. Metrics.register)."""
+        stats = self.batch_stats
+        samples: List[StatSample] = [
+            (
+                "db_batches_total",
+                "counter",
+                "Транзакции записи (пакеты group commit)",
+                stats.batches,
+            ),
+            ("db_batch_operations_total", "counter", "Операции записи в пакетах", stats.operations),
+            ("db_batch_last_size", "gauge", "Размер последнего пакета", stats.last_size),
+            ("db_batch_max_size", "gauge", "Наибольший размер пакета", stats.max_size),
+            ("db_batch_avg_size", "gauge", "Средний размер пакета", stats.avg_size),
+        ]
+        if self.task_cache is not None:
+            cache = self.task_cache.stats()
+            samples += [
+                ("task_cache_hits_total", "counter", "Попадания в кэш задач", cache["hits"]),
+                ("task_cache_misses_total", "counter", "Промахи кэша задач", cache["misses"]),
+                ("task_cache_evictions_total", "counter", "Вытеснения из кэша", cache["evictions"]),
+                ("task_cache_size", "gauge", "Записи в кэше задач", cache["size"]),
+                ("task_cache_max_size", "gauge", "Емкость кэша задач", cache["maxsize"]),
+            ]
+        if self.task_loads is not None:
+            loads = self.task_loads.stats()
+            samples += [
+                ("task_loads_total", "counter", "Загрузки задач из БД", loads["loads"]),
+                (
+                    "task_loads_shared_total",
+                    "counter",
+                    "Чтения, присоединившиеся к идущей загрузке",
+                    loads["shared"],
+                ),
+                ("task_loads_in_flight", "gauge", "Незавершенные загрузки", loads["in_flight"]),
+            ]
+        return samples
 
+    async def explain_query_plan(self, query: str, params: Sequence[Any] = ()) -> List[str]:
+        """Возвращает план выполнения запроса (колонка detail из EXPLAIN QUERY PLAN)."""
+        async with self._connection.execute(f"EXPLAIN QUERY PLAN {query}", params) as cursor:
+            return [row["detail"] for row in await cursor.fetchall()]
+
+    @timed
     async def create_task(
         self, title: str, description: Optional[str] = None, status: str = "pending"
-    ) -> Dict[str, Any]:
+    ) -> Task:
         """Создает новую задачу."""
         created_at = datetime.utcnow().isoformat()
-        cursor = await self._connection.execute(
-            "INSERT INTO tasks (title, description, status, created_at) VALUES (?, ?, ?, ?)",
-            (title, description, status, created_at),
-        )
-        await self._connection.commit()
-        task_id = cursor.lastrowid
-        return await self.get_task(task_id)
 
-    async def get_task(self, task_id: int) -> Optional[Dict[str, Any]]:
+        async def op(connection: aiosqlite.Connection) -> Task:
+            (task,) = await self._fetch_tasks(
+                connection, INSERT_TASK_SQL, (title, description, status, created_at)
+            )
+            return task
+
+        return await self._write(op)
+
+    @timed
+    async def get_task(self, task_id: int) -> Optional[Task]:
         """Получает задачу по ID."""
-        async with self._connection.execute(
-            "SELECT * FROM tasks WHERE id = ?", (task_id,)
-        ) as cursor:
-            row = await cursor.fetchone()
-            if row:
-                return dict(row)
-            return None
+        async with self._reader() as connection:
+            return await self._select_task(connection, task_id)
+
+    def _query(self, sql: str, params: Sequence[Any] = (), many: bool = False):
+        """Контекст замера SQL-запроса для журнала медленных запросов и профиля запроса."""
+        return query_timer(self.slow_queries, sql, params, many)
 
-    async def get_all_tasks(self) -> List[Dict[str, Any]]:
+    async def _fetch_tasks(
+        self, connection: aiosqlite.Connection, query: str, params: Sequence[Any] = ()
+    ) -> List[Task]:
+        """Выполняет запрос, выбирающий TASK_COLUMNS, и возвращает строки как Task."""
+        async with connection.cursor() as cursor:
+            cursor.row_factory = task_row_factory
+            with self._query(query, params):
+                await cursor.execute(query, params)
+                return await cursor.fetchall()
+
+    async def _select_task(self, connection: aiosqlite.Connection, task_id: int) -> Optional[Task]:
+        """Читает задачу по ID через указанное соединение."""
+        tasks = await self._fetch_tasks(
+            connection, f"SELECT {TASK_COLUMNS} FROM tasks WHERE id = ?", (task_id,)
+        )
+        return tasks[0] if tasks else None
+
+    @timed
+    async def get_all_tasks(self) -> List[Task]:
         """Получает все задачи."""
-        async with self._connection.execute("SELECT * FROM tasks ORDER BY id") as cursor:
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+        async with self._reader() as connection:
+            return await self._fetch_tasks(
+                connection, f"SELECT {TASK_COLUMNS} FROM tasks ORDER BY id"
+            )
 
+    @timed
+    async def list_tasks(
+        self,
+        after_id: Optional[int] = None,
+        limit: int = 20,
+        status: Optional[str] = None,
+        created_from: Optional[str] = None,
+        created_to: Optional[str] = None,
+    ) -> Tuple[List[Task], Optional[int]]:
+        """Получает страницу задач и курсор следующей страницы (None - страница последняя)."""
+        query, params = self._list_query(
+            after_id=after_id,
+            limit=limit + 1,
+            status=status,
+            created_from=created_from,
+            created_to=created_to,
+        )
+
+        async with self._reader() as connection:
+            tasks = await self._fetch_tasks(connection, query, params)
+
+        if len(tasks) > limit:
+            del tasks[limit:]
+            return tasks, tasks[-1].id
+        return tasks, None
+
+    async def iter_tasks(
+        self,
+        chunk_size: int = 500,
+        status: Optional[str] = None,
+        created_from: Optional[str] = None,
+        created_to: Optional[str] = None,
+    ) -> AsyncIterator[List[Task]]:
+        """Итерирует все задачи порциями по chunk_size, не загружая таблицу целиком."""
+        after_id = None
+        while True:
+            tasks, after_id = await self.list_tasks(
+                after_id=after_id,
+                limit=chunk_size,
+                status=status,
+                created_from=created_from,
+                created_to=created_to,
+            )
+            if tasks:
+                yield tasks
+            if after_id is None:
+                return
+
+    @classmethod
+    def _list_query(
+        cls,
+        after_id: Optional[int] = None,
+        limit: int = 20,
+        status: Optional[str] = None,
+        created_from: Optional[str] = None,
+        created_to: Optional[str] = None,
+    ) -> Tuple[str, List[Any]]:
+        """Собирает SELECT страницы задач и его параметры."""
+        # С фильтром по created_at keyset идет по (created_at, id), чтобы страница читалась
+        # из индекса без сортировки диапазона; курсор по-прежнему id последней задачи
+        by_created_at = created_from is not None or created_to is not None
+        conditions, params = cls._build_filters(
+            after_id=None if by_created_at else after_id,
+            status=status,
+            created_from=created_from,
+            created_to=created_to,
+        )
+        if by_created_at and after_id is not None:
+            conditions.insert(0, CREATED_AT_CURSOR_CONDITION)
+            params[0:0] = [after_id, after_id]
+        query = f"SELECT {TASK_COLUMNS} FROM tasks"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY created_at, id LIMIT ?" if by_created_at else " ORDER BY id LIMIT ?"
+        params.append(limit)
+        return query, params
+
+    @staticmethod
+    def _build_filters(
+        after_id: Optional[int] = None,
+        status: Optional[str] = None,
+        created_from: Optional[str] = None,
+        created_to: Optional[str] = None,
+    ) -> Tuple[List[str], List[Any]]:
+        """Собирает условия WHERE и параметры для фильтров списка задач."""
+        conditions: List[str] = []
+        params: List[Any] = []
+
+        if after_id is not None:
+            conditions.append("id > ?")
+            params.append(after_id)
+        if status is not None:
+            conditions.append("status = ?")
+            params.append(status)
+        if created_from is not None:
+            conditions.append("created_at >= ?")
+            params.append(created_from)
+        if created_to is not None:
+            conditions.append("created_at < ?")
+            params.append(created_to)
+
+        return conditions, params
+
+    @timed
     async def update_task(
         self,
         task_id: int,
         title: Optional[str] = None,
         description: Optional[str] = None,
         status: Optional[str] = None,
-    ) -> Optional[Dict[str, Any]]:
-        """Обновляет задачу по ID."""
-        updates = []
-        params = []
-
-        if title is not None:
-            updates.append("title = ?")
-            params.append(title)
-        if description is not None:
-            updates.append("description = ?")
-            params.append(description)
-        if status is not None:
-            updates.append("status = ?")
-            params.append(status)
+        expected_versions: Optional[Sequence[int]] = None,
+    ) -> Optional[Task]:
+        """Обновляет задачу по ID; при несовпадении expected_versions - VersionMismatchError."""
+        values = {"title": title, "description": description, "status": status}
+        columns = tuple(column for column, value in values.items() if value is not None)
+        versions = _expected_versions(expected_versions)
 
-        if not updates:
-            return await self.get_task(task_id)
+        if not columns or (expected_versions is not None and not versions):
+            task = await self.get_task(task_id)
+            if task and expected_versions is not None and task.version not in versions:
+                raise VersionMismatchError(task_id)
+            return task
 
+        query = _update_task_sql(columns, len(versions))
+        params = [values[column] for column in columns]
         params.append(task_id)
-        query = f'UPDATE tasks SET {", ".join(updates)} WHERE id = ?'
+        params.extend(versions)
+
+        async def op(connection: aiosqlite.Connection) -> Optional[Task]:
+            tasks = await self._fetch_tasks(connection, query, params)
+            if tasks:
+                return tasks[0]
+            if expected_versions is not None and await self._select_task(connection, task_id):
+                raise VersionMismatchError(task_id)
+            return None
+
+        task = await self._write(op)
+        self._invalidate(task_id)
+        return task
+
+    @timed
+    async def delete_task(
+        self, task_id: int, expected_versions: Optional[Sequence[int]] = None
+    ) -> bool:
+        """Удаляет задачу по ID; expected_versions - как в update_task."""
+        versions = _expected_versions(expected_versions)
+        if expected_versions is not None and not versions:
+            if await self.get_task(task_id):
+                raise VersionMismatchError(task_id)
+            return False
+
+        query = DELETE_TASK_SQL + _version_condition(len(versions))
+
+        async def op(connection: aiosqlite.Connection) -> bool:
+            params = (task_id, *versions)
+            with self._query(query, params):
+                cursor = await connection.execute(query, params)
+            if cursor.rowcount > 0:
+                return True
+            if expected_versions is not None and await self._select_task(connection, task_id):
+                raise VersionMismatchError(task_id)
+            return False
+
+        deleted = await self._write(op)
+        self._invalidate(task_id)
+        return deleted
+
+    @timed
+    async def create_tasks(self, items: List[Dict[str, Any]]) -> List[Task]:
+        """Создает несколько задач одной транзакцией и возвращает их в порядке items."""
+        if not items:
+            return []
+
+        created_at = datetime.utcnow().isoformat()
+        params = [
+            (item["title"], item.get("description"), item.get("status", "pending"), created_at)
+            for item in items
+        ]
+
+        async with self._write_lock:
+            try:
+                # Блокировка записи до чтения MAX(id): другие соединения не вставят строки
+                # между ним и вставкой, и новые задачи читаются одним запросом по диапазону id
+                await self._connection.execute("BEGIN IMMEDIATE")
+                with self._query(MAX_ID_SQL):
+                    async with self._connection.execute(MAX_ID_SQL) as cursor:
+                        (max_id,) = await cursor.fetchone()
+                with self._query(INSERT_TASKS_SQL, params, many=True):
+                    await self._connection.executemany(INSERT_TASKS_SQL, params)
+                tasks = await self._fetch_tasks(
+                    self._connection,
+                    f"SELECT {TASK_COLUMNS} FROM tasks WHERE id > ? ORDER BY id",
+                    (max_id,),
+                )
+                with self._query("COMMIT"):
+                    await self._connection.commit()
+            except Exception:
+                await self._connection.rollback()
+                raise
+
+        return tasks
+
+    @timed
+    async def update_tasks(self, items: List[Dict[str, Any]]) -> List[Optional[Task]]:
+        """Обновляет несколько задач одной транзакцией; None - для несуществующих id."""
+        if not items:
+            return []
+
+        params = [
+            (item.get("title"), item.get("description"), item.get("status"), item["id"])
+            for item in items
+        ]
+        ids = [item["id"] for item in items]
+
+        async with self._write_lock:
+            try:
+                with self._query(UPDATE_TASKS_SQL, params, many=True):
+                    await self._connection.executemany(UPDATE_TASKS_SQL, params)
+                tasks = await self._fetch_by_ids(ids)
+                with self._query("COMMIT"):
+                    await self._connection.commit()
+            except Exception:
+                await self._connection.rollback()
+                raise
+
+        self._invalidate(*ids)
+        return [tasks.get(task_id) for task_id in ids]
+
+    @timed
+    async def delete_tasks(self, ids: List[int]) -> List[bool]:
+        """Удаляет несколько задач одной транзакцией; для каждого id - признак удаления."""
+        if not ids:
+            return []
 
-        await self._connection.execute(query, params)
-        await self._connection.commit()
+        async with self._write_lock:
+            try:
+                existing = await self._fetch_by_ids(ids)
+                params = [(task_id,) for task_id in existing]
+                with self._query(DELETE_TASK_SQL, params, many=True):
+                    await self._connection.executemany(DELETE_TASK_SQL, params)
+                with self._query("COMMIT"):
+                    await self._connection.commit()
+            except Exception:
+                await self._connection.rollback()
+                raise
 
-        return await self.get_task(task_id)
+        self._invalidate(*ids)
+        deleted = set()
+        results = []
+        for task_id in ids:
+            # Повторный id в одном пакете удаляет задачу только один раз
+            results.append(task_id in existing and task_id not in deleted)
+            deleted.add(task_id)
+        return results
 
-    async def delete_task(self, task_id: int) -> bool:
-        """Удаляет задачу по ID."""
-        cursor = await self._connection.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
-        await self._connection.commit()
-        return cursor.rowcount > 0
+    async def _fetch_by_ids(self, ids: List[int]) -> Dict[int, Task]:
+        """Читает задачи по списку id порциями по IN_CHUNK_SIZE."""
+        unique_ids = list(dict.fromkeys(ids))
+        tasks: Dict[int, Task] = {}
+        for start in range(0, len(unique_ids), IN_CHUNK_SIZE):
+            chunk = unique_ids[start : start + IN_CHUNK_SIZE]
+            placeholders = ", ".join("?" * len(chunk))
+            for task in await self._fetch_tasks(
+                self._connection,
+                f"SELECT {TASK_COLUMNS} FROM tasks WHERE id IN ({placeholders})",
+                chunk,
+            ):
+                tasks[task.id] = task
+        return tasks
 
 
 # Глобальный экземпляр БД
-db = Database()
+db = Database(
+    settings.db_path,
+    read_pool_size=settings.db_read_pool_size,
+    profile=settings.db_profile,
+    batch_window=settings.db_batch_window_ms / 1000,
+    batch_max_size=settings.db_batch_max_size,
+    cache_size=settings.cache_size,
+    cache_ttl=settings.cache_ttl,
+    single_flight=settings.single_flight,
+    metrics=metrics_registry if settings.metrics else None,
+    slow_query_threshold=settings.slow_query_ms / 1000,
+)
@@ -1,11 +1,93 @@
 """Обработчики HTTP запросов."""
 
-from aiohttp.web import Request, Response, json_response
+import functools
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from aiohttp.web import Request, Response, StreamResponse
 from aiohttp_apispec import docs, marshal_with, use_kwargs
-from marshmallow import ValidationError
 
-from .database import db
-from .schemas import TaskCreateSchema, TaskSchema, TaskUpdateSchema
+from .compiled_schemas import compile_schema
+from .config import settings
+from .database import TooManyVersionsError, VersionMismatchError, db
+from .jsoncodec import dumps, json_response
+from .middlewares import REQUEST_DATA_KEY
+from .models import Task
+from .profiling import phase
+from .schemas import (
+    TaskBulkDeleteSchema,
+    TaskBulkResultSchema,
+    TaskBulkUpdateSchema,
+    TaskCreateSchema,
+    TaskExportQuerySchema,
+    TaskListQuerySchema,
+    TaskListSchema,
+    TaskSchema,
+    TaskUpdateSchema,
+)
+
+# Схемы создаются один раз: marshmallow строит поля и хуки при создании экземпляра
+task_schema = compile_schema(TaskSchema()) if settings.compiled_schemas else TaskSchema()
+task_list_schema = TaskListSchema()
+task_bulk_result_schema = TaskBulkResultSchema()
+
+# Количество задач, читаемых из БД и отправляемых клиенту за одну запись при выгрузке
+EXPORT_CHUNK_SIZE = 500
+
+
+def _to_db_timestamp(value: Optional[datetime]) -> Optional[str]:
+    """Приводит datetime к формату created_at в БД (naive UTC, ISO 8601)."""
+    if value is None:
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat()
+
+
+def _task_etag(task: Task) -> str:
+    """Строит strong ETag задачи из id и версии строки."""
+    return f"{task.id}-{task.version}"
+
+
+def _if_none_match(request: Request, etag: str) -> bool:
+    """Проверяет If-None-Match (слабое сравнение, как требует RFC 9110)."""
+    if request.if_none_match is None:
+        return False
+    return any(tag.value in ("*", etag) for tag in request.if_none_match)
+
+
+def _if_match_versions(request: Request, task_id: int) -> Optional[List[int]]:
+    """Извлекает из If-Match допустимые версии задачи; None - условие не задано."""
+    if request.if_match is None or any(tag.value == "*" for tag in request.if_match):
+        return None
+
+    versions = set()
+    prefix = f"{task_id}-"
+    for tag in request.if_match:
+        if not tag.is_weak and tag.value.startswith(prefix):
+            version = tag.value[len(prefix) :]
+            if version.isdigit():
+                versions.add(int(version))
+    return sorted(versions)
+
+
+def _precondition_failed() -> Response:
+    """Ответ 412 на несовпавший If-Match."""
+    return json_response({"error": "Precondition failed"}, status=412)
+
+
+def _too_many_etags() -> Response:
+    """Ответ 400 на If-Match со слишком большим числом ETag."""
+    return json_response({"error": "Too many ETags in If-Match"}, status=400)
+
+
+def _list_filters(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Преобразует провалидированные query-параметры в фильтры Database."""
+    return {
+        "status": params.get("status"),
+        "created_from": _to_db_timestamp(params.get("created_from")),
+        "created_to": _to_db_timestamp(params.get("created_to")),
+    }
 
 
 @docs(
@@ -28,13 +110,7 @@ async def health_handler(request: Request) -> Response:
 async def create_task_handler(request: Request) -> Response:
     """Создает новую задачу. Endpoint: POST /tasks"""
     try:
-        data = await request.json()
-        schema = TaskCreateSchema()
-
-        try:
-            validated_data = schema.load(data)
-        except ValidationError as e:
-            return json_response({"error": "Validation failed", "details": e.messages}, status=400)
+        validated_data = request[REQUEST_DATA_KEY]
 
         task = await db.create_task(
             validated_data["title"],
@@ -42,58 +118,143 @@ async def create_task_handler(request: Request) -> Response:
             validated_data.get("status", "pending"),
         )
 
-        result_schema = TaskSchema()
-        return json_response(result_schema.dump(task), status=201)
+        with phase("serialize"):
+            response = json_response(task_schema.dump(task), status=201)
+        response.etag = _task_etag(task)
+        return response
+    except Exception as e:
+        return json_response({"error": str(e)}, status=500)
+
+
+@docs(
+    tags=["tasks"],
+    summary="Список задач",
+    description="Возвращает страницу задач с курсорной пагинацией и фильтрами",
+)
+@use_kwargs(TaskListQuerySchema, location="querystring")
+@marshal_with(TaskListSchema, code=200, description="Страница задач")
+async def list_tasks_handler(request: Request) -> Response:
+    """Получает страницу задач. Endpoint: GET /tasks"""
+    try:
+        params = request[REQUEST_DATA_KEY]
+        tasks, next_cursor = await db.list_tasks(
+            after_id=params.get("cursor"), limit=params["limit"], **_list_filters(params)
+        )
+
+        with phase("serialize"):
+            page = task_list_schema.dump({"items": tasks, "next_cursor": next_cursor})
+            return json_response(page)
     except Exception as e:
         return json_response({"error": str(e)}, status=500)
 
 
-@docs(tags=["tasks"], summary="Получить задачу", description="Получает задачу по её ID")
+@docs(
+    tags=["tasks"],
+    summary="Выгрузить задачи",
+    description="Потоково выгружает все задачи в формате NDJSON (одна задача на строку)",
+    produces=["application/x-ndjson"],
+)
+@use_kwargs(TaskExportQuerySchema, location="querystring")
+@marshal_with(TaskSchema, code=200, description="Поток задач в формате NDJSON")
+async def export_tasks_handler(request: Request) -> StreamResponse:
+    """Потоково выгружает задачи. Endpoint: GET /tasks/export"""
+    params = request[REQUEST_DATA_KEY]
+
+    response = StreamResponse()
+    response.content_type = "application/x-ndjson"
+    response.charset = "utf-8"
+    await response.prepare(request)
+
+    # write() ждет освобождения буфера: медленный клиент притормаживает чтение из БД
+    async for chunk in db.iter_tasks(chunk_size=EXPORT_CHUNK_SIZE, **_list_filters(params)):
+        await response.write(b"".join(dumps(task_schema.dump(task)) + b"\n" for task in chunk))
+
+    await response.write_eof()
+    return response
+
+
+@docs(
+    tags=["tasks"],
+    summary="Получить задачу",
+    description="Получает задачу по её ID. Ответ содержит ETag; "
+    "при совпадении If-None-Match возвращается 304 без тела",
+    parameters=[{"in": "header", "name": "If-None-Match", "type": "string", "required": False}],
+    responses={"304": {"description": "Задача не изменилась"}},
+)
 @marshal_with(TaskSchema, code=200, description="Задача найдена")
 async def get_task_handler(request: Request) -> Response:
     """Получает задачу по ID. Endpoint: GET /tasks/{id}"""
     try:
         task_id = int(request.match_info["id"])
-        task = await db.get_task(task_id)
 
-        if not task:
+        async def load() -> Optional[Tuple[str, bytes]]:
+            task = await db.get_task(task_id)
+            if not task:
+                return None
+            with phase("serialize"):
+                return _task_etag(task), dumps(task_schema.dump(task))
+
+        fetch = load
+        if db.task_loads is not None:
+            # Одновременные запросы одной задачи ждут один запрос к БД и одну сериализацию
+            fetch = functools.partial(db.task_loads.do, task_id, load)
+
+        if db.task_cache is not None:
+            entry = await db.task_cache.get_or_load(task_id, fetch)
+        else:
+            entry = await fetch()
+
+        if entry is None:
             return json_response({"error": "Task not found"}, status=404)
 
-        schema = TaskSchema()
-        return json_response(schema.dump(task))
+        etag, body = entry
+        if _if_none_match(request, etag):
+            response = Response(status=304)
+        else:
+            response = Response(body=body, content_type="application/json", charset="utf-8")
+        response.etag = etag
+        return response
     except ValueError:
         return json_response({"error": "Invalid task ID"}, status=400)
     except Exception as e:
         return json_response({"error": str(e)}, status=500)
 
 
-@docs(tags=["tasks"], summary="Обновить задачу", description="Обновляет задачу по её ID")
+@docs(
+    tags=["tasks"],
+    summary="Обновить задачу",
+    description="Обновляет задачу по её ID. С заголовком If-Match задача обновляется, "
+    "только если её ETag совпадает, иначе возвращается 412",
+    responses={"412": {"description": "ETag задачи не совпадает с If-Match"}},
+)
 @use_kwargs(TaskUpdateSchema, location="json")
 @marshal_with(TaskSchema, code=200, description="Задача успешно обновлена")
 async def update_task_handler(request: Request) -> Response:
     """Обновляет задачу по ID. Endpoint: PUT /tasks/{id}"""
     try:
         task_id = int(request.match_info["id"])
-        data = await request.json()
-        schema = TaskUpdateSchema()
+        validated_data = request[REQUEST_DATA_KEY]
 
         try:
-            validated_data = schema.load(data)
-        except ValidationError as e:
-            return json_response({"error": "Validation failed", "details": e.messages}, status=400)
-
-        task = await db.update_task(
-            task_id,
-            title=validated_data.get("title"),
-            description=validated_data.get("description"),
-            status=validated_data.get("status"),
-        )
+            task = await db.update_task(
+                task_id,
+                title=validated_data.get("title"),
+                description=validated_data.get("description"),
+                status=validated_data.get("status"),
+                expected_versions=_if_match_versions(request, task_id),
+            )
+        except VersionMismatchError:
+            return _precondition_failed()
+        except TooManyVersionsError:
+            return _too_many_etags()
 
         if not task:
             return json_response({"error": "Task not found"}, status=404)
 
-        result_schema = TaskSchema()
-        return json_response(result_schema.dump(task))
+        with phase("serialize"):
+            response = json_response(task_schema.dump(task))
+        response.etag = _task_etag(task)
+        return response
     except ValueError:
         return json_response({"error": "Invalid task ID"}, status=400)
     except Exception as e:
@@ -103,13 +264,23 @@ async def update_task_handler(request: Request) -> Response:
 @docs(
     tags=["tasks"],
     summary="Удалить задачу",
-    description="Удаляет задачу по её ID",
+    description="Удаляет задачу по её ID. С заголовком If-Match задача удаляется, "
+    "только если её ETag совпадает, иначе возвращается 412",
+    parameters=[{"in": "header", "name": "If-Match", "type": "string", "required": False}],
+    responses={"412": {"description": "ETag задачи не совпадает с If-Match"}},
 )
 async def delete_task_handler(request: Request) -> Response:
     """Удаляет задачу по ID. Endpoint: DELETE /tasks/{id}"""
     try:
         task_id = int(request.match_info["id"])
-        deleted = await db.delete_task(task_id)
+        try:
+            deleted = await db.delete_task(
+                task_id, expected_versions=_if_match_versions(request, task_id)
+            )
+        except VersionMismatchError:
+            return _precondition_failed()
+        except TooManyVersionsError:
+            return _too_many_etags()
 
         if not deleted:
             return json_response({"error": "Task not found"}, status=404)
@@ -119,3 +290,74 @@ async def delete_task_handler(request: Request) -> Response:
         return json_response({"error": "Invalid task ID"}, status=400)
     except Exception as e:
         return json_response({"error": str(e)}, status=500)
+
+
+@docs(
+    tags=["tasks"],
+    summary="Создать задачи пакетом",
+    description="Создает несколько задач одной транзакцией",
+)
+@use_kwargs(TaskCreateSchema(many=True), location="json")
+@marshal_with(TaskBulkResultSchema, code=201, description="Задачи успешно созданы")
+async def bulk_create_tasks_handler(request: Request) -> Response:
+    """Создает задачи пакетом. Endpoint: POST /tasks/bulk"""
+    try:
+        tasks = await db.create_tasks(request[REQUEST_DATA_KEY])
+
+        items = [{"id": task.id, "code": 201, "task": task} for task in tasks]
+        with phase("serialize"):
+            return json_response(task_bulk_result_schema.dump({"items": items}), status=201)
+    except Exception as e:
+        return json_response({"error": str(e)}, status=500)
+
+
+@docs(
+    tags=["tasks"],
+    summary="Обновить задачи пакетом",
+    description="Обновляет несколько задач одной транзакцией",
+)
+@use_kwargs(TaskBulkUpdateSchema(many=True), location="json")
+@marshal_with(TaskBulkResultSchema, code=200, description="Результаты обновления по задачам")
+async def bulk_update_tasks_handler(request: Request) -> Response:
+    """Обновляет задачи пакетом. Endpoint: PATCH /tasks/bulk"""
+    try:
+        validated_data = request[REQUEST_DATA_KEY]
+        tasks = await db.update_tasks(validated_data)
+
+        items = []
+        for item, task in zip(validated_data, tasks):
+            if task is None:
+                items.append({"id": item["id"], "code": 404, "error": "Task not found"})
+            else:
+                items.append({"id": item["id"], "code": 200, "task": task})
+
+        with phase("serialize"):
+            return json_response(task_bulk_result_schema.dump({"items": items}))
+    except Exception as e:
+        return json_response({"error": str(e)}, status=500)
+
+
+@docs(
+    tags=["tasks"],
+    summary="Удалить задачи пакетом",
+    description="Удаляет несколько задач одной транзакцией",
+)
+@use_kwargs(TaskBulkDeleteSchema, location="json")
+@marshal_with(TaskBulkResultSchema, code=200, description="Результаты удаления по задачам")
+async def bulk_delete_tasks_handler(request: Request) -> Response:
+    """Удаляет задачи пакетом. Endpoint: DELETE /tasks/bulk"""
+    try:
+        ids = request[REQUEST_DATA_KEY]["ids"]
+        deleted = await db.delete_tasks(ids)
+
+        items = []
+        for task_id, is_deleted in zip(ids, deleted):
+            if is_deleted:
+                items.append({"id": task_id, "code": 200})
+            else:
+                items.append({"id": task_id, "code": 404, "error": "Task not found"})
+
+        with phase("serialize"):
+            return json_response(task_bulk_result_schema.dump({"items": items}))
+    except Exception as e:
+        return json_response({"error": str(e)}, status=500)
@@ -0,0 +1,102 @@
+"""Подключаемый JSON-кодек для разбора запросов и формирования ответов."""
+
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Union
+
+from aiohttp.web import Request, Response
+
+from .config import settings
+
+# Порядок перебора backend-ов в режиме "auto"
+BACKENDS = ("orjson", "ujson", "json")
+
+
+@dataclass(frozen=True)
+class JsonCodec:
+    """Пара функций кодирования/декодирования JSON."""
+
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[Union[bytes, str]], Any]
+
+
+def _orjson_codec() -> JsonCodec:
+    import orjson
+
+    # Ошибки валидации many=True содержат целочисленные ключи (индексы элементов)
+    option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=option)
+
+    return JsonCodec("orjson", dumps, orjson.loads)
+
+
+def _ujson_codec() -> JsonCodec:
+    import ujson
+
+    def dumps(obj: Any) -> bytes:
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode("utf-8")
+
+    return JsonCodec("ujson", dumps, ujson.loads)
+
+
+def _stdlib_codec() -> JsonCodec:
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+    def dumps(obj: Any) -> bytes:
+        return encoder.encode(obj).encode("utf-8")
+
+    return JsonCodec("json", dumps, json.loads)
+
+
+_FACTORIES: Dict[str, Callable[[], JsonCodec]] = {
+    "orjson": _orjson_codec,
+    "ujson": _ujson_codec,
+    "json": _stdlib_codec,
+}
+
+
+def get_codec(name: str = "auto") -> JsonCodec:
+    """Возвращает кодек по имени backend-а."""
+    if name == "auto":
+        for candidate in BACKENDS:
+            try:
+                return _FACTORIES[candidate]()
+            except ImportError:
+                continue
+    if name not in _FACTORIES:
+        raise ValueError(f"Unknown JSON backend: {name}")
+    return _FACTORIES[name]()
+
+
+codec = get_codec(settings.json_backend)
+
+
+def dumps(obj: Any) -> bytes:
+    """Кодирует объект в JSON (bytes, UTF-8)."""
+    return codec.dumps(obj)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Декодирует JSON; при некорректном документе бросает ValueError."""
+    return codec.loads(data)
+
+
+def json_response(
+    data: Any, *, status: int = 200, headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """Замена aiohttp.web.json_response, кодирующая тело текущим кодеком."""
+    return Response(
+        body=codec.dumps(data),
+        status=status,
+        headers=headers,
+        content_type="application/json",
+        charset="utf-8",
+    )
+
+
+async def read_json(request: Request) -> Any:
+    """Читает и декодирует JSON-тело запроса текущим кодеком."""
+    return codec.loads(await request.read())
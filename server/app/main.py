@@ -3,8 +3,13 @@
 from aiohttp import web
 from aiohttp.web import Application
 
+from .compiled_schemas import compile_app_schemas
+from .config import settings
 from .database import db
+from .metrics import metrics_registry, setup_metrics
+from .middlewares import COMPILED_SCHEMAS_KEY, validation_middleware
 from .openapi import setup_openapi
+from .profiling import Profiler, setup_profiling
 from .routes import setup_routes
 
 
@@ -20,9 +25,17 @@ async def close_db(app: Application) -> None:
 
 def create_app() -> Application:
     """Создает и настраивает aiohttp приложение."""
-    app = web.Application()
+    app = web.Application(middlewares=[validation_middleware])
     setup_routes(app)
+    # Каждый setup_* ставит свой middleware первым: метрики оказываются снаружи профилирования
+    if settings.profile_sample_rate > 0 or settings.profile_header:
+        setup_profiling(app, Profiler(settings.profile_sample_rate, settings.profile_header))
+    if settings.metrics:
+        setup_metrics(app, metrics_registry)
+        metrics_registry.register("database", db.stats_samples)
     setup_openapi(app)
+    if settings.compiled_schemas:
+        app[COMPILED_SCHEMAS_KEY] = compile_app_schemas(app)
     app.on_startup.append(init_db)
     app.on_cleanup.append(close_db)
     return app
@@ -0,0 +1,296 @@
+"""Метрики сервера в формате Prometheus."""
+
+import functools
+import time
+from bisect import bisect_left
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from aiohttp import web
+from aiohttp.web import Application, Request, Response, StreamResponse
+
+# Границы корзин гистограмм времени (секунды) и размеров (байты)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+# Метка маршрута для запросов, не совпавших ни с одним ресурсом (404/405):
+# подставлять сам путь нельзя - число серий росло бы без ограничений
+UNMATCHED_ROUTE = "unmatched"
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Handler = Callable[[Request], Awaitable[StreamResponse]]
+Labels = Tuple[Tuple[str, str], ...]
+# Значение источника: имя метрики, тип (counter/gauge), описание, значение
+StatSample = Tuple[str, str, str, float]
+Collector = Callable[[], Iterable[StatSample]]
+
+
+class Histogram:
+    """Гистограмма с фиксированными границами корзин."""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float]):
+        """Инициализация пустой гистограммы с границами bounds (по возрастанию)."""
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Добавляет наблюдение."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> Iterator[Tuple[str, int]]:
+        """Возвращает пары (le, накопленное число наблюдений), включая +Inf."""
+        total = 0
+        for bound, count in zip(self.bounds, self.counts):
+            total += count
+            yield _format_value(bound), total
+        yield "+Inf", self.count
+
+
+class RouteStats:
+    """Счетчики одного маршрута (метод + каноническая форма пути)."""
+
+    __slots__ = ("latency", "request_size", "response_size", "in_flight", "statuses", "errors")
+
+    def __init__(self, latency_buckets: Sequence[float], size_buckets: Sequence[float]):
+        """Инициализация нулевых счетчиков."""
+        self.latency = Histogram(latency_buckets)
+        self.request_size = Histogram(size_buckets)
+        self.response_size = Histogram(size_buckets)
+        self.in_flight = 0
+        # Код ответа -> число запросов
+        self.statuses: Dict[int, int] = {}
+        # Ответы 5xx и необработанные исключения
+        self.errors = 0
+
+    def observe(self, status: int, seconds: float, request_size: int, response_size: int) -> None:
+        """Учитывает завершенный запрос."""
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        if status >= 500:
+            self.errors += 1
+        self.latency.observe(seconds)
+        self.request_size.observe(request_size)
+        self.response_size.observe(response_size)
+
+
+class Metrics:
+    """Реестр метрик HTTP-запросов и запросов к БД."""
+
+    def __init__(
+        self,
+        latency_buckets: Sequence[float] = LATENCY_BUCKETS,
+        size_buckets: Sequence[float] = SIZE_BUCKETS,
+    ):
+        """Инициализация пустого реестра с заданными границами корзин."""
+        self.latency_buckets = latency_buckets
+        self.size_buckets = size_buckets
+        self.routes: Dict[Tuple[str, str], RouteStats] = {}
+        # Имя метода Database -> гистограмма времени и число ошибок
+        self.queries: Dict[str, Histogram] = {}
+        self.query_errors: Dict[str, int] = {}
+        # Имя источника -> функция, возвращающая его текущие значения
+        self.collectors: Dict[str, Collector] = {}
+
+    def route(self, method: str, route: str) -> RouteStats:
+        """Возвращает счетчики маршрута, создавая их при первом запросе."""
+        stats = self.routes.get((method, route))
+        if stats is None:
+            stats = self.routes[(method, route)] = RouteStats(
+                self.latency_buckets, self.size_buckets
+            )
+        return stats
+
+    def observe_query(self, name: str, seconds: float, failed: bool = False) -> None:
+        """Учитывает вызов метода Database."""
+        histogram = self.queries.get(name)
+        if histogram is None:
+            histogram = self.queries[name] = Histogram(self.latency_buckets)
+        histogram.observe(seconds)
+        if failed:
+            self.query_errors[name] = self.query_errors.get(name, 0) + 1
+
+    def register(self, name: str, collector: Collector) -> None:
+        """Регистрирует источник значений; повторная регистрация имени заменяет прежний."""
+        self.collectors[name] = collector
+
+    def render(self) -> str:
+        """Отрисовывает все метрики в текстовом формате Prometheus."""
+        lines: List[str] = []
+        routes = sorted(self.routes.items())
+
+        _family(lines, "http_requests_in_flight", "gauge", "Запросы в обработке")
+        for (method, route), stats in routes:
+            _sample(lines, "http_requests_in_flight", _route_labels(method, route), stats.in_flight)
+
+        _family(lines, "http_requests_total", "counter", "Завершенные запросы по кодам ответа")
+        for (method, route), stats in routes:
+            for status, count in sorted(stats.statuses.items()):
+                labels = _route_labels(method, route) + (("status", str(status)),)
+                _sample(lines, "http_requests_total", labels, count)
+
+        _family(lines, "http_request_errors_total", "counter", "Ответы 5xx и исключения")
+        for (method, route), stats in routes:
+            _sample(lines, "http_request_errors_total", _route_labels(method, route), stats.errors)
+
+        for name, attribute, help_text in (
+            ("http_request_duration_seconds", "latency", "Время обработки запроса"),
+            ("http_request_size_bytes", "request_size", "Размер тела запроса"),
+            ("http_response_size_bytes", "response_size", "Размер тела ответа"),
+        ):
+            _family(lines, name, "histogram", help_text)
+            for (method, route), stats in routes:
+                _histogram(lines, name, _route_labels(method, route), getattr(stats, attribute))
+
+        queries = sorted(self.queries.items())
+        _family(lines, "db_query_duration_seconds", "histogram", "Время выполнения методов БД")
+        for name, histogram in queries:
+            _histogram(lines, "db_query_duration_seconds", (("method", name),), histogram)
+
+        _family(lines, "db_query_errors_total", "counter", "Методы БД, завершившиеся ошибкой")
+        for name, _ in queries:
+            _sample(
+                lines, "db_query_errors_total", (("method", name),), self.query_errors.get(name, 0)
+            )
+
+        for collector in self.collectors.values():
+            for name, kind, help_text, value in collector():
+                _family(lines, name, kind, help_text)
+                _sample(lines, name, (), value)
+
+        lines.append("")
+        return "\n".join(lines)
+
+
+def _format_value(value: float) -> str:
+    """Число в формате Prometheus: целые без дробной части."""
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """Экранирует значение метки."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _route_labels(method: str, route: str) -> Labels:
+    """Метки маршрута."""
+    return (("method", method), ("route", route))
+
+
+def _family(lines: List[str], name: str, kind: str, help_text: str) -> None:
+    """Добавляет заголовок семейства метрик (HELP и TYPE)."""
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {kind}")
+
+
+def _sample(lines: List[str], name: str, labels: Labels, value: float) -> None:
+    """Добавляет одно значение метрики."""
+    if not labels:
+        lines.append(f"{name} {_format_value(value)}")
+        return
+    rendered = ",".join(f'{key}="{_escape(label)}"' for key, label in labels)
+    lines.append(f"{name}{{{rendered}}} {_format_value(value)}")
+
+
+def _histogram(lines: List[str], name: str, labels: Labels, histogram: Histogram) -> None:
+    """Добавляет корзины, сумму и число наблюдений гистограммы."""
+    for le, count in histogram.cumulative():
+        _sample(lines, f"{name}_bucket", labels + (("le", le),), count)
+    _sample(lines, f"{name}_sum", labels, histogram.sum)
+    _sample(lines, f"{name}_count", labels, histogram.count)
+
+
+def timed(method: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """Декоратор метода Database: время вызова учитывается в self.metrics под именем метода."""
+    name = method.__name__
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        metrics = self.metrics
+        if metrics is None:
+            return await method(self, *args, **kwargs)
+        started = time.perf_counter()
+        failed = True
+        try:
+            result = await method(self, *args, **kwargs)
+            failed = False
+            return result
+        finally:
+            metrics.observe_query(name, time.perf_counter() - started, failed)
+
+    return wrapper
+
+
+# Ключ приложения с реестром метрик
+METRICS_KEY = web.AppKey("metrics", Metrics)
+
+
+def _response_size(response: Optional[StreamResponse]) -> int:
+    """Размер тела ответа: уже отправленного (потоковый ответ) или готового к отправке."""
+    if response is None:
+        return 0
+    if response.prepared:
+        return response.body_length
+    return response.content_length or 0
+
+
+@web.middleware
+async def metrics_middleware(request: Request, handler: Handler) -> StreamResponse:
+    """Учитывает запрос в метриках его маршрута."""
+    resource = request.match_info.route.resource
+    route = resource.canonical if resource is not None else UNMATCHED_ROUTE
+    stats = request.app[METRICS_KEY].route(request.method, route)
+
+    stats.in_flight += 1
+    started = time.perf_counter()
+    status = 500
+    response: Optional[StreamResponse] = None
+    try:
+        response = await handler(request)
+        status = response.status
+        return response
+    except web.HTTPException as e:
+        response = e
+        status = e.status
+        raise
+    finally:
+        stats.in_flight -= 1
+        stats.observe(
+            status,
+            time.perf_counter() - started,
+            request.content_length or 0,
+            _response_size(response),
+        )
+
+
+async def metrics_handler(request: Request) -> Response:
+    """Отдает метрики в текстовом формате Prometheus. Endpoint: GET /metrics"""
+    return Response(text=request.app[METRICS_KEY].render(), headers={"Content-Type": CONTENT_TYPE})
+
+
+def setup_metrics(app: Application, metrics: Metrics) -> None:
+    """Подключает сбор метрик: middleware снаружи остальных и маршрут /metrics."""
+    app[METRICS_KEY] = metrics
+    app.middlewares.insert(0, metrics_middleware)
+    app.router.add_get("/metrics", metrics_handler)
+
+
+# Глобальный реестр: общий для приложения и глобального экземпляра БД
+metrics_registry = Metrics()
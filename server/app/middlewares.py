@@ -0,0 +1,57 @@
+"""Middleware приложения."""
+
+from typing import Any, Awaitable, Callable
+
+from aiohttp import web
+from aiohttp.web import Request, StreamResponse
+from marshmallow import ValidationError
+
+from .jsoncodec import json_response, read_json
+from .profiling import phase
+
+# Ключ Request, в который кладутся провалидированные данные запроса
+REQUEST_DATA_KEY = "data"
+
+# Ключ приложения со скомпилированными схемами запросов (см. compiled_schemas)
+COMPILED_SCHEMAS_KEY = web.AppKey("compiled_schemas", dict)
+
+Handler = Callable[[Request], Awaitable[StreamResponse]]
+
+
+@web.middleware
+async def validation_middleware(request: Request, handler: Handler) -> StreamResponse:
+    """Разбирает и валидирует данные запроса один раз перед вызовом обработчика."""
+    schemas = getattr(request.match_info.handler, "__schemas__", None)
+    if not schemas:
+        return await handler(request)
+
+    compiled = request.app.get(COMPILED_SCHEMAS_KEY)
+
+    result: Any = {}
+    for declared in schemas:
+        if declared["locations"][0] == "json":
+            try:
+                with phase("parse"):
+                    raw = await read_json(request)
+            except ValueError:
+                return json_response({"error": "Invalid JSON body"}, status=400)
+        else:
+            raw = request.query
+
+        schema = declared["schema"]
+        if compiled:
+            schema = compiled.get(schema, schema)
+
+        try:
+            with phase("validate"):
+                data = schema.load(raw)
+        except ValidationError as e:
+            return json_response({"error": "Validation failed", "details": e.messages}, status=400)
+
+        if isinstance(data, dict) and isinstance(result, dict):
+            result.update(data)
+        else:
+            result = data
+
+    request[REQUEST_DATA_KEY] = result
+    return await handler(request)
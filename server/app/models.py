@@ -0,0 +1,25 @@
+"""Модели данных, возвращаемые слоем БД."""
+
+import sqlite3
+from dataclasses import dataclass
+from typing import Optional
+
+# Колонки задачи в порядке полей Task; используются во всех SELECT/RETURNING задач
+TASK_COLUMNS = "id, title, description, status, created_at, version"
+
+
+@dataclass(slots=True)
+class Task:
+    """Задача - строка таблицы tasks."""
+
+    id: int
+    title: str
+    description: Optional[str]
+    status: str
+    created_at: str
+    version: int
+
+
+def task_row_factory(cursor: sqlite3.Cursor, row: tuple) -> Task:
+    """row_factory для курсора запроса, выбирающего TASK_COLUMNS."""
+    return Task(*row)
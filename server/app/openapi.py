@@ -1,12 +1,48 @@
 """Конфигурация OpenAPI документации."""
 
+import gzip
+import hashlib
 from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import yaml
 from aiohttp import web
 from aiohttp.web import Application
 from aiohttp_apispec import setup_aiohttp_apispec
 
+from .jsoncodec import dumps
+
+try:
+    import brotli
+except ImportError:  # brotli - необязательная зависимость
+    brotli = None
+
+# Предпочтительный порядок сжатия, если клиент принимает несколько вариантов
+PREFERRED_ENCODINGS = ("br", "gzip")
+
+
+@dataclass(frozen=True)
+class RenderedSpec:
+    """Спецификация, закодированная в один формат вместе со сжатыми вариантами."""
+
+    content_type: str
+    body: bytes
+    digest: str
+    # Сжатые варианты тела: Content-Encoding -> bytes
+    encoded: Dict[str, bytes] = field(default_factory=dict)
+
+    def etag(self, encoding: Optional[str]) -> str:
+        """Strong ETag варианта: у разных Content-Encoding разные байты, значит и ETag."""
+        return f"{self.digest}-{encoding}" if encoding else self.digest
+
+
+# Ключ приложения с уже отрисованными форматами спецификации
+SPEC_CACHE_KEY = web.AppKey("openapi_spec_cache", dict)
+
+# Исходные описания __apispec__ обработчиков до первой регистрации (обработчик -> описание)
+_APISPEC_SOURCES: Dict[Callable, Dict[str, Any]] = {}
+
 
 def _convert_ordered_dict_to_dict(obj):
     """Рекурсивно преобразует OrderedDict в обычный dict для сериализации в YAML."""
@@ -20,19 +56,137 @@ def _convert_ordered_dict_to_dict(obj):
         return obj
 
 
+def _copy_apispec(value: Any) -> Any:
+    """Копирует словари и списки описания __apispec__; схемы marshmallow остаются общими."""
+    if isinstance(value, dict):
+        return {key: _copy_apispec(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_apispec(item) for item in value]
+    return value
+
+
+async def _restore_apispec(app: Application) -> None:
+    """Дает обработчикам чистую копию __apispec__ перед построением спецификации."""
+    for route in app.router.routes():
+        handler = route.handler
+        if hasattr(handler, "__apispec__"):
+            source = _APISPEC_SOURCES.setdefault(handler, handler.__apispec__)
+            handler.__apispec__ = _copy_apispec(source)
+
+
+def render_json(spec: Dict[str, Any]) -> bytes:
+    """Кодирует спецификацию в JSON."""
+    return dumps(spec)
+
+
+def render_yaml(spec: Dict[str, Any]) -> bytes:
+    """Кодирует спецификацию в YAML."""
+    spec_dict = _convert_ordered_dict_to_dict(spec)
+    return yaml.safe_dump(spec_dict, sort_keys=False, allow_unicode=True).encode("utf-8")
+
+
+# Формат -> (Content-Type, функция кодирования)
+SPEC_FORMATS: Dict[str, Tuple[str, Callable[[Dict[str, Any]], bytes]]] = {
+    "json": ("application/json", render_json),
+    "yaml": ("application/x-yaml", render_yaml),
+}
+
+
+def render_spec(spec: Dict[str, Any], spec_format: str) -> RenderedSpec:
+    """Кодирует спецификацию и заранее сжимает ее всеми доступными способами."""
+    content_type, render = SPEC_FORMATS[spec_format]
+    body = render(spec)
+    # mtime=0 - одинаковые байты gzip при каждом запуске, а значит и одинаковый ETag
+    encoded = {"gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        encoded["br"] = brotli.compress(body)
+    return RenderedSpec(content_type, body, hashlib.sha256(body).hexdigest()[:32], encoded)
+
+
+def _get_rendered(app: Application, spec_format: str) -> Optional[RenderedSpec]:
+    """Возвращает отрисованную спецификацию, кодируя ее при первом обращении."""
+    cache = app[SPEC_CACHE_KEY]
+    rendered = cache.get(spec_format)
+    if rendered is None:
+        spec = app.get("swagger_dict")
+        if not spec:
+            return None
+        rendered = cache[spec_format] = render_spec(spec, spec_format)
+    return rendered
+
+
+def _choose_encoding(request: web.Request, rendered: RenderedSpec) -> Optional[str]:
+    """Выбирает сжатие по Accept-Encoding; None - тело без сжатия."""
+    accepted = set()
+    for item in request.headers.get("Accept-Encoding", "").split(","):
+        coding, _, params = item.partition(";")
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                if float(params[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip().lower())
+
+    for encoding in PREFERRED_ENCODINGS:
+        if encoding in rendered.encoded and (encoding in accepted or "*" in accepted):
+            return encoding
+    return None
+
+
+async def _spec_response(request: web.Request, spec_format: str) -> web.Response:
+    """Отдает заранее закодированную спецификацию с ETag и поддержкой 304."""
+    rendered = _get_rendered(request.app, spec_format)
+    if rendered is None:
+        return web.Response(text="OpenAPI спецификация недоступна", status=500)
+
+    encoding = _choose_encoding(request, rendered)
+    etag = rendered.etag(encoding)
+    headers = {"Vary": "Accept-Encoding", "Cache-Control": "no-cache"}
+
+    if request.if_none_match is not None and any(
+        tag.value in ("*", etag) for tag in request.if_none_match
+    ):
+        response = web.Response(status=304, headers=headers)
+    else:
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+        body = rendered.encoded[encoding] if encoding else rendered.body
+        response = web.Response(
+            body=body, headers=headers, content_type=rendered.content_type, charset="utf-8"
+        )
+    response.etag = etag
+    return response
+
+
+async def swagger_json_handler(request: web.Request) -> web.Response:
+    """Отдает OpenAPI спецификацию в формате JSON."""
+    return await _spec_response(request, "json")
+
+
 async def swagger_yaml_handler(request: web.Request) -> web.Response:
     """Отдает OpenAPI спецификацию в формате YAML."""
-    spec = request.app.get("swagger_dict")
-    if not spec:
-        return web.Response(text="OpenAPI спецификация недоступна", status=500)
+    return await _spec_response(request, "yaml")
 
-    spec_dict = _convert_ordered_dict_to_dict(spec)
-    yaml_body = yaml.safe_dump(spec_dict, sort_keys=False, allow_unicode=True)
-    return web.Response(text=yaml_body, content_type="application/x-yaml")
+
+async def _render_on_startup(app: Application) -> None:
+    """Кодирует все форматы спецификации сразу после ее построения aiohttp-apispec."""
+    for spec_format in SPEC_FORMATS:
+        _get_rendered(app, spec_format)
 
 
 def setup_openapi(app: Application) -> None:
     """Настраивает OpenAPI документацию для приложения."""
+    app[SPEC_CACHE_KEY] = {}
+
+    # Регистрируется раньше встроенного обработчика aiohttp-apispec и перекрывает его,
+    # чтобы спецификация отдавалась из кэша тем же JSON-кодеком, что и остальные ответы.
+    # Встроенный маршрут остается именованным ресурсом для страницы Swagger UI.
+    app.router.add_get("/swagger.json", swagger_json_handler)
+    # aiohttp-apispec при регистрации изменяет __apispec__ обработчиков, и следующее приложение
+    # в процессе теряло схемы тел запросов. Хук выполняется перед хуком aiohttp-apispec
+    app.on_startup.append(_restore_apispec)
     setup_aiohttp_apispec(
         app=app,
         title="Tasks API",
@@ -43,6 +197,8 @@ def setup_openapi(app: Application) -> None:
             "description": "REST API для управления задачами (tasks)",
         },
     )
+    # aiohttp-apispec строит swagger_dict в своем on_startup, этот хук выполняется после него
+    app.on_startup.append(_render_on_startup)
 
     # Endpoint для YAML-версии спецификации
     app.router.add_get("/swagger.yaml", swagger_yaml_handler)
@@ -0,0 +1,201 @@
+"""Журнал медленных SQL-запросов и выборочное профилирование запросов."""
+
+import logging
+import random
+import time
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence
+
+from aiohttp import web
+from aiohttp.web import Application, Request, StreamResponse
+
+logger = logging.getLogger(__name__)
+
+# Фазы в порядке вывода в Server-Timing
+PHASES = ("parse", "validate", "db", "serialize")
+
+# Заголовок запроса, включающий профилирование (если это разрешено настройками)
+PROFILE_HEADER = "X-Profile"
+
+Handler = Callable[[Request], Awaitable[StreamResponse]]
+
+
+class RequestProfile:
+    """Накопленное время фаз одного запроса в секундах."""
+
+    __slots__ = ("phases",)
+
+    def __init__(self):
+        """Инициализация профиля без замеров."""
+        self.phases: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+
+    def add(self, name: str, seconds: float) -> None:
+        """Добавляет время к фазе."""
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def server_timing(self, total: float) -> str:
+        """Значение заголовка Server-Timing: длительности фаз и total в миллисекундах."""
+        metrics = [f"{name};dur={seconds * 1000:.3f}" for name, seconds in self.phases.items()]
+        metrics.append(f"total;dur={total * 1000:.3f}")
+        return ", ".join(metrics)
+
+
+# Профиль текущего запроса; None - запрос не профилируется
+current_profile: ContextVar[Optional[RequestProfile]] = ContextVar("current_profile", default=None)
+
+
+class _PhaseTimer:
+    """Контекстный менеджер, добавляющий время блока к фазе профиля."""
+
+    __slots__ = ("profile", "name", "started")
+
+    def __init__(self, profile: RequestProfile, name: str):
+        self.profile = profile
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.started = time.perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.profile.add(self.name, time.perf_counter() - self.started)
+
+
+class _NoTimer:
+    """Пустой контекстный менеджер для запросов без профилирования."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+
+NO_TIMER = _NoTimer()
+
+
+def phase(name: str):
+    """Замеряет блок как фазу name текущего профиля; без профиля ничего не делает."""
+    profile = current_profile.get()
+    if profile is None:
+        return NO_TIMER
+    return _PhaseTimer(profile, name)
+
+
+def params_shape(params: Sequence[Any], many: bool = False) -> str:
+    """Форма параметров запроса без значений: типы, для длинных списков - тип и длина."""
+    if many:
+        rows = list(params)
+        return f"{len(rows)} x {params_shape(rows[0])}" if rows else "0 x ()"
+    types = [type(value).__name__ for value in params]
+    if len(types) > 4 and len(set(types)) == 1:
+        return f"({types[0]} x {len(types)})"
+    return f"({', '.join(types)})"
+
+
+class SlowQueryLog:
+    """Пишет в лог SQL-запросы, выполнявшиеся не меньше threshold секунд."""
+
+    def __init__(self, threshold: float, log: logging.Logger = logger):
+        """Инициализация журнала с порогом threshold."""
+        self.threshold = threshold
+        self.log = log
+        self.slow_queries = 0
+
+    def record(self, sql: str, params: Sequence[Any], seconds: float, many: bool = False) -> None:
+        """Учитывает выполненный запрос."""
+        if seconds < self.threshold:
+            return
+        self.slow_queries += 1
+        self.log.warning(
+            "Медленный запрос %.1f мс: %s; параметры %s",
+            seconds * 1000,
+            " ".join(sql.split()),
+            params_shape(params, many),
+        )
+
+
+class QueryTimer:
+    """Замер одного SQL-запроса: время идет в фазу db профиля и в журнал медленных запросов."""
+
+    __slots__ = ("slow_log", "profile", "sql", "params", "many", "started")
+
+    def __init__(
+        self,
+        slow_log: Optional[SlowQueryLog],
+        profile: Optional[RequestProfile],
+        sql: str,
+        params: Sequence[Any],
+        many: bool,
+    ):
+        self.slow_log = slow_log
+        self.profile = profile
+        self.sql = sql
+        self.params = params
+        self.many = many
+
+    def __enter__(self) -> None:
+        self.started = time.perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        seconds = time.perf_counter() - self.started
+        if self.profile is not None:
+            self.profile.add("db", seconds)
+        if self.slow_log is not None:
+            self.slow_log.record(self.sql, self.params, seconds, self.many)
+
+
+def query_timer(
+    slow_log: Optional[SlowQueryLog], sql: str, params: Sequence[Any] = (), many: bool = False
+):
+    """Контекст замера SQL-запроса; если замерять некуда, возвращает пустой менеджер."""
+    profile = current_profile.get()
+    if slow_log is None and profile is None:
+        return NO_TIMER
+    return QueryTimer(slow_log, profile, sql, params, many)
+
+
+class Profiler:
+    """Выбор профилируемых запросов: доля sample_rate и/или заголовок X-Profile."""
+
+    def __init__(self, sample_rate: float = 0.0, allow_header: bool = False):
+        """Инициализация: sample_rate от 0 до 1, allow_header разрешает X-Profile: 1."""
+        self.sample_rate = sample_rate
+        self.allow_header = allow_header
+
+    def sampled(self, request: Request) -> bool:
+        """Нужно ли профилировать запрос."""
+        if self.allow_header:
+            value = request.headers.get(PROFILE_HEADER)
+            if value is not None and value.strip().lower() in ("1", "true", "yes", "on"):
+                return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+
+# Ключ приложения с настройками выбора профилируемых запросов
+PROFILER_KEY = web.AppKey("profiler", Profiler)
+
+
+@web.middleware
+async def profiling_middleware(request: Request, handler: Handler) -> StreamResponse:
+    """Профилирует выбранные запросы и добавляет к ответу заголовок Server-Timing."""
+    if not request.app[PROFILER_KEY].sampled(request):
+        return await handler(request)
+
+    profile = RequestProfile()
+    token = current_profile.set(profile)
+    started = time.perf_counter()
+    try:
+        response = await handler(request)
+    finally:
+        current_profile.reset(token)
+    if not response.prepared:
+        response.headers["Server-Timing"] = profile.server_timing(time.perf_counter() - started)
+    return response
+
+
+def setup_profiling(app: Application, profiler: Profiler) -> None:
+    """Подключает выборочное профилирование запросов."""
+    app[PROFILER_KEY] = profiler
+    app.middlewares.insert(0, profiling_middleware)
@@ -3,10 +3,15 @@
 from aiohttp.web import Application
 
 from .handlers import (
+    bulk_create_tasks_handler,
+    bulk_delete_tasks_handler,
+    bulk_update_tasks_handler,
     create_task_handler,
     delete_task_handler,
+    export_tasks_handler,
     get_task_handler,
     health_handler,
+    list_tasks_handler,
     update_task_handler,
 )
 
@@ -14,7 +19,12 @@ from .handlers import (
 def setup_routes(app: Application) -> None:
     """Регистрирует все маршруты приложения."""
     app.router.add_get("/health", health_handler)
+    app.router.add_get("/tasks", list_tasks_handler)
     app.router.add_post("/tasks", create_task_handler)
+    app.router.add_get("/tasks/export", export_tasks_handler)
+    app.router.add_post("/tasks/bulk", bulk_create_tasks_handler)
+    app.router.add_patch("/tasks/bulk", bulk_update_tasks_handler)
+    app.router.add_delete("/tasks/bulk", bulk_delete_tasks_handler)
     app.router.add_get("/tasks/{id}", get_task_handler)
     app.router.add_put("/tasks/{id}", update_task_handler)
     app.router.add_delete("/tasks/{id}", delete_task_handler)
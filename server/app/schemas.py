@@ -1,6 +1,16 @@
 """Marshmallow схемы для валидации данных."""
 
-from marshmallow import Schema, fields, validate
+from marshmallow import EXCLUDE, Schema, ValidationError, fields, pre_load, validate
+
+TASK_STATUSES = ["pending", "in_progress", "completed"]
+EXPORT_FORMATS = ["ndjson"]
+
+# Размер страницы списка задач по умолчанию и его верхняя граница
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# Максимальное число элементов в одном пакетном запросе
+MAX_BULK_SIZE = 1000
 
 
 class TaskSchema(Schema):
@@ -9,20 +19,32 @@ class TaskSchema(Schema):
     id = fields.Integer(required=True, dump_only=True)
     title = fields.String(required=True)
     description = fields.String(allow_none=True)
-    status = fields.String(
-        required=True, validate=validate.OneOf(["pending", "in_progress", "completed"])
-    )
+    status = fields.String(required=True, validate=validate.OneOf(TASK_STATUSES))
     created_at = fields.String(required=True, dump_only=True)
 
 
-class TaskCreateSchema(Schema):
+def check_bulk_size(data):
+    """Отклоняет пакет (список) длиннее MAX_BULK_SIZE."""
+    if isinstance(data, list) and len(data) > MAX_BULK_SIZE:
+        raise ValidationError(f"Максимальный размер пакета: {MAX_BULK_SIZE}")
+
+
+class BulkLimitMixin:
+    """Ограничивает размер списка при загрузке схемы с many=True."""
+
+    @pre_load(pass_many=True)
+    def check_bulk_size(self, data, many, **kwargs):
+        if many:
+            check_bulk_size(data)
+        return data
+
+
+class TaskCreateSchema(BulkLimitMixin, Schema):
     """Схема для валидации данных при создании задачи."""
 
     title = fields.String(required=True, validate=validate.Length(min=1, max=200))
     description = fields.String(allow_none=True, validate=validate.Length(max=1000))
-    status = fields.String(
-        load_default="pending", validate=validate.OneOf(["pending", "in_progress", "completed"])
-    )
+    status = fields.String(load_default="pending", validate=validate.OneOf(TASK_STATUSES))
 
 
 class TaskUpdateSchema(Schema):
@@ -30,6 +52,76 @@ class TaskUpdateSchema(Schema):
 
     title = fields.String(allow_none=True, validate=validate.Length(min=1, max=200))
     description = fields.String(allow_none=True, validate=validate.Length(max=1000))
-    status = fields.String(
-        allow_none=True, validate=validate.OneOf(["pending", "in_progress", "completed"])
+    status = fields.String(allow_none=True, validate=validate.OneOf(TASK_STATUSES))
+
+
+class TaskFilterSchema(Schema):
+    """Схема query-параметров фильтрации задач."""
+
+    class Meta:
+        unknown = EXCLUDE
+
+    status = fields.String(validate=validate.OneOf(TASK_STATUSES))
+    created_from = fields.DateTime(
+        metadata={"description": "Нижняя граница created_at (включительно)"}
+    )
+    created_to = fields.DateTime(metadata={"description": "Верхняя граница created_at (исключая)"})
+
+
+class TaskListQuerySchema(TaskFilterSchema):
+    """Схема query-параметров списка задач (keyset-пагинация и фильтры)."""
+
+    cursor = fields.Integer(
+        validate=validate.Range(min=0),
+        metadata={"description": "Курсор: id последней задачи предыдущей страницы"},
+    )
+    limit = fields.Integer(
+        load_default=DEFAULT_PAGE_SIZE, validate=validate.Range(min=1, max=MAX_PAGE_SIZE)
+    )
+
+
+class TaskExportQuerySchema(TaskFilterSchema):
+    """Схема query-параметров потоковой выгрузки задач."""
+
+    format = fields.String(load_default="ndjson", validate=validate.OneOf(EXPORT_FORMATS))
+
+
+class TaskListSchema(Schema):
+    """Схема страницы списка задач в ответе API."""
+
+    items = fields.List(fields.Nested(TaskSchema), required=True)
+    next_cursor = fields.Integer(
+        allow_none=True,
+        metadata={"description": "Курсор следующей страницы или null, если страница последняя"},
+    )
+
+
+class TaskBulkUpdateSchema(BulkLimitMixin, TaskUpdateSchema):
+    """Схема элемента пакетного обновления задач."""
+
+    id = fields.Integer(required=True)
+
+
+class TaskBulkDeleteSchema(Schema):
+    """Схема тела запроса пакетного удаления задач."""
+
+    ids = fields.List(
+        fields.Integer(), required=True, validate=validate.Length(min=1, max=MAX_BULK_SIZE)
+    )
+
+
+class TaskBulkItemResultSchema(Schema):
+    """Схема результата обработки одного элемента пакетного запроса."""
+
+    id = fields.Integer(required=True)
+    code = fields.Integer(
+        required=True, metadata={"description": "HTTP-код результата для элемента"}
     )
+    task = fields.Nested(TaskSchema, allow_none=True)
+    error = fields.String(allow_none=True)
+
+
+class TaskBulkResultSchema(Schema):
+    """Схема ответа пакетного запроса."""
+
+    items = fields.List(fields.Nested(TaskBulkItemResultSchema), required=True)
@@ -7,7 +7,7 @@ from pathlib import Path
 import pytest
 from aiohttp.test_utils import TestClient, TestServer
 from app.database import Database
-from app.main import create_app
+from app.main import close_db, create_app, init_db
 
 
 @pytest.fixture
@@ -75,3 +75,13 @@ async def client(app):
     """Создает тестовый HTTP клиент."""
     async with TestClient(TestServer(app)) as test_client:
         yield test_client
+
+
+@pytest.fixture
+async def spec_client():
+    """Клиент приложения с регистрацией OpenAPI, но без подключения к БД."""
+    app_instance = create_app()
+    app_instance.on_startup.remove(init_db)
+    app_instance.on_cleanup.remove(close_db)
+    async with TestClient(TestServer(app_instance)) as test_client:
+        yield test_client
@@ -1,6 +1,10 @@
 """Тесты для API endpoints."""
 
+import asyncio
+import json
+
 import pytest
+from app.database import MAX_EXPECTED_VERSIONS
 
 
 @pytest.mark.asyncio
@@ -193,3 +197,482 @@ class TestTasksEndpoint:
             assert resp.status == 400
             data = await resp.json()
             assert "error" in data
+
+
+@pytest.mark.asyncio
+class TestTasksListEndpoint:
+    """Тесты для списка задач GET /tasks."""
+
+    async def _create_tasks(self, client, statuses):
+        """Создает задачи с указанными статусами и возвращает их id."""
+        ids = []
+        for i, status in enumerate(statuses):
+            task_data = {"title": f"Задача {i}", "status": status}
+            async with client.post("/tasks", json=task_data) as resp:
+                assert resp.status == 201
+                ids.append((await resp.json())["id"])
+        return ids
+
+    async def test_list_empty(self, client):
+        """Тест пустого списка задач."""
+        async with client.get("/tasks") as resp:
+            assert resp.status == 200
+            data = await resp.json()
+            assert data == {"items": [], "next_cursor": None}
+
+    async def test_list_pagination(self, client):
+        """Тест обхода всех страниц по курсору."""
+        ids = await self._create_tasks(client, ["pending"] * 5)
+
+        seen = []
+        cursor = None
+        pages = 0
+        while True:
+            params = {"limit": 2}
+            if cursor is not None:
+                params["cursor"] = cursor
+            async with client.get("/tasks", params=params) as resp:
+                assert resp.status == 200
+                data = await resp.json()
+            assert len(data["items"]) <= 2
+            seen.extend(item["id"] for item in data["items"])
+            pages += 1
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == ids
+        assert pages == 3
+
+    async def test_list_filter_status(self, client):
+        """Тест фильтрации списка по status."""
+        ids = await self._create_tasks(client, ["pending", "completed", "pending", "completed"])
+
+        async with client.get("/tasks", params={"status": "completed"}) as resp:
+            assert resp.status == 200
+            data = await resp.json()
+            assert [item["id"] for item in data["items"]] == [ids[1], ids[3]]
+            assert all(item["status"] == "completed" for item in data["items"])
+
+    async def test_list_filter_created_at_range(self, client):
+        """Тест фильтрации списка по диапазону created_at."""
+        ids = await self._create_tasks(client, ["pending", "pending"])
+        async with client.get(f"/tasks/{ids[1]}") as resp:
+            created_at = (await resp.json())["created_at"]
+
+        async with client.get("/tasks", params={"created_from": created_at}) as resp:
+            data = await resp.json()
+            assert [item["id"] for item in data["items"]] == [ids[1]]
+
+        async with client.get("/tasks", params={"created_to": created_at}) as resp:
+            data = await resp.json()
+            assert [item["id"] for item in data["items"]] == [ids[0]]
+
+    async def test_list_limit_cap(self, client):
+        """Тест валидации: limit выше допустимого максимума."""
+        async with client.get("/tasks", params={"limit": 1000}) as resp:
+            assert resp.status == 400
+            data = await resp.json()
+            assert "error" in data
+
+    async def test_list_invalid_cursor(self, client):
+        """Тест валидации: невалидный курсор."""
+        async with client.get("/tasks", params={"cursor": "abc"}) as resp:
+            assert resp.status == 400
+            data = await resp.json()
+            assert "error" in data
+
+
+@pytest.mark.asyncio
+class TestTasksExportEndpoint:
+    """Тесты для потоковой выгрузки GET /tasks/export."""
+
+    async def test_export_ndjson(self, client, monkeypatch):
+        """Тест выгрузки всех задач несколькими порциями."""
+        import app.handlers as handlers_module
+
+        monkeypatch.setattr(handlers_module, "EXPORT_CHUNK_SIZE", 2)
+
+        ids = []
+        for i in range(5):
+            async with client.post("/tasks", json={"title": f"Задача {i}"}) as resp:
+                ids.append((await resp.json())["id"])
+
+        async with client.get("/tasks/export", params={"format": "ndjson"}) as resp:
+            assert resp.status == 200
+            assert resp.content_type == "application/x-ndjson"
+            body = await resp.text()
+
+        lines = body.splitlines()
+        assert len(lines) == 5
+        tasks = [json.loads(line) for line in lines]
+        assert [task["id"] for task in tasks] == ids
+        assert tasks[0]["title"] == "Задача 0"
+
+    async def test_export_filter_status(self, client):
+        """Тест выгрузки с фильтром по status."""
+        for status in ["pending", "completed", "pending"]:
+            async with client.post("/tasks", json={"title": "Задача", "status": status}) as resp:
+                assert resp.status == 201
+
+        async with client.get("/tasks/export", params={"status": "pending"}) as resp:
+            assert resp.status == 200
+            lines = (await resp.text()).splitlines()
+
+        assert len(lines) == 2
+        assert all(json.loads(line)["status"] == "pending" for line in lines)
+
+    async def test_export_empty(self, client):
+        """Тест выгрузки пустой таблицы."""
+        async with client.get("/tasks/export") as resp:
+            assert resp.status == 200
+            assert await resp.text() == ""
+
+    async def test_export_invalid_format(self, client):
+        """Тест валидации: неподдерживаемый формат выгрузки."""
+        async with client.get("/tasks/export", params={"format": "xml"}) as resp:
+            assert resp.status == 400
+            data = await resp.json()
+            assert "error" in data
+
+
+@pytest.mark.asyncio
+class TestTasksBulkEndpoint:
+    """Тесты для пакетных операций /tasks/bulk."""
+
+    async def test_bulk_create(self, client):
+        """Тест пакетного создания задач."""
+        payload = [
+            {"title": "Первая"},
+            {"title": "Вторая", "status": "in_progress"},
+            {"title": "Третья", "description": "Описание"},
+        ]
+        async with client.post("/tasks/bulk", json=payload) as resp:
+            assert resp.status == 201
+            data = await resp.json()
+
+        items = data["items"]
+        assert [item["code"] for item in items] == [201, 201, 201]
+        assert [item["task"]["title"] for item in items] == ["Первая", "Вторая", "Третья"]
+        assert items[0]["task"]["status"] == "pending"
+        assert items[1]["task"]["status"] == "in_progress"
+
+        for item in items:
+            async with client.get(f"/tasks/{item['id']}") as resp:
+                assert resp.status == 200
+
+    async def test_bulk_create_validation_error(self, client):
+        """Тест валидации: невалидный элемент отклоняет весь пакет."""
+        payload = [{"title": "Валидная"}, {"title": ""}]
+        async with client.post("/tasks/bulk", json=payload) as resp:
+            assert resp.status == 400
+            data = await resp.json()
+            assert "1" in data["details"]
+
+        async with client.get("/tasks") as resp:
+            assert (await resp.json())["items"] == []
+
+    async def test_bulk_create_too_large(self, client):
+        """Тест валидации: превышен максимальный размер пакета."""
+        from app.schemas import MAX_BULK_SIZE
+
+        payload = [{"title": "Задача"}] * (MAX_BULK_SIZE + 1)
+        async with client.post("/tasks/bulk", json=payload) as resp:
+            assert resp.status == 400
+
+    async def test_bulk_update(self, client):
+        """Тест пакетного обновления с несуществующим id."""
+        async with client.post("/tasks/bulk", json=[{"title": "А"}, {"title": "Б"}]) as resp:
+            ids = [item["id"] for item in (await resp.json())["items"]]
+
+        payload = [
+            {"id": ids[0], "status": "completed"},
+            {"id": 99999, "status": "completed"},
+            {"id": ids[1], "title": "Б2"},
+        ]
+        async with client.patch("/tasks/bulk", json=payload) as resp:
+            assert resp.status == 200
+            items = (await resp.json())["items"]
+
+        assert [item["code"] for item in items] == [200, 404, 200]
+        assert items[0]["task"]["status"] == "completed"
+        assert items[0]["task"]["title"] == "А"
+        assert items[2]["task"]["title"] == "Б2"
+        assert items[2]["task"]["status"] == "pending"
+
+    async def test_bulk_delete(self, client):
+        """Тест пакетного удаления с несуществующим id."""
+        async with client.post("/tasks/bulk", json=[{"title": "А"}, {"title": "Б"}]) as resp:
+            ids = [item["id"] for item in (await resp.json())["items"]]
+
+        async with client.delete("/tasks/bulk", json={"ids": [ids[0], 99999, ids[1]]}) as resp:
+            assert resp.status == 200
+            items = (await resp.json())["items"]
+
+        assert [item["code"] for item in items] == [200, 404, 200]
+        for task_id in ids:
+            async with client.get(f"/tasks/{task_id}") as resp:
+                assert resp.status == 404
+
+    async def test_bulk_delete_validation_error(self, client):
+        """Тест валидации: пустой список id."""
+        async with client.delete("/tasks/bulk", json={"ids": []}) as resp:
+            assert resp.status == 400
+            data = await resp.json()
+            assert "error" in data
+
+
+@pytest.mark.asyncio
+class TestTaskCacheEndpoint:
+    """Тесты для кэша GET /tasks/{id}."""
+
+    @pytest.fixture
+    def cache(self, test_db):
+        """Включает кэш задач на тестовой БД."""
+        from app.cache import TaskCache
+
+        test_db.task_cache = TaskCache(maxsize=100)
+        yield test_db.task_cache
+        test_db.task_cache = None
+
+    async def test_get_served_from_cache(self, client, cache):
+        """Тест: повторный GET отдается из кэша с тем же телом."""
+        async with client.post("/tasks", json={"title": "Кэшируемая"}) as resp:
+            task_id = (await resp.json())["id"]
+
+        async with client.get(f"/tasks/{task_id}") as resp:
+            first = await resp.read()
+            assert resp.content_type == "application/json"
+        async with client.get(f"/tasks/{task_id}") as resp:
+            second = await resp.read()
+
+        assert first == second
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    async def test_update_invalidates(self, client, cache):
+        """Тест: PUT сбрасывает кэш, следующий GET видит новые данные."""
+        async with client.post("/tasks", json={"title": "Исходная"}) as resp:
+            task_id = (await resp.json())["id"]
+        async with client.get(f"/tasks/{task_id}") as resp:
+            assert (await resp.json())["status"] == "pending"
+
+        async with client.put(f"/tasks/{task_id}", json={"status": "completed"}) as resp:
+            assert resp.status == 200
+        async with client.get(f"/tasks/{task_id}") as resp:
+            assert (await resp.json())["status"] == "completed"
+
+    async def test_delete_invalidates(self, client, cache):
+        """Тест: DELETE сбрасывает кэш, следующий GET возвращает 404."""
+        async with client.post("/tasks", json={"title": "Удаляемая"}) as resp:
+            task_id = (await resp.json())["id"]
+        async with client.get(f"/tasks/{task_id}") as resp:
+            assert resp.status == 200
+
+        async with client.delete(f"/tasks/{task_id}") as resp:
+            assert resp.status == 200
+        async with client.get(f"/tasks/{task_id}") as resp:
+            assert resp.status == 404
+
+    async def test_bulk_update_invalidates(self, client, cache):
+        """Тест: пакетное обновление сбрасывает кэш затронутых задач."""
+        async with client.post("/tasks", json={"title": "Пакетная"}) as resp:
+            task_id = (await resp.json())["id"]
+        async with client.get(f"/tasks/{task_id}") as resp:
+            assert resp.status == 200
+
+        async with client.patch("/tasks/bulk", json=[{"id": task_id, "title": "Новая"}]) as resp:
+            assert resp.status == 200
+        async with client.get(f"/tasks/{task_id}") as resp:
+            assert (await resp.json())["title"] == "Новая"
+
+
+@pytest.mark.asyncio
+class TestSingleFlightEndpoint:
+    """Тесты для объединения одновременных GET /tasks/{id}."""
+
+    @pytest.fixture
+    def db_queries(self, test_db, monkeypatch):
+        """Считает вызовы Database.get_task и замедляет их, чтобы запросы пересеклись."""
+        queries = []
+        get_task = test_db.get_task
+
+        async def slow_get_task(task_id):
+            queries.append(task_id)
+            await asyncio.sleep(0.05)
+            return await get_task(task_id)
+
+        monkeypatch.setattr(test_db, "get_task", slow_get_task)
+        return queries
+
+    async def _get(self, client, task_id):
+        async with client.get(f"/tasks/{task_id}") as resp:
+            return resp.status, resp.headers.get("ETag"), await resp.read()
+
+    async def test_concurrent_gets_share_one_query(self, client, test_db, db_queries):
+        """Тест: одновременные GET одной задачи выполняют один запрос к БД."""
+        async with client.post("/tasks", json={"title": "Горячая"}) as resp:
+            task_id = (await resp.json())["id"]
+
+        responses = await asyncio.gather(*(self._get(client, task_id) for _ in range(20)))
+
+        assert db_queries == [task_id]
+        assert len(set(responses)) == 1
+        assert responses[0][0] == 200
+        assert test_db.task_loads.stats()["shared"] == 19
+
+    async def test_not_found_shared(self, client, db_queries):
+        """Тест: одновременные GET несуществующей задачи тоже объединяются."""
+        responses = await asyncio.gather(*(self._get(client, 99999) for _ in range(5)))
+
+        assert db_queries == [99999]
+        assert {status for status, _, _ in responses} == {404}
+
+    async def test_write_starts_new_load(self, client, test_db, db_queries):
+        """Тест: GET после PUT не получает значение загрузки, начатой до записи."""
+        async with client.post("/tasks", json={"title": "Исходная"}) as resp:
+            task_id = (await resp.json())["id"]
+
+        before = asyncio.ensure_future(self._get(client, task_id))
+        while not db_queries:
+            await asyncio.sleep(0.001)
+        async with client.put(f"/tasks/{task_id}", json={"title": "Новая"}) as resp:
+            assert resp.status == 200
+        _, _, body = await self._get(client, task_id)
+        await before
+
+        assert json.loads(body)["title"] == "Новая"
+        assert db_queries == [task_id, task_id]
+
+
+@pytest.mark.asyncio
+class TestConditionalRequests:
+    """Тесты для ETag, If-None-Match и If-Match."""
+
+    async def _create(self, client, title="Задача"):
+        async with client.post("/tasks", json={"title": title}) as resp:
+            assert resp.status == 201
+            assert resp.headers["ETag"]
+            return (await resp.json())["id"], resp.headers["ETag"]
+
+    async def test_get_returns_etag(self, client):
+        """Тест: GET возвращает тот же ETag, что и создание."""
+        task_id, etag = await self._create(client)
+        async with client.get(f"/tasks/{task_id}") as resp:
+            assert resp.status == 200
+            assert resp.headers["ETag"] == etag
+
+    async def test_if_none_match_not_modified(self, client):
+        """Тест: совпавший If-None-Match дает 304 без тела."""
+        task_id, etag = await self._create(client)
+        async with client.get(f"/tasks/{task_id}", headers={"If-None-Match": etag}) as resp:
+            assert resp.status == 304
+            assert resp.headers["ETag"] == etag
+            assert await resp.read() == b""
+
+    async def test_etag_changes_after_update(self, client):
+        """Тест: после обновления старый ETag больше не совпадает."""
+        task_id, etag = await self._create(client)
+        async with client.put(f"/tasks/{task_id}", json={"status": "completed"}) as resp:
+            new_etag = resp.headers["ETag"]
+        assert new_etag != etag
+
+        async with client.get(f"/tasks/{task_id}", headers={"If-None-Match": etag}) as resp:
+            assert resp.status == 200
+            assert resp.headers["ETag"] == new_etag
+
+    async def test_if_match_update(self, client):
+        """Тест: PUT с актуальным If-Match проходит, с устаревшим - 412."""
+        task_id, etag = await self._create(client)
+
+        async with client.put(
+            f"/tasks/{task_id}", json={"title": "Первая правка"}, headers={"If-Match": etag}
+        ) as resp:
+            assert resp.status == 200
+
+        async with client.put(
+            f"/tasks/{task_id}", json={"title": "Вторая правка"}, headers={"If-Match": etag}
+        ) as resp:
+            assert resp.status == 412
+            assert "error" in await resp.json()
+
+        async with client.get(f"/tasks/{task_id}") as resp:
+            assert (await resp.json())["title"] == "Первая правка"
+
+    async def test_if_match_delete(self, client):
+        """Тест: DELETE с устаревшим If-Match - 412, с актуальным - удаление."""
+        task_id, etag = await self._create(client)
+        async with client.put(f"/tasks/{task_id}", json={"status": "completed"}) as resp:
+            new_etag = resp.headers["ETag"]
+
+        async with client.delete(f"/tasks/{task_id}", headers={"If-Match": etag}) as resp:
+            assert resp.status == 412
+        async with client.delete(f"/tasks/{task_id}", headers={"If-Match": new_etag}) as resp:
+            assert resp.status == 200
+
+    async def test_if_match_not_found(self, client):
+        """Тест: If-Match для несуществующей задачи - 404."""
+        async with client.delete("/tasks/99999", headers={"If-Match": '"99999-1"'}) as resp:
+            assert resp.status == 404
+
+    async def test_if_match_weak_etag_rejected(self, client):
+        """Тест: слабый ETag в If-Match не совпадает (строгое сравнение)."""
+        task_id, etag = await self._create(client)
+        async with client.delete(f"/tasks/{task_id}", headers={"If-Match": f"W/{etag}"}) as resp:
+            assert resp.status == 412
+
+    async def test_if_match_duplicates_collapsed(self, client):
+        """Тест: повторяющиеся ETag учитываются один раз и не упираются в предел."""
+        task_id, etag = await self._create(client)
+        headers = {"If-Match": ", ".join([etag] * (MAX_EXPECTED_VERSIONS + 10))}
+
+        async with client.put(
+            f"/tasks/{task_id}", json={"title": "Правка"}, headers=headers
+        ) as resp:
+            assert resp.status == 200
+
+    async def test_if_match_too_many_etags(self, client):
+        """Тест: If-Match с числом разных ETag больше предела - 400, а не 500."""
+        task_id, _ = await self._create(client)
+        tags = ", ".join(f'"{task_id}-{version}"' for version in range(100))
+
+        for method in (client.put, client.delete):
+            async with method(
+                f"/tasks/{task_id}", json={"title": "Правка"}, headers={"If-Match": tags}
+            ) as resp:
+                assert resp.status == 400
+                assert "error" in await resp.json()
+
+        async with client.get(f"/tasks/{task_id}") as resp:
+            assert (await resp.json())["title"] == "Задача"
+
+
+@pytest.mark.asyncio
+class TestRequestValidation:
+    """Тесты для единого разбора и валидации тела запроса."""
+
+    async def test_create_invalid_json(self, client):
+        """Тест: невалидный JSON в теле POST - 400."""
+        async with client.post(
+            "/tasks", data="{not json", headers={"Content-Type": "application/json"}
+        ) as resp:
+            assert resp.status == 400
+            data = await resp.json()
+            assert "error" in data
+
+    async def test_update_invalid_json(self, client):
+        """Тест: невалидный JSON в теле PUT - 400."""
+        async with client.put(
+            "/tasks/1", data="{not json", headers={"Content-Type": "application/json"}
+        ) as resp:
+            assert resp.status == 400
+            data = await resp.json()
+            assert "error" in data
+
+    async def test_validation_error_format(self, client):
+        """Тест: ошибки валидации в прежнем формате error/details."""
+        async with client.post("/tasks", json={"title": "", "status": "unknown"}) as resp:
+            assert resp.status == 400
+            data = await resp.json()
+            assert data["error"] == "Validation failed"
+            assert set(data["details"]) == {"title", "status"}
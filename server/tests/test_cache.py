@@ -0,0 +1,157 @@
+"""Тесты для кэша сериализованных задач и single-flight загрузок."""
+
+import asyncio
+
+import pytest
+from app.cache import SingleFlight, TaskCache
+
+
+@pytest.mark.asyncio
+class TestTaskCache:
+    """Тесты для TaskCache."""
+
+    async def test_hit_and_miss(self):
+        """Тест: повторное чтение берется из кэша, loader вызывается один раз."""
+        cache = TaskCache(maxsize=10)
+        calls = []
+
+        async def load():
+            calls.append(1)
+            return b"{}"
+
+        assert await cache.get_or_load(1, load) == b"{}"
+        assert await cache.get_or_load(1, load) == b"{}"
+        assert len(calls) == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    async def test_none_not_cached(self):
+        """Тест: отсутствие значения не кэшируется."""
+        cache = TaskCache(maxsize=10)
+
+        async def load():
+            return None
+
+        assert await cache.get_or_load(1, load) is None
+        assert cache.stats()["size"] == 0
+
+    async def test_lru_eviction(self):
+        """Тест: при переполнении вытесняется давно не использованная запись."""
+        cache = TaskCache(maxsize=2)
+        for key in (1, 2):
+            await cache.get_or_load(key, lambda key=key: asyncio.sleep(0, f"{key}".encode()))
+        assert cache.get(1) == b"1"  # 1 становится самой свежей
+        await cache.get_or_load(3, lambda: asyncio.sleep(0, b"3"))
+
+        assert cache.get(2) is None
+        assert cache.get(1) == b"1"
+        assert cache.stats()["evictions"] == 1
+
+    async def test_ttl_expiry(self):
+        """Тест: запись с истекшим TTL считается промахом."""
+        cache = TaskCache(maxsize=10, ttl=0)
+        await cache.get_or_load(1, lambda: asyncio.sleep(0, b"1"))
+        assert cache.get(1) is None
+
+    async def test_invalidate_during_load(self):
+        """Тест: загрузка, начатая до инвалидации, не сохраняет устаревшее значение."""
+        cache = TaskCache(maxsize=10)
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_load():
+            started.set()
+            await release.wait()
+            return b"old"
+
+        load = asyncio.ensure_future(cache.get_or_load(1, slow_load))
+        await started.wait()
+        cache.invalidate(1)
+        release.set()
+
+        assert await load == b"old"
+        assert cache.get(1) is None
+
+
+@pytest.mark.asyncio
+class TestSingleFlight:
+    """Тесты для SingleFlight."""
+
+    async def test_concurrent_calls_share_load(self):
+        """Тест: одновременные вызовы одного ключа выполняют loader один раз."""
+        flight = SingleFlight()
+        release = asyncio.Event()
+        calls = []
+
+        async def load():
+            calls.append(1)
+            await release.wait()
+            return b"{}"
+
+        waiters = [asyncio.ensure_future(flight.do(1, load)) for _ in range(10)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*waiters) == [b"{}"] * 10
+        assert len(calls) == 1
+        assert flight.stats() == {"loads": 1, "shared": 9, "in_flight": 0}
+
+    async def test_sequential_calls_load_again(self):
+        """Тест: завершенная загрузка не кэшируется, следующий вызов загружает заново."""
+        flight = SingleFlight()
+
+        await flight.do(1, lambda: asyncio.sleep(0, b"1"))
+        await flight.do(1, lambda: asyncio.sleep(0, b"1"))
+
+        assert flight.stats()["loads"] == 2
+
+    async def test_error_shared(self):
+        """Тест: исключение загрузки получают все ожидающие."""
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def load():
+            await release.wait()
+            raise RuntimeError("db down")
+
+        waiters = [asyncio.ensure_future(flight.do(1, load)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    async def test_cancelled_waiter_does_not_cancel_load(self):
+        """Тест: отмена первого вызывающего не отменяет загрузку для остальных."""
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def load():
+            await release.wait()
+            return b"{}"
+
+        first = asyncio.ensure_future(flight.do(1, load))
+        second = asyncio.ensure_future(flight.do(1, load))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == b"{}"
+        assert first.cancelled()
+
+    async def test_forget_starts_new_load(self):
+        """Тест: после forget новый вызов не присоединяется к начатой загрузке."""
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def old_load():
+            await release.wait()
+            return b"old"
+
+        old = asyncio.ensure_future(flight.do(1, old_load))
+        await asyncio.sleep(0)
+        flight.forget(1)
+
+        assert await flight.do(1, lambda: asyncio.sleep(0, b"new")) == b"new"
+        release.set()
+        assert await old == b"old"
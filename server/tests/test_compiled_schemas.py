@@ -0,0 +1,168 @@
+"""Тесты совпадения скомпилированных схем с marshmallow."""
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+from app.compiled_schemas import compile_app_schemas, compile_schema
+from app.middlewares import COMPILED_SCHEMAS_KEY
+from app.schemas import (
+    MAX_BULK_SIZE,
+    TaskBulkUpdateSchema,
+    TaskCreateSchema,
+    TaskListQuerySchema,
+    TaskSchema,
+    TaskUpdateSchema,
+)
+from marshmallow import ValidationError
+
+LOAD_CASES = [
+    {"title": "Задача"},
+    {"title": "Задача", "description": "Описание", "status": "in_progress"},
+    {"title": "Задача", "description": None},
+    {"title": "Задача", "status": None},
+    {"title": None},
+    {"title": ""},
+    {"title": "x" * 200},
+    {"title": "x" * 201},
+    {"title": b"bytes"},
+    {"title": b"\xff"},
+    {"title": 123},
+    {"title": ["list"]},
+    {"description": "x" * 1001},
+    {"status": "unknown"},
+    {"status": ["pending"]},
+    {"title": "Задача", "id": 1},
+    {"title": "Задача", "extra": True, "other": None},
+    {"id": "abc", "title": "Задача"},
+    {"id": True, "status": "completed"},
+    {"id": 1.5},
+    {"id": "7"},
+    {},
+    [],
+    "string",
+    None,
+]
+
+DUMP_CASES = [
+    {
+        "id": 1,
+        "title": "Задача",
+        "description": None,
+        "status": "pending",
+        "created_at": "2026-01-01T00:00:00",
+        "version": 3,
+    },
+    {"id": "2", "title": 5, "status": "completed", "created_at": "2026-01-01"},
+    {"title": "Без id"},
+    {},
+]
+
+SCHEMAS = [TaskSchema, TaskCreateSchema, TaskUpdateSchema, TaskBulkUpdateSchema]
+
+
+def marshmallow_load(schema, data, **kwargs):
+    try:
+        return "ok", schema.load(data, **kwargs)
+    except ValidationError as e:
+        return "error", e.messages
+
+
+class TestCompiledSchemaParity:
+    """Тесты совпадения результатов и ошибок с marshmallow."""
+
+    @pytest.mark.parametrize("schema_class", SCHEMAS)
+    @pytest.mark.parametrize("data", LOAD_CASES)
+    def test_load(self, schema_class, data):
+        """Тест: load дает те же данные (в том же порядке ключей) и те же ошибки."""
+        schema = schema_class()
+        expected = marshmallow_load(schema, data)
+        actual = marshmallow_load(compile_schema(schema), data)
+        assert actual == expected
+        if expected[0] == "ok":
+            assert list(actual[1]) == list(expected[1])
+
+    @pytest.mark.parametrize("schema_class", [TaskCreateSchema, TaskBulkUpdateSchema])
+    def test_load_many(self, schema_class):
+        """Тест: load с many=True индексирует ошибки так же, как marshmallow."""
+        schema = schema_class(many=True)
+        compiled = compile_schema(schema)
+        for data in ([], LOAD_CASES, [{"id": 1, "title": "ok"}], {"title": "dict"}, "x"):
+            assert marshmallow_load(compiled, data) == marshmallow_load(schema, data)
+
+    def test_bulk_limit(self):
+        """Тест: ограничение размера пакета совпадает с BulkLimitMixin."""
+        schema = TaskCreateSchema(many=True)
+        data = [{"title": "x"}] * (MAX_BULK_SIZE + 1)
+        expected = marshmallow_load(schema, data)
+        assert expected[0] == "error"
+        assert marshmallow_load(compile_schema(schema), data) == expected
+
+    @pytest.mark.parametrize("schema_class", SCHEMAS)
+    @pytest.mark.parametrize("obj", DUMP_CASES)
+    def test_dump(self, schema_class, obj):
+        """Тест: dump дает тот же словарь с тем же порядком ключей."""
+        schema = schema_class()
+        expected = schema.dump(obj)
+        actual = compile_schema(schema).dump(obj)
+        assert actual == expected
+        assert list(actual) == list(expected)
+
+    def test_dump_object(self):
+        """Тест: объекты сериализуются по атрибутам, как в marshmallow."""
+
+        class Row:
+            id = 1
+            title = "Задача"
+            status = "pending"
+            created_at = "2026-01-01T00:00:00"
+
+        schema = TaskSchema()
+        assert compile_schema(schema).dump(Row()) == schema.dump(Row())
+
+    def test_dump_many(self):
+        """Тест: dump с many=True сериализует список."""
+        schema = TaskSchema(many=True)
+        assert compile_schema(schema).dump(DUMP_CASES) == schema.dump(DUMP_CASES)
+
+    def test_unsupported_schema(self):
+        """Тест: схема с неподдерживаемыми полями не компилируется."""
+        with pytest.raises(TypeError):
+            compile_schema(TaskListQuerySchema())
+
+
+@pytest.mark.asyncio
+class TestCompiledSchemasEndpoints:
+    """Тесты API со скомпилированными схемами запросов."""
+
+    @pytest.fixture
+    async def compiled_client(self, app):
+        app[COMPILED_SCHEMAS_KEY] = compile_app_schemas(app)
+        async with TestClient(TestServer(app)) as test_client:
+            yield test_client
+
+    async def test_request_schemas_compiled(self, app):
+        """Тест: компилируются схемы тел запросов, а query-схемы с датами пропускаются."""
+        compiled = compile_app_schemas(app)
+        compiled_types = {type(schema) for schema in compiled}
+        assert {TaskCreateSchema, TaskUpdateSchema, TaskBulkUpdateSchema} <= compiled_types
+        assert TaskListQuerySchema not in compiled_types
+
+    async def test_create_and_validation(self, compiled_client):
+        """Тест: создание и ошибки валидации через скомпилированные схемы."""
+        response = await compiled_client.post("/tasks", json={"title": "Задача"})
+        assert response.status == 201
+        assert (await response.json())["status"] == "pending"
+
+        response = await compiled_client.post("/tasks", json={"title": "", "extra": 1})
+        assert response.status == 400
+        details = (await response.json())["details"]
+        assert details == {
+            "title": ["Length must be between 1 and 200."],
+            "extra": ["Unknown field."],
+        }
+
+    async def test_bulk_validation(self, compiled_client):
+        """Тест: ошибки пакетного запроса индексируются по элементам."""
+        response = await compiled_client.post("/tasks/bulk", json=[{"title": "ok"}, {}])
+        assert response.status == 400
+        details = (await response.json())["details"]
+        assert details == {"1": {"title": ["Missing data for required field."]}}
@@ -0,0 +1,391 @@
+"""Тесты для слоя работы с БД."""
+
+import asyncio
+import dataclasses
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import pytest
+from app.database import MAX_EXPECTED_VERSIONS, MIGRATIONS, Database, TooManyVersionsError
+from app.models import Task
+from app.schemas import TaskSchema
+
+
+async def assert_uses_index(db, query, params=()):
+    """Проверяет через EXPLAIN QUERY PLAN, что запрос не делает полный просмотр tasks."""
+    plan = await db.explain_query_plan(query, params)
+    full_scans = [detail for detail in plan if detail == "SCAN tasks"]
+    assert not full_scans, f"Полный просмотр таблицы: {query} -> {plan}"
+    assert not any("TEMP B-TREE" in detail for detail in plan), f"Сортировка: {query} -> {plan}"
+
+
+@pytest.fixture
+async def pooled_db():
+    """Создает тестовую БД с пулом read-only соединений."""
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
+        db_path = tmp.name
+
+    db = Database(db_path=db_path, read_pool_size=3)
+    await db.connect()
+
+    yield db
+
+    await db.close()
+    Path(db_path).unlink(missing_ok=True)
+
+
+@pytest.mark.asyncio
+class TestReadPool:
+    """Тесты для пула соединений на чтение."""
+
+    async def test_reads_see_committed_writes(self, pooled_db):
+        """Тест: чтение через пул видит только что записанные данные."""
+        task = await pooled_db.create_task("Задача")
+        assert task.title == "Задача"
+
+        await pooled_db.update_task(task.id, status="completed")
+        fetched = await pooled_db.get_task(task.id)
+        assert fetched.status == "completed"
+
+        tasks, _ = await pooled_db.list_tasks()
+        assert [t.id for t in tasks] == [task.id]
+
+    async def test_readers_are_read_only(self, pooled_db):
+        """Тест: соединения пула не допускают запись."""
+        async with pooled_db._reader() as reader:
+            assert reader is not pooled_db._connection
+            with pytest.raises(sqlite3.OperationalError):
+                await reader.execute("DELETE FROM tasks")
+
+    async def test_concurrent_reads_use_separate_connections(self, pooled_db):
+        """Тест: параллельные чтения получают разные соединения пула."""
+        used = []
+
+        async def read():
+            async with pooled_db._reader() as reader:
+                used.append(reader)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(read(), read(), read())
+        assert len({id(reader) for reader in used}) == 3
+
+    async def test_no_pool_uses_writer(self, test_db):
+        """Тест: без пула чтения идут через основное соединение."""
+        async with test_db._reader() as reader:
+            assert reader is test_db._connection
+
+
+@pytest.mark.asyncio
+class TestDurabilityProfiles:
+    """Тесты для профилей PRAGMA."""
+
+    async def _pragma(self, connection, name):
+        async with connection.execute(f"PRAGMA {name}") as cursor:
+            return (await cursor.fetchone())[0]
+
+    @pytest.mark.parametrize(
+        "profile, journal_mode, synchronous",
+        [("safe", "delete", 2), ("balanced", "wal", 1), ("fast", "wal", 0)],
+    )
+    async def test_profile_pragmas(self, tmp_path, profile, journal_mode, synchronous):
+        """Тест: профиль задает journal_mode и synchronous."""
+        db = Database(db_path=str(tmp_path / "tasks.db"), read_pool_size=1, profile=profile)
+        await db.connect()
+        try:
+            assert await self._pragma(db._connection, "journal_mode") == journal_mode
+            assert await self._pragma(db._connection, "synchronous") == synchronous
+            assert await self._pragma(db._connection, "busy_timeout") == 5000
+            async with db._reader() as reader:
+                assert await self._pragma(reader, "journal_mode") == journal_mode
+
+            task = await db.create_task("Задача")
+            assert (await db.get_task(task.id)).title == "Задача"
+        finally:
+            await db.close()
+
+    async def test_unknown_profile(self):
+        """Тест: неизвестный профиль отклоняется."""
+        with pytest.raises(ValueError):
+            Database(profile="turbo")
+
+    async def test_wal_reader_not_blocked_by_writer(self, tmp_path):
+        """Тест: в WAL-режиме чтение не блокируется открытой транзакцией записи."""
+        db = Database(db_path=str(tmp_path / "tasks.db"), read_pool_size=1, profile="balanced")
+        await db.connect()
+        try:
+            task = await db.create_task("Задача")
+            await db._connection.execute(
+                "UPDATE tasks SET title = ? WHERE id = ?", ("Изменена", task.id)
+            )
+            # Транзакция писателя не зафиксирована: читатель видит прежнее состояние
+            fetched = await asyncio.wait_for(db.get_task(task.id), timeout=1)
+            assert fetched.title == "Задача"
+            await db._connection.rollback()
+        finally:
+            await db.close()
+
+
+@pytest.mark.asyncio
+class TestGroupCommit:
+    """Тесты для group commit одиночных операций записи."""
+
+    async def _make_db(self, tmp_path, **kwargs):
+        db = Database(db_path=str(tmp_path / "tasks.db"), **kwargs)
+        await db.connect()
+        return db
+
+    async def test_concurrent_creates_share_transaction(self, tmp_path):
+        """Тест: параллельные create_task фиксируются одним пакетом."""
+        db = await self._make_db(tmp_path, batch_window=0.05, batch_max_size=100)
+        try:
+            tasks = await asyncio.gather(*(db.create_task(f"Задача {i}") for i in range(10)))
+            assert [task.title for task in tasks] == [f"Задача {i}" for i in range(10)]
+            assert len({task.id for task in tasks}) == 10
+            assert db.batch_stats.batches == 1
+            assert db.batch_stats.last_size == 10
+        finally:
+            await db.close()
+
+    async def test_max_size_flushes_early(self, tmp_path):
+        """Тест: пакет фиксируется при достижении batch_max_size, не дожидаясь окна."""
+        db = await self._make_db(tmp_path, batch_window=10, batch_max_size=4)
+        try:
+            tasks = await asyncio.wait_for(
+                asyncio.gather(*(db.create_task("Задача") for _ in range(8))), timeout=1
+            )
+            assert len(tasks) == 8
+            assert db.batch_stats.batches == 2
+            assert db.batch_stats.max_size == 4
+        finally:
+            await db.close()
+
+    async def test_failed_operation_does_not_affect_batch(self, tmp_path):
+        """Тест: ошибка одной операции не отменяет остальные операции пакета."""
+        db = await self._make_db(tmp_path, batch_window=0.05)
+        try:
+            created = await db.create_task("Задача")
+            results = await asyncio.gather(
+                db.create_task("Первая"),
+                db.create_task(None),  # нарушает NOT NULL
+                db.update_task(created.id, status="completed"),
+                db.delete_task(99999),
+                return_exceptions=True,
+            )
+            assert results[0].title == "Первая"
+            assert isinstance(results[1], sqlite3.IntegrityError)
+            assert results[2].status == "completed"
+            assert results[3] is False
+
+            tasks, _ = await db.list_tasks()
+            assert [task.title for task in tasks] == ["Задача", "Первая"]
+        finally:
+            await db.close()
+
+    async def test_close_flushes_pending(self, tmp_path):
+        """Тест: close() дожидается фиксации накопленных операций."""
+        db = await self._make_db(tmp_path, batch_window=10)
+        pending = asyncio.ensure_future(db.create_task("Задача"))
+        await asyncio.sleep(0)
+        await db.close()
+        assert (await pending).title == "Задача"
+
+
+# Горячие запросы списка: (параметры list_tasks, ожидаемый индекс в плане)
+HOT_LIST_QUERIES = [
+    ({"after_id": 100}, "PRIMARY KEY"),
+    ({"status": "pending"}, "idx_tasks_status_id"),
+    ({"after_id": 100, "status": "pending"}, "idx_tasks_status_id"),
+    ({"created_from": "2026-01-01T00:00:00"}, "idx_tasks_created_at_id"),
+    (
+        {"created_from": "2026-01-01T00:00:00", "created_to": "2026-02-01T00:00:00"},
+        "idx_tasks_created_at_id",
+    ),
+    ({"after_id": 100, "created_from": "2026-01-01T00:00:00"}, "idx_tasks_created_at_id"),
+    ({"after_id": 100, "created_to": "2026-02-01T00:00:00"}, "idx_tasks_created_at_id"),
+    (
+        {"status": "completed", "created_from": "2026-01-01T00:00:00"},
+        "idx_tasks_status_created_at_id",
+    ),
+    (
+        {"after_id": 100, "status": "completed", "created_to": "2026-02-01T00:00:00"},
+        "idx_tasks_status_created_at_id",
+    ),
+]
+
+
+@pytest.mark.asyncio
+class TestSchemaMigrations:
+    """Тесты для миграций схемы и индексов."""
+
+    async def _user_version(self, db):
+        async with db._connection.execute("PRAGMA user_version") as cursor:
+            return (await cursor.fetchone())[0]
+
+    async def test_migrations_applied(self, test_db):
+        """Тест: новая БД получает все миграции и индексы."""
+        assert await self._user_version(test_db) == len(MIGRATIONS)
+        async with test_db._connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'tasks'"
+        ) as cursor:
+            indexes = {row["name"] for row in await cursor.fetchall()}
+        assert {
+            "idx_tasks_status_id",
+            "idx_tasks_created_at_id",
+            "idx_tasks_status_created_at_id",
+        } <= indexes
+        assert "idx_tasks_created_at" not in indexes
+
+    async def test_upgrade_legacy_database(self, tmp_path):
+        """Тест: БД без индексов, созданная до миграций, обновляется с сохранением данных."""
+        db_path = tmp_path / "legacy.db"
+        connection = sqlite3.connect(db_path)
+        connection.execute(MIGRATIONS[0][0])
+        connection.execute(
+            "INSERT INTO tasks (title, status, created_at) VALUES ('Старая', 'pending', '2025')"
+        )
+        connection.commit()
+        connection.close()
+
+        db = Database(db_path=str(db_path))
+        await db.connect()
+        try:
+            assert await self._user_version(db) == len(MIGRATIONS)
+            tasks, _ = await db.list_tasks(status="pending")
+            assert [task.title for task in tasks] == ["Старая"]
+        finally:
+            await db.close()
+
+        # Повторное подключение не применяет миграции заново
+        db = Database(db_path=str(db_path))
+        await db.connect()
+        try:
+            assert await self._user_version(db) == len(MIGRATIONS)
+        finally:
+            await db.close()
+
+    async def test_created_at_keyset_pages(self, test_db):
+        """Тест: страницы с фильтром по дате проходят все задачи без пропусков и повторов."""
+        created = [(await test_db.create_task(f"Задача {i}")).id for i in range(7)]
+        created_from = (await test_db.get_task(created[0])).created_at
+
+        seen, cursor = [], None
+        while True:
+            tasks, cursor = await test_db.list_tasks(
+                after_id=cursor, limit=3, created_from=created_from
+            )
+            seen += [task.id for task in tasks]
+            if cursor is None:
+                break
+            # Удаление задачи-курсора не ломает переход к следующей странице
+            await test_db.delete_task(cursor)
+
+        assert seen == created
+
+    async def test_get_task_uses_primary_key(self, test_db):
+        """Тест: выборка по id идет по первичному ключу."""
+        await assert_uses_index(test_db, "SELECT * FROM tasks WHERE id = ?", (1,))
+
+    @pytest.mark.parametrize("filters, index", HOT_LIST_QUERIES)
+    async def test_list_queries_use_index(self, test_db, filters, index):
+        """Тест: горячие запросы списка используют индекс, а не полный просмотр."""
+        query, params = Database._list_query(limit=21, **filters)
+        await assert_uses_index(test_db, query, params)
+        plan = await test_db.explain_query_plan(query, params)
+        assert any(index in detail for detail in plan), plan
+
+
+@pytest.mark.asyncio
+class TestBulkCreate:
+    """Тесты пакетного создания задач при нескольких соединениях к одной БД."""
+
+    async def test_concurrent_insert_not_returned(self, tmp_path, monkeypatch):
+        """Тест: строка другого соединения, вставленная во время пакета, не попадает в результат."""
+        db_path = str(tmp_path / "tasks.db")
+        db, other = Database(db_path=db_path), Database(db_path=db_path)
+        await db.connect()
+        await other.connect()
+        try:
+            executemany = db._connection.executemany
+            concurrent = []
+
+            async def executemany_after_other_insert(*args, **kwargs):
+                # Другое соединение пытается вставить строку между MAX(id) и вставкой пакета
+                concurrent.append(asyncio.ensure_future(other.create_task("Чужая")))
+                await asyncio.sleep(0.05)
+                return await executemany(*args, **kwargs)
+
+            monkeypatch.setattr(db._connection, "executemany", executemany_after_other_insert)
+            tasks = await db.create_tasks([{"title": f"Пакет {i}"} for i in range(3)])
+            foreign = await concurrent[0]
+
+            assert [task.title for task in tasks] == ["Пакет 0", "Пакет 1", "Пакет 2"]
+            assert foreign.id not in {task.id for task in tasks}
+        finally:
+            await other.close()
+            await db.close()
+
+
+@pytest.mark.asyncio
+class TestTaskRecord:
+    """Тесты для записей Task, возвращаемых слоем БД."""
+
+    async def test_all_read_paths_return_task(self, test_db):
+        """Тест: чтение, запись и пакетные операции возвращают Task."""
+        created = await test_db.create_task("Задача", "Описание")
+        assert isinstance(created, Task)
+        assert (created.title, created.description, created.status, created.version) == (
+            "Задача",
+            "Описание",
+            "pending",
+            1,
+        )
+
+        updated = await test_db.update_task(created.id, status="completed")
+        assert isinstance(updated, Task)
+        assert updated.version == 2
+        assert await test_db.get_task(created.id) == updated
+
+        (bulk,) = await test_db.create_tasks([{"title": "Пакет"}])
+        tasks, _ = await test_db.list_tasks()
+        assert tasks == [updated, bulk]
+        assert await test_db.get_all_tasks() == tasks
+        assert (await test_db.update_tasks([{"id": bulk.id, "title": "Новое"}]))[0].title == "Новое"
+
+    async def test_record_is_slotted(self, test_db):
+        """Тест: Task не хранит __dict__ на каждый экземпляр."""
+        task = await test_db.create_task("Задача")
+        assert not hasattr(task, "__dict__")
+
+    async def test_serialized_like_dict(self, test_db):
+        """Тест: TaskSchema сериализует Task так же, как словарь с теми же полями."""
+        task = await test_db.create_task("Задача")
+        schema = TaskSchema()
+        assert schema.dump(task) == schema.dump(dataclasses.asdict(task))
+
+
+@pytest.mark.asyncio
+class TestExpectedVersions:
+    """Тесты условной записи по списку допустимых версий."""
+
+    async def test_duplicates_collapsed(self, test_db):
+        """Тест: повторы версий не меняют текст запроса и не расходуют предел."""
+        task = await test_db.create_task("Задача")
+        versions = [task.version] * (MAX_EXPECTED_VERSIONS * 2)
+
+        updated = await test_db.update_task(task.id, title="Правка", expected_versions=versions)
+
+        assert updated.version == task.version + 1
+        assert await test_db.delete_task(task.id, expected_versions=[updated.version] * 50)
+
+    async def test_too_many_versions(self, test_db):
+        """Тест: больше MAX_EXPECTED_VERSIONS разных версий - ошибка до запроса к БД."""
+        task = await test_db.create_task("Задача")
+        versions = range(1, MAX_EXPECTED_VERSIONS + 2)
+
+        with pytest.raises(TooManyVersionsError):
+            await test_db.update_task(task.id, title="Правка", expected_versions=versions)
+        with pytest.raises(TooManyVersionsError):
+            await test_db.delete_task(task.id, expected_versions=versions)
+
+        assert (await test_db.get_task(task.id)).title == "Задача"
@@ -0,0 +1,62 @@
+"""Тесты экспорта OpenAPI спецификации (export_openapi.py)."""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# export_openapi.py лежит в корне проекта
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+import export_openapi  # noqa: E402
+
+
+@pytest.mark.asyncio
+class TestOfflineExport:
+    """Тесты построения спецификации без запущенного сервера."""
+
+    async def test_matches_served_spec(self, spec_client):
+        """Тест: офлайн-спецификация совпадает с той, что отдает /swagger.json."""
+        served = await (await spec_client.get("/swagger.json")).json()
+
+        assert await export_openapi.build_spec_offline() == served
+
+    async def test_save_unchanged(self, tmp_path, monkeypatch):
+        """Тест: повторное сохранение той же спецификации не перезаписывает файлы."""
+        monkeypatch.chdir(tmp_path)
+        spec = await export_openapi.build_spec_offline()
+
+        assert export_openapi.save_spec(spec)
+        assert not export_openapi.save_spec(spec)
+        assert (tmp_path / export_openapi.OUTPUT_JSON_FILE).exists()
+
+
+class TestWriteIfChanged:
+    """Тесты записи файла только при изменении содержимого."""
+
+    def test_same_content_keeps_mtime(self, tmp_path):
+        """Тест: файл с тем же содержимым не перезаписывается, mtime не меняется."""
+        path = tmp_path / "openapi.json"
+        path.write_bytes(b'{"openapi": "3.0.2"}')
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+        assert not export_openapi.write_if_changed(path, b'{"openapi": "3.0.2"}')
+        assert path.stat().st_mtime_ns == 1_000_000_000
+
+    def test_changed_content_written(self, tmp_path):
+        """Тест: измененное содержимое записывается."""
+        path = tmp_path / "openapi.json"
+        path.write_bytes(b"{}")
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+        assert export_openapi.write_if_changed(path, b'{"openapi": "3.0.2"}')
+        assert path.read_bytes() == b'{"openapi": "3.0.2"}'
+        assert path.stat().st_mtime_ns != 1_000_000_000
+
+    def test_missing_file_written(self, tmp_path):
+        """Тест: отсутствующий файл создается."""
+        path = tmp_path / "openapi.yaml"
+
+        assert export_openapi.write_if_changed(path, b"openapi: 3.0.2\n")
+        assert path.read_bytes() == b"openapi: 3.0.2\n"
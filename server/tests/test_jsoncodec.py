@@ -0,0 +1,91 @@
+"""Тесты для подключаемого JSON-кодека."""
+
+import importlib.util
+
+import pytest
+from app import jsoncodec
+from app.jsoncodec import BACKENDS, get_codec
+
+INSTALLED_BACKENDS = [
+    name for name in BACKENDS if name == "json" or importlib.util.find_spec(name) is not None
+]
+
+SAMPLE = {
+    "id": 1,
+    "title": 'Задача / "кавычки"',
+    "description": None,
+    "status": "pending",
+    "tags": ["a", "b"],
+    "ratio": 0.5,
+    "done": False,
+}
+
+
+class TestJsonCodec:
+    """Тесты для выбора backend-а и совместимости вывода."""
+
+    @pytest.mark.parametrize("name", INSTALLED_BACKENDS)
+    def test_roundtrip(self, name):
+        """Тест: кодирование и декодирование возвращают исходный объект."""
+        codec = get_codec(name)
+        encoded = codec.dumps(SAMPLE)
+        assert isinstance(encoded, bytes)
+        assert codec.loads(encoded) == SAMPLE
+
+    @pytest.mark.parametrize("name", INSTALLED_BACKENDS)
+    def test_same_output_as_stdlib(self, name):
+        """Тест: все backend-ы дают одинаковые байты."""
+        assert get_codec(name).dumps(SAMPLE) == get_codec("json").dumps(SAMPLE)
+
+    @pytest.mark.parametrize("name", INSTALLED_BACKENDS)
+    def test_integer_keys(self, name):
+        """Тест: целочисленные ключи (ошибки валидации many=True) кодируются строками."""
+        assert get_codec(name).loads(get_codec(name).dumps({0: ["error"]})) == {"0": ["error"]}
+
+    @pytest.mark.parametrize("name", INSTALLED_BACKENDS)
+    def test_invalid_json_raises_value_error(self, name):
+        """Тест: некорректный JSON приводит к ValueError."""
+        with pytest.raises(ValueError):
+            get_codec(name).loads(b"{invalid")
+
+    def test_auto_prefers_first_installed(self):
+        """Тест: auto выбирает первый установленный backend."""
+        assert get_codec("auto").name == INSTALLED_BACKENDS[0]
+
+    def test_unknown_backend(self):
+        """Тест: неизвестный backend отклоняется."""
+        with pytest.raises(ValueError):
+            get_codec("simplejson")
+
+
+@pytest.mark.asyncio
+class TestJsonCodecEndpoints:
+    """Тесты использования кодека в ответах API."""
+
+    async def test_response_encoded_by_codec(self, client):
+        """Тест: тело ответа совпадает с выводом текущего кодека."""
+        response = await client.post("/tasks", json={"title": "Задача"})
+        assert response.status == 201
+        assert response.content_type == "application/json"
+        assert response.charset == "utf-8"
+
+        body = await response.read()
+        assert body == jsoncodec.dumps(jsoncodec.loads(body))
+
+    async def test_validation_errors_for_many(self, client):
+        """Тест: ошибки валидации пакета с индексами элементов сериализуются."""
+        response = await client.post("/tasks/bulk", json=[{"title": "ok"}, {"status": "pending"}])
+        assert response.status == 400
+        data = await response.json()
+        assert "1" in data["details"]
+
+    async def test_swagger_json(self, spec_client):
+        """Тест: спецификация отдается через кодек приложения."""
+        response = await spec_client.get("/swagger.json")
+        assert response.status == 200
+        assert response.content_type == "application/json"
+
+        body = await response.read()
+        spec = jsoncodec.loads(body)
+        assert spec["info"]["title"] == "Tasks API"
+        assert body == jsoncodec.dumps(spec)
@@ -0,0 +1,212 @@
+"""Тесты метрик Prometheus."""
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+from app.cache import TaskCache
+from app.metrics import CONTENT_TYPE, Histogram, Metrics, metrics_middleware, setup_metrics
+
+
+@pytest.fixture
+async def metrics(app, test_db):
+    """Отдельный реестр метрик, подключенный к тестовому приложению и тестовой БД."""
+    registry = Metrics()
+    setup_metrics(app, registry)
+    test_db.metrics = registry
+    registry.register("database", test_db.stats_samples)
+    yield registry
+    test_db.metrics = None
+
+
+@pytest.fixture
+async def metrics_client(app, metrics):
+    """Клиент приложения с отдельным реестром метрик."""
+    async with TestClient(TestServer(app)) as test_client:
+        yield test_client
+
+
+def sample(text: str, name: str, **labels) -> float:
+    """Возвращает значение метрики с указанными метками из ответа /metrics."""
+    rendered = ",".join(f'{key}="{value}"' for key, value in labels.items())
+    prefix = f"{name}{{{rendered}}} " if labels else f"{name} "
+    for line in text.splitlines():
+        if line.startswith(prefix):
+            return float(line[len(prefix) :])
+    raise AssertionError(f"{prefix!r} не найдено")
+
+
+class TestHistogram:
+    """Тесты гистограммы."""
+
+    def test_cumulative_buckets(self):
+        """Тест: значение на границе попадает в ее корзину, накопленные счетчики растут."""
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+
+        assert list(histogram.cumulative()) == [("0.1", 2), ("1", 3), ("+Inf", 4)]
+        assert histogram.sum == pytest.approx(2.65)
+
+    def test_render_escapes_labels(self):
+        """Тест: кавычки и переводы строк в значении метки экранируются."""
+        registry = Metrics()
+        registry.route("GET", 'a"b\nc').observe(200, 0.01, 0, 0)
+
+        assert 'route="a\\"b\\nc"' in registry.render()
+
+
+@pytest.mark.asyncio
+class TestMetricsEndpoint:
+    """Тесты middleware и GET /metrics."""
+
+    async def test_route_canonical_form(self, metrics_client):
+        """Тест: запросы к разным задачам учитываются под /tasks/{id}."""
+        for title in ("Первая", "Вторая"):
+            response = await metrics_client.post("/tasks", json={"title": title})
+            task_id = (await response.json())["id"]
+            await metrics_client.get(f"/tasks/{task_id}")
+        await metrics_client.get("/tasks/999")
+
+        response = await metrics_client.get("/metrics")
+        text = await response.text()
+
+        assert response.headers["Content-Type"] == CONTENT_TYPE
+        route = {"method": "GET", "route": "/tasks/{id}"}
+        assert sample(text, "http_requests_total", **route, status="200") == 2
+        assert sample(text, "http_requests_total", **route, status="404") == 1
+        assert sample(text, "http_request_duration_seconds_count", **route) == 3
+        assert sample(text, "http_request_duration_seconds_bucket", **route, le="+Inf") == 3
+        assert sample(text, "http_request_errors_total", **route) == 0
+        assert "/tasks/1" not in text
+
+    async def test_sizes(self, metrics_client):
+        """Тест: учитываются размеры тела запроса и ответа."""
+        body = '{"title": "Задача"}'.encode()
+        response = await metrics_client.post(
+            "/tasks", data=body, headers={"Content-Type": "application/json"}
+        )
+        response_size = len(await response.read())
+
+        text = await (await metrics_client.get("/metrics")).text()
+
+        route = {"method": "POST", "route": "/tasks"}
+        assert sample(text, "http_request_size_bytes_sum", **route) == len(body)
+        assert sample(text, "http_response_size_bytes_sum", **route) == response_size
+
+    async def test_streamed_response_size(self, metrics_client):
+        """Тест: для потокового ответа учитываются фактически отправленные байты."""
+        await metrics_client.post("/tasks", json={"title": "Задача"})
+        response = await metrics_client.get("/tasks/export")
+        await response.read()
+
+        text = await (await metrics_client.get("/metrics")).text()
+
+        route = {"method": "GET", "route": "/tasks/export"}
+        assert sample(text, "http_response_size_bytes_sum", **route) > 0
+
+    async def test_unmatched_route(self, metrics_client):
+        """Тест: неизвестные пути не создают отдельных серий."""
+        await metrics_client.get("/no/such/path")
+
+        text = await (await metrics_client.get("/metrics")).text()
+
+        assert sample(text, "http_requests_total", method="GET", route="unmatched", status="404")
+        assert "/no/such/path" not in text
+
+    async def test_handler_exception_counted_as_error(self, metrics_client, test_db, monkeypatch):
+        """Тест: необработанное исключение учитывается как 500 и ошибка."""
+
+        async def broken(*args, **kwargs):
+            raise RuntimeError("сбой")
+
+        monkeypatch.setattr(test_db, "get_all_tasks", broken)
+        monkeypatch.setattr(test_db, "list_tasks", broken)
+        response = await metrics_client.get("/tasks")
+        assert response.status == 500
+
+        text = await (await metrics_client.get("/metrics")).text()
+
+        route = {"method": "GET", "route": "/tasks"}
+        assert sample(text, "http_requests_total", **route, status="500") == 1
+        assert sample(text, "http_request_errors_total", **route) == 1
+        assert sample(text, "http_requests_in_flight", **route) == 0
+
+    async def test_db_timers(self, metrics_client, metrics):
+        """Тест: методы Database учитываются по имени."""
+        response = await metrics_client.post("/tasks", json={"title": "Задача"})
+        task_id = (await response.json())["id"]
+        await metrics_client.get(f"/tasks/{task_id}")
+
+        text = await (await metrics_client.get("/metrics")).text()
+
+        assert sample(text, "db_query_duration_seconds_count", method="create_task") == 1
+        assert sample(text, "db_query_duration_seconds_count", method="get_task") == 1
+        assert sample(text, "db_query_errors_total", method="get_task") == 0
+
+    async def test_database_stats(self, metrics_client, test_db):
+        """Тест: счетчики кэша задач, single-flight и group commit выводятся в /metrics."""
+        test_db.task_cache = TaskCache(maxsize=1)
+        first, second = [
+            (await (await metrics_client.post("/tasks", json={"title": title})).json())["id"]
+            for title in ("Первая", "Вторая")
+        ]
+        await metrics_client.get(f"/tasks/{first}")
+        await metrics_client.get(f"/tasks/{first}")
+        await metrics_client.get(f"/tasks/{second}")
+
+        text = await (await metrics_client.get("/metrics")).text()
+
+        assert "# TYPE task_cache_hits_total counter" in text
+        assert sample(text, "task_cache_hits_total") == 1
+        assert sample(text, "task_cache_misses_total") == 2
+        assert sample(text, "task_cache_evictions_total") == 1
+        assert sample(text, "task_cache_size") == 1
+        assert sample(text, "task_loads_total") + sample(text, "task_loads_shared_total") == 2
+        assert sample(text, "task_loads_in_flight") == 0
+        assert sample(text, "db_batches_total") == 2
+        assert sample(text, "db_batch_operations_total") == 2
+        assert sample(text, "db_batch_max_size") == 1
+        assert sample(text, "db_batch_avg_size") == 1
+
+    async def test_disabled_components_not_rendered(self, metrics_client, test_db):
+        """Тест: без кэша и single-flight их метрики не выводятся."""
+        test_db.task_loads = None
+
+        text = await (await metrics_client.get("/metrics")).text()
+
+        assert "task_cache_" not in text and "task_loads_" not in text
+        assert sample(text, "db_batches_total") == 0
+
+
+@pytest.mark.asyncio
+class TestMetricsDisabled:
+    """Тесты приложения без метрик (по умолчанию)."""
+
+    async def test_endpoint_not_exposed(self, client):
+        """Тест: без TASKS_METRICS=1 маршрут /metrics и middleware не подключаются."""
+        response = await client.get("/metrics")
+
+        assert response.status == 404
+        assert metrics_middleware not in client.app.middlewares
+
+
+@pytest.mark.asyncio
+class TestDatabaseTimers:
+    """Тесты таймеров методов БД."""
+
+    async def test_failed_query_counted(self, test_db):
+        """Тест: метод, завершившийся исключением, учитывается как ошибка."""
+        registry = Metrics()
+        test_db.metrics = registry
+
+        with pytest.raises(Exception):
+            await test_db.create_task(title=None)
+
+        assert registry.queries["create_task"].count == 1
+        assert registry.query_errors["create_task"] == 1
+
+    async def test_disabled_without_registry(self, test_db):
+        """Тест: без реестра методы работают без замеров."""
+        task = await test_db.create_task(title="Задача")
+
+        assert (await test_db.get_task(task.id)).title == "Задача"
+        assert test_db.metrics is None
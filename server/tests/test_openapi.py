@@ -0,0 +1,65 @@
+"""Тесты для endpoints OpenAPI спецификации."""
+
+import gzip
+
+import pytest
+import yaml
+from app import openapi
+
+
+@pytest.mark.asyncio
+class TestSpecEndpoints:
+    """Тесты для /swagger.json и /swagger.yaml."""
+
+    @pytest.mark.parametrize("path", ["/swagger.json", "/swagger.yaml"])
+    async def test_etag_and_not_modified(self, spec_client, path):
+        """Тест: повторный запрос с If-None-Match получает 304 без тела."""
+        response = await spec_client.get(path, headers={"Accept-Encoding": "identity"})
+        assert response.status == 200
+        etag = response.headers["ETag"]
+        assert not etag.startswith("W/")
+        assert response.headers["Vary"] == "Accept-Encoding"
+
+        response = await spec_client.get(
+            path, headers={"Accept-Encoding": "identity", "If-None-Match": etag}
+        )
+        assert response.status == 304
+        assert await response.read() == b""
+        assert response.headers["ETag"] == etag
+
+    async def test_yaml_content(self, spec_client):
+        """Тест: YAML содержит ту же спецификацию, что и JSON."""
+        json_spec = await (await spec_client.get("/swagger.json")).json()
+        response = await spec_client.get("/swagger.yaml")
+        assert response.content_type == "application/x-yaml"
+        assert yaml.safe_load(await response.text()) == json_spec
+
+    async def test_gzip_variant(self, spec_client):
+        """Тест: gzip-вариант отдается заранее сжатым и имеет свой ETag."""
+        plain = await spec_client.get("/swagger.yaml", headers={"Accept-Encoding": "identity"})
+        body = await plain.read()
+
+        response = await spec_client.get(
+            "/swagger.yaml", headers={"Accept-Encoding": "gzip"}, auto_decompress=False
+        )
+        assert response.status == 200
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert gzip.decompress(await response.read()) == body
+        assert response.headers["ETag"] != plain.headers["ETag"]
+
+    async def test_gzip_refused(self, spec_client):
+        """Тест: gzip;q=0 означает отказ от сжатия."""
+        response = await spec_client.get(
+            "/swagger.json", headers={"Accept-Encoding": "gzip;q=0"}, auto_decompress=False
+        )
+        assert "Content-Encoding" not in response.headers
+
+    async def test_rendered_once(self, spec_client, monkeypatch):
+        """Тест: спецификация кодируется при старте, а не на каждый запрос."""
+
+        def fail(spec, spec_format):
+            raise AssertionError("спецификация кодируется повторно")
+
+        monkeypatch.setattr(openapi, "render_spec", fail)
+        for _ in range(3):
+            assert (await spec_client.get("/swagger.yaml")).status == 200
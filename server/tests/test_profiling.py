@@ -0,0 +1,166 @@
+"""Тесты журнала медленных запросов и профилирования запросов."""
+
+import logging
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+from app.profiling import (
+    PHASES,
+    Profiler,
+    RequestProfile,
+    SlowQueryLog,
+    current_profile,
+    params_shape,
+    setup_profiling,
+)
+
+
+def server_timing(header: str) -> dict:
+    """Разбирает Server-Timing в словарь {имя: длительность в мс}."""
+    result = {}
+    for item in header.split(","):
+        name, _, duration = item.strip().partition(";dur=")
+        result[name] = float(duration)
+    return result
+
+
+@pytest.fixture
+async def profiled_client(app):
+    """Клиент приложения, профилирующий запросы с заголовком X-Profile: 1."""
+    setup_profiling(app, Profiler(allow_header=True))
+    async with TestClient(TestServer(app)) as test_client:
+        yield test_client
+
+
+class TestParamsShape:
+    """Тесты формы параметров в журнале."""
+
+    def test_types_without_values(self):
+        """Тест: выводятся типы параметров, но не значения."""
+        assert params_shape((1, "секрет", None)) == "(int, str, NoneType)"
+
+    def test_long_homogeneous_list(self):
+        """Тест: длинный однотипный список (IN по id) сворачивается в тип и длину."""
+        assert params_shape(list(range(500))) == "(int x 500)"
+
+    def test_executemany(self):
+        """Тест: для executemany выводится число наборов и форма первого."""
+        assert params_shape([(1, "a"), (2, "b")], many=True) == "2 x (int, str)"
+
+
+@pytest.mark.asyncio
+class TestSlowQueryLog:
+    """Тесты журнала медленных SQL-запросов."""
+
+    async def test_logs_sql_and_shape(self, test_db, caplog):
+        """Тест: запрос выше порога пишется в лог с текстом SQL и формой параметров."""
+        test_db.slow_queries = SlowQueryLog(threshold=1e-9)
+
+        with caplog.at_level(logging.WARNING, logger="app.profiling"):
+            task = await test_db.create_task(title="секретный заголовок")
+            assert all("секретный" not in record.getMessage() for record in caplog.records)
+            caplog.clear()
+            await test_db.get_task(task.id)
+
+        (record,) = caplog.records
+        message = record.getMessage()
+        assert "SELECT" in message and "WHERE id = ?" in message
+        assert message.endswith("параметры (int)")
+
+    async def test_fast_queries_not_logged(self, test_db, caplog):
+        """Тест: запросы быстрее порога не пишутся."""
+        test_db.slow_queries = SlowQueryLog(threshold=60)
+
+        with caplog.at_level(logging.WARNING, logger="app.profiling"):
+            await test_db.create_tasks([{"title": "Первая"}, {"title": "Вторая"}])
+
+        assert caplog.records == []
+        assert test_db.slow_queries.slow_queries == 0
+
+    async def test_bulk_operations_logged(self, test_db, caplog):
+        """Тест: executemany пакетных операций и commit тоже замеряются."""
+        test_db.slow_queries = SlowQueryLog(threshold=1e-9)
+
+        with caplog.at_level(logging.WARNING, logger="app.profiling"):
+            await test_db.create_tasks([{"title": "Первая"}, {"title": "Вторая"}])
+
+        messages = [record.getMessage() for record in caplog.records]
+        assert any(
+            "INSERT INTO tasks" in m and "2 x (str, NoneType, str, str)" in m for m in messages
+        )
+        assert any("COMMIT" in m for m in messages)
+
+    async def test_disabled_by_default(self, test_db):
+        """Тест: без порога журнал не создается."""
+        assert test_db.slow_queries is None
+
+
+@pytest.mark.asyncio
+class TestRequestProfiling:
+    """Тесты заголовка Server-Timing."""
+
+    async def test_post_phases(self, profiled_client):
+        """Тест: для POST замеряются все фазы и общее время."""
+        response = await profiled_client.post(
+            "/tasks", json={"title": "Задача"}, headers={"X-Profile": "1"}
+        )
+
+        assert response.status == 201
+        timing = server_timing(response.headers["Server-Timing"])
+        assert list(timing) == [*PHASES, "total"]
+        assert all(timing[name] > 0 for name in PHASES)
+        assert timing["total"] >= timing["db"]
+
+    async def test_get_db_phase(self, profiled_client):
+        """Тест: время запроса к БД попадает в профиль и при single-flight загрузке."""
+        response = await profiled_client.post("/tasks", json={"title": "Задача"})
+        task_id = (await response.json())["id"]
+
+        response = await profiled_client.get(f"/tasks/{task_id}", headers={"X-Profile": "1"})
+
+        timing = server_timing(response.headers["Server-Timing"])
+        assert timing["db"] > 0
+        assert timing["serialize"] > 0
+
+    async def test_not_profiled_without_header(self, profiled_client):
+        """Тест: без заголовка запрос не профилируется."""
+        response = await profiled_client.get("/health")
+
+        assert "Server-Timing" not in response.headers
+
+    async def test_header_ignored_when_not_allowed(self, app):
+        """Тест: если заголовок не разрешен, X-Profile не включает профилирование."""
+        setup_profiling(app, Profiler(allow_header=False))
+        async with TestClient(TestServer(app)) as client:
+            response = await client.get("/health", headers={"X-Profile": "1"})
+
+        assert "Server-Timing" not in response.headers
+
+    async def test_sample_rate(self, app):
+        """Тест: при sample_rate=1 профилируется каждый запрос."""
+        setup_profiling(app, Profiler(sample_rate=1.0))
+        async with TestClient(TestServer(app)) as client:
+            response = await client.get("/tasks")
+
+        assert "validate" in server_timing(response.headers["Server-Timing"])
+
+    async def test_profile_reset_after_request(self, profiled_client):
+        """Тест: профиль не остается в контексте после запроса."""
+        await profiled_client.get("/health", headers={"X-Profile": "1"})
+
+        assert current_profile.get() is None
+
+
+class TestRequestProfile:
+    """Тесты форматирования профиля."""
+
+    def test_server_timing_format(self):
+        """Тест: длительности выводятся в миллисекундах в порядке фаз."""
+        profile = RequestProfile()
+        profile.add("db", 0.0015)
+        profile.add("db", 0.0005)
+
+        assert profile.server_timing(0.003) == (
+            "parse;dur=0.000, validate;dur=0.000, db;dur=2.000, serialize;dur=0.000, "
+            "total;dur=3.000"
+        )